@@ -0,0 +1,46 @@
+"""Money columns: FLOAT -> NUMERIC
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = (
+    ("coefficient", sa.Numeric(5, 2)),
+    ("base_salary", sa.Numeric(12, 2)),
+    ("tax_deduction", sa.Numeric(12, 2)),
+)
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("employees") as batch_op:
+        for name, type_ in _COLUMNS:
+            batch_op.alter_column(
+                name,
+                existing_type=sa.Float(),
+                type_=type_,
+                existing_nullable=True,
+                postgresql_using=f"round({name}::numeric, 2)",
+            )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("employees") as batch_op:
+        for name, type_ in _COLUMNS:
+            batch_op.alter_column(
+                name,
+                existing_type=type_,
+                type_=sa.Float(),
+                existing_nullable=True,
+                postgresql_using=f"{name}::double precision",
+            )
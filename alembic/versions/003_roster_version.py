@@ -0,0 +1,87 @@
+"""roster_version change counter maintained by triggers on employees and departments
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ("employees", "departments")
+_SQLITE_OPS = ("INSERT", "UPDATE", "DELETE")
+
+# DDL зафиксирован в ревизии (не импортируется из database.models)
+_CREATE_TRIGGERS = {
+    "postgresql": (
+        """
+        CREATE OR REPLACE FUNCTION roster_version_bump() RETURNS trigger AS $$
+        BEGIN
+            UPDATE roster_version SET version = version + 1 WHERE id = 1;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        # DROP + CREATE вместо CREATE OR REPLACE TRIGGER (только с PostgreSQL 14)
+        *(
+            statement
+            for table in _TABLES
+            for statement in (
+                f"DROP TRIGGER IF EXISTS {table}_roster_version ON {table}",
+                f"""
+                CREATE TRIGGER {table}_roster_version
+                AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                FOR EACH STATEMENT EXECUTE FUNCTION roster_version_bump()
+                """,
+            )
+        ),
+    ),
+    "sqlite": tuple(
+        f"""
+        CREATE TRIGGER IF NOT EXISTS {table}_roster_version_{name.lower()}
+        AFTER {name} ON {table}
+        BEGIN
+            UPDATE roster_version SET version = version + 1 WHERE id = 1;
+        END
+        """
+        for table in _TABLES
+        for name in _SQLITE_OPS
+    ),
+}
+
+_DROP_TRIGGERS = {
+    "postgresql": (
+        *(f"DROP TRIGGER IF EXISTS {table}_roster_version ON {table}" for table in _TABLES),
+        "DROP FUNCTION IF EXISTS roster_version_bump()",
+    ),
+    "sqlite": tuple(
+        f"DROP TRIGGER IF EXISTS {table}_roster_version_{name.lower()}"
+        for table in _TABLES
+        for name in _SQLITE_OPS
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "roster_version",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO roster_version (id, version) VALUES (1, 0)")
+    for statement in _CREATE_TRIGGERS.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DROP_TRIGGERS.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
+    op.drop_table("roster_version")
@@ -0,0 +1,51 @@
+"""payroll_results: stored payroll per employee and period
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "payroll_results",
+        sa.Column("period", sa.Date(), nullable=False),
+        sa.Column("employee_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("employee_code", sa.String(20), nullable=True),
+        sa.Column("employee_name", sa.String(200), nullable=True),
+        sa.Column("department_id", sa.Integer(), nullable=True),
+        sa.Column("department", sa.String(100), nullable=True),
+        sa.Column("base_salary", sa.Numeric(12, 2), nullable=False),
+        sa.Column("tax_deduction", sa.Numeric(12, 2), nullable=False),
+        sa.Column("ndfl", sa.Numeric(12, 2), nullable=False),
+        sa.Column("special_deduction", sa.Numeric(12, 2), nullable=False),
+        sa.Column("net_salary", sa.Numeric(12, 2), nullable=False),
+        sa.Column("calculated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("period", "employee_id"),
+    )
+    op.create_index(
+        "ix_payroll_results_period_department",
+        "payroll_results",
+        ["period", "department_id"],
+    )
+    op.create_index(
+        "ix_payroll_results_employee_period",
+        "payroll_results",
+        ["employee_id", "period"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_payroll_results_employee_period", table_name="payroll_results")
+    op.drop_index("ix_payroll_results_period_department", table_name="payroll_results")
+    op.drop_table("payroll_results")
@@ -0,0 +1,175 @@
+"""Employee indexes (department, partial on active) and trigger-maintained department_summary
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-18
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# DDL зафиксирован в ревизии (не импортируется из database.models)
+_CREATE_TRIGGERS = {
+    "postgresql": (
+        """
+        CREATE OR REPLACE FUNCTION department_summary_sync() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_active
+                    AND OLD.department_id IS NOT NULL THEN
+                UPDATE department_summary SET
+                    headcount = headcount - 1,
+                    total_base_salary = total_base_salary - COALESCE(OLD.base_salary, 0),
+                    total_tax_relief = total_tax_relief - COALESCE(OLD.tax_deduction, 0)
+                WHERE department_id = OLD.department_id;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_active
+                    AND NEW.department_id IS NOT NULL THEN
+                INSERT INTO department_summary AS s
+                    (department_id, headcount, total_base_salary, total_tax_relief)
+                VALUES (NEW.department_id, 1, COALESCE(NEW.base_salary, 0),
+                        COALESCE(NEW.tax_deduction, 0))
+                ON CONFLICT (department_id) DO UPDATE SET
+                    headcount = s.headcount + 1,
+                    total_base_salary = s.total_base_salary + EXCLUDED.total_base_salary,
+                    total_tax_relief = s.total_tax_relief + EXCLUDED.total_tax_relief;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        """
+        CREATE OR REPLACE FUNCTION department_summary_truncate() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM department_summary;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """,
+        # DROP + CREATE вместо CREATE OR REPLACE TRIGGER (только с PostgreSQL 14)
+        "DROP TRIGGER IF EXISTS employees_department_summary ON employees",
+        """
+        CREATE TRIGGER employees_department_summary
+        AFTER INSERT OR DELETE
+            OR UPDATE OF department_id, is_active, base_salary, tax_deduction
+        ON employees FOR EACH ROW EXECUTE FUNCTION department_summary_sync()
+        """,
+        "DROP TRIGGER IF EXISTS employees_department_summary_truncate ON employees",
+        """
+        CREATE TRIGGER employees_department_summary_truncate
+        AFTER TRUNCATE ON employees
+        FOR EACH STATEMENT EXECUTE FUNCTION department_summary_truncate()
+        """,
+    ),
+    "sqlite": (
+        """
+        CREATE TRIGGER IF NOT EXISTS employees_summary_insert AFTER INSERT ON employees
+        WHEN NEW.is_active AND NEW.department_id IS NOT NULL
+        BEGIN
+            INSERT INTO department_summary
+                (department_id, headcount, total_base_salary, total_tax_relief)
+            SELECT NEW.department_id, 0, 0, 0
+            WHERE NOT EXISTS (
+                SELECT 1 FROM department_summary WHERE department_id = NEW.department_id
+            );
+            UPDATE department_summary SET
+                headcount = headcount + 1,
+                total_base_salary = total_base_salary + COALESCE(NEW.base_salary, 0),
+                total_tax_relief = total_tax_relief + COALESCE(NEW.tax_deduction, 0)
+            WHERE department_id = NEW.department_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS employees_summary_delete AFTER DELETE ON employees
+        WHEN OLD.is_active AND OLD.department_id IS NOT NULL
+        BEGIN
+            UPDATE department_summary SET
+                headcount = headcount - 1,
+                total_base_salary = total_base_salary - COALESCE(OLD.base_salary, 0),
+                total_tax_relief = total_tax_relief - COALESCE(OLD.tax_deduction, 0)
+            WHERE department_id = OLD.department_id;
+        END
+        """,
+        """
+        CREATE TRIGGER IF NOT EXISTS employees_summary_update
+        AFTER UPDATE OF department_id, is_active, base_salary, tax_deduction ON employees
+        BEGIN
+            UPDATE department_summary SET
+                headcount = headcount - 1,
+                total_base_salary = total_base_salary - COALESCE(OLD.base_salary, 0),
+                total_tax_relief = total_tax_relief - COALESCE(OLD.tax_deduction, 0)
+            WHERE OLD.is_active AND department_id = OLD.department_id;
+            INSERT INTO department_summary
+                (department_id, headcount, total_base_salary, total_tax_relief)
+            SELECT NEW.department_id, 0, 0, 0
+            WHERE NEW.is_active AND NEW.department_id IS NOT NULL AND NOT EXISTS (
+                SELECT 1 FROM department_summary WHERE department_id = NEW.department_id
+            );
+            UPDATE department_summary SET
+                headcount = headcount + 1,
+                total_base_salary = total_base_salary + COALESCE(NEW.base_salary, 0),
+                total_tax_relief = total_tax_relief + COALESCE(NEW.tax_deduction, 0)
+            WHERE NEW.is_active AND department_id = NEW.department_id;
+        END
+        """,
+    ),
+}
+_DROP_TRIGGERS = {
+    "postgresql": (
+        "DROP TRIGGER IF EXISTS employees_department_summary_truncate ON employees",
+        "DROP TRIGGER IF EXISTS employees_department_summary ON employees",
+        "DROP FUNCTION IF EXISTS department_summary_truncate()",
+        "DROP FUNCTION IF EXISTS department_summary_sync()",
+    ),
+    "sqlite": (
+        "DROP TRIGGER IF EXISTS employees_summary_update",
+        "DROP TRIGGER IF EXISTS employees_summary_delete",
+        "DROP TRIGGER IF EXISTS employees_summary_insert",
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_index("ix_employees_department_id", "employees", ["department_id"])
+    op.create_index(
+        "ix_employees_active_department",
+        "employees",
+        ["department_id", "id"],
+        postgresql_where=sa.text("is_active"),
+        sqlite_where=sa.text("is_active = 1"),
+    )
+    op.create_table(
+        "department_summary",
+        sa.Column("department_id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("headcount", sa.Integer(), nullable=False),
+        sa.Column("total_base_salary", sa.Numeric(14, 2), nullable=False),
+        sa.Column("total_tax_relief", sa.Numeric(14, 2), nullable=False),
+        sa.PrimaryKeyConstraint("department_id"),
+    )
+    op.execute(
+        """
+        INSERT INTO department_summary
+            (department_id, headcount, total_base_salary, total_tax_relief)
+        SELECT department_id, count(*), COALESCE(sum(base_salary), 0),
+               COALESCE(sum(tax_deduction), 0)
+        FROM employees
+        WHERE is_active AND department_id IS NOT NULL
+        GROUP BY department_id
+        """
+    )
+    for statement in _CREATE_TRIGGERS.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    for statement in _DROP_TRIGGERS.get(op.get_bind().dialect.name, ()):
+        op.execute(statement)
+    op.drop_table("department_summary")
+    op.drop_index("ix_employees_active_department", table_name="employees")
+    op.drop_index("ix_employees_department_id", table_name="employees")
@@ -0,0 +1,253 @@
+"""Async employee data access (AsyncSession + asyncpg/aiosqlite)."""
+
+__all__ = ["get_employees", "get_employee"]
+
+import asyncio
+import logging
+from typing import Any
+
+from application.db import people
+from application.db.cache import roster_cache
+from application.db.index import RosterIndex
+from application.db.people import (
+    _FALLBACK_EMPLOYEES,
+    _copy,
+    _count_fallback,
+    _db_roster_warm,
+    _late_db_result,
+    _load_db_snapshot,
+    _load_from_json,
+    _print_source,
+    _record_db_failure,
+    _select,
+)
+from application.db.queries import employee_query, roster_version_query, row_converter
+from application.db.snapshot import SnapshotRoster
+from application.metrics import inc, stage
+
+logger = logging.getLogger(__name__)
+
+# Загрузки из БД, не уложившиеся в hedge_deadline: event loop держит задачи
+# только по слабым ссылкам
+_late_tasks: set[asyncio.Task] = set()
+
+
+def _db_configured() -> bool:
+    """Настроена ли БД (есть фабрика async-сессий)."""
+    try:
+        from database.async_session import AsyncSessionLocal
+    except ImportError:
+        return False
+    return AsyncSessionLocal is not None
+
+
+def _on_db_deadline(task: asyncio.Task) -> None:
+    """
+    БД не ответила за hedge_deadline: отметить зависание в размыкателе и
+    забрать результат задачи, когда она завершится (ошибка — ещё один сбой,
+    успешный ответ снимает отметку).
+    """
+    _record_db_failure()
+    _late_tasks.add(task)
+
+    def done(t: asyncio.Task) -> None:
+        _late_tasks.discard(t)
+        if t.cancelled():
+            return
+        error = t.exception()
+        if error is not None:
+            logger.warning("Фоновая загрузка из БД завершилась ошибкой: %s", error)
+            _record_db_failure()
+        else:
+            _late_db_result(t.result())
+
+    task.add_done_callback(done)
+
+
+async def _try_load_from_db() -> RosterIndex | SnapshotRoster | None:
+    """
+    Async-вариант people._try_load_from_db(): тот же маркер БД и общий кэш,
+    запросы через AsyncSession без блокировки event loop.
+    """
+    try:
+        from database.async_session import AsyncSessionLocal
+
+        if AsyncSessionLocal is None:  # БД не настроена: SQLAlchemy не импортируется
+            return None
+
+        from database.models import Employee
+
+        if Employee is None:
+            return None
+
+        from database.health import breaker
+
+        with stage("source_probe"):
+            if not breaker.allow():
+                return None
+
+        async with AsyncSessionLocal() as db:
+            with stage("db_marker"):
+                marker = (await db.execute(roster_version_query())).scalar()
+            if marker is None:  # нет строки счётчика — без кэширования
+                marker = object()
+            cached = roster_cache.peek("db", marker)
+            if cached is not None:
+                return cached
+            snapshot = await asyncio.to_thread(_load_db_snapshot, marker)
+            if snapshot is not None:
+                roster_cache.store("db", marker, snapshot)
+                return snapshot
+            convert = row_converter("full")
+            with stage("db_query"):
+                rows = await db.execute(employee_query("full"))
+            with stage("row_conversion", source="db"):
+                index = RosterIndex((convert(row) for row in rows), compact=True)
+            inc("balansoft_rows_loaded_total", len(index), source="db")
+            roster_cache.store("db", marker, index)
+            return index
+    except ImportError as e:
+        logger.debug("БД не используется: отсутствуют зависимости (%s)", e)
+        return None
+    except Exception as e:
+        logger.warning("БД недоступна, используем другой источник: %s", e)
+        _record_db_failure()
+        return None
+
+
+async def _try_get_from_db(employee_id: int | None, employee_code: str | None) -> dict[str, Any] | None:
+    """Один активный сотрудник по первичному ключу или employee_code; None — не найден или БД недоступна."""
+    try:
+        from database.async_session import AsyncSessionLocal
+
+        if AsyncSessionLocal is None:  # БД не настроена: SQLAlchemy не импортируется
+            return None
+
+        from database.models import Employee
+
+        if Employee is None:
+            return None
+
+        from database.health import breaker
+
+        if not breaker.allow():
+            return None
+
+        if employee_id is not None:
+            stmt = employee_query("full", employee_id=employee_id)
+        else:
+            stmt = employee_query("full", employee_code=employee_code)
+
+        async with AsyncSessionLocal() as db:
+            row = (await db.execute(stmt)).first()
+            return None if row is None else row_converter("full")(row)
+    except ImportError as e:
+        logger.debug("БД не используется: отсутствуют зависимости (%s)", e)
+        return None
+    except Exception as e:
+        logger.warning("БД недоступна, используем другой источник: %s", e)
+        _record_db_failure()
+        return None
+
+
+async def get_employees(
+    use_db_if_available: bool = True,
+    department_id: int | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    hedge_deadline: float | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Async-вариант application.db.people.get_employees().
+
+    Порядок источников тот же: БД → JSON → тестовые данные. JSON читается
+    в пуле потоков (asyncio.to_thread), повторные вызовы идут из общего кэша.
+    С hedge_deadline > 0 JSON читается одновременно с запросом к БД, а БД
+    ждём не дольше hedge_deadline секунд (запрос продолжается в фоне,
+    опоздание и его итог учитываются размыкателем, как в синхронной версии).
+
+    Args:
+        use_db_if_available: использовать БД, если она доступна.
+        department_id: вернуть только сотрудников отдела.
+        offset: пропустить первых offset сотрудников.
+        limit: вернуть не больше limit сотрудников.
+        hedge_deadline: сколько ждать БД при параллельной загрузке JSON
+            (секунды); None — BALANSOFT_HEDGE_DEADLINE, 0 — по очереди.
+
+    Returns:
+        Список словарей сотрудников в едином формате из любого источника.
+    """
+    logger.info("Вызов async get_employees()")
+    if hedge_deadline is None:
+        hedge_deadline = people.HEDGE_DEADLINE
+    json_task = None
+
+    if use_db_if_available:
+        reason = None
+        if hedge_deadline > 0 and _db_configured() and not _db_roster_warm():
+            json_task = asyncio.ensure_future(asyncio.to_thread(_load_from_json))
+            db_task = asyncio.ensure_future(_try_load_from_db())
+            try:
+                from_db = await asyncio.wait_for(asyncio.shield(db_task), hedge_deadline)
+            except asyncio.TimeoutError:
+                logger.warning(
+                    "БД не ответила за %.2f с, используем другой источник", hedge_deadline
+                )
+                _on_db_deadline(db_task)
+                from_db, reason = None, "deadline"
+        else:
+            from_db = await _try_load_from_db()
+        if from_db is not None and len(from_db) > 0:
+            _print_source(0)
+            inc("balansoft_source_total", source="db")
+            logger.info("Загружено %s сотрудников из БД", len(from_db))
+            return _select(from_db, department_id, offset, limit)
+        _count_fallback("db", from_db, reason)
+
+    if json_task is None:
+        from_json = await asyncio.to_thread(_load_from_json)
+    else:
+        from_json = await json_task
+    if from_json is not None and len(from_json) > 0:
+        _print_source(1)
+        inc("balansoft_source_total", source="json")
+        logger.info("Загружено %s сотрудников из файла", len(from_json))
+        return _select(from_json, department_id, offset, limit)
+    _count_fallback("json", from_json)
+
+    _print_source(2)
+    inc("balansoft_source_total", source="fallback")
+    logger.warning("Используются тестовые данные (JSON и БД недоступны)")
+    return _select(RosterIndex(_FALLBACK_EMPLOYEES), department_id, offset, limit)
+
+
+async def get_employee(
+    employee_id: int | None = None,
+    employee_code: str | None = None,
+    use_db_if_available: bool = True,
+) -> dict[str, Any] | None:
+    """
+    Async-вариант application.db.people.get_employee().
+
+    Args:
+        employee_id: id сотрудника.
+        employee_code: табельный код (используется, если id не задан).
+        use_db_if_available: использовать БД, если она доступна.
+
+    Returns:
+        Словарь сотрудника или None, если не найден.
+    """
+    if employee_id is None and employee_code is None:
+        raise ValueError("Нужно указать employee_id или employee_code")
+
+    if use_db_if_available:
+        from_db = await _try_get_from_db(employee_id, employee_code)
+        if from_db is not None:
+            return from_db
+
+    index = await asyncio.to_thread(_load_from_json)
+    if index is None:
+        return None
+    if employee_id is not None:
+        return _copy(index.get(employee_id))
+    return _copy(index.get_by_code(employee_code))
@@ -0,0 +1,162 @@
+"""Shared in-process roster cache with source-marker invalidation."""
+
+__all__ = ["RosterCache", "roster_cache", "json_marker", "cache_info", "clear_cache"]
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from pathlib import Path
+from typing import Any
+
+# Размер LRU для поиска сотрудника по id
+DEFAULT_LRU_SIZE = int(os.getenv("BALANSOFT_CACHE_LRU_SIZE", "4096"))
+
+
+def json_marker(path: Path) -> Hashable | None:
+    """Маркер версии JSON-файла: (путь, mtime_ns, size). None — файла нет."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
+class RosterCache:
+    """
+    Кэш загруженных списков сотрудников.
+
+    Каждая запись хранится вместе с маркером источника (mtime/size файла или
+    счётчик изменений БД); если маркер изменился — запись перезагружается.
+    Отдельный ограниченный LRU хранит записи сотрудников по id.
+    Возвращаемые объекты общие для всех вызывающих — их нельзя изменять.
+    Загрузки по разным ключам идут параллельно (у каждого ключа своя
+    блокировка), одинаковые — один раз.
+    """
+
+    def __init__(self, lru_size: int = DEFAULT_LRU_SIZE) -> None:
+        self._lock = threading.Lock()
+        self._load_locks: dict[Hashable, threading.Lock] = {}
+        self._entries: dict[Hashable, tuple[Hashable, Any]] = {}
+        self._by_id: OrderedDict[tuple[Hashable, Any], tuple[Hashable, Any]] = OrderedDict()
+        self._lru_size = lru_size
+        self.hits = 0
+        self.misses = 0
+        self.id_hits = 0
+        self.id_misses = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, marker: Hashable, loader: Callable[[], Any]) -> Any:
+        """Вернуть значение по ключу, вызвав loader() при промахе или смене маркера."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == marker:
+                self.hits += 1
+                return entry[1]
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            with self._lock:
+                # за время ожидания значение мог загрузить другой поток
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] == marker:
+                    self.hits += 1
+                    return entry[1]
+                self.misses += 1
+                if entry is not None:
+                    self.invalidations += 1
+                    self._drop_ids(key)
+            value = loader()
+            if value is not None:
+                with self._lock:
+                    self._entries[key] = (marker, value)
+            return value
+
+    def peek(self, key: Hashable, marker: Hashable) -> Any:
+        """Значение, если оно есть и маркер совпадает, иначе None (для async-загрузчиков)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == marker:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            if entry is not None:
+                self.invalidations += 1
+                self._drop_ids(key)
+                del self._entries[key]
+            return None
+
+    def has(self, key: Hashable) -> bool:
+        """Есть ли значение по ключу (с любым маркером)."""
+        with self._lock:
+            return key in self._entries
+
+    def store(self, key: Hashable, marker: Hashable, value: Any) -> None:
+        """Сохранить значение, загруженное после peek()."""
+        if value is None:
+            return
+        with self._lock:
+            self._entries[key] = (marker, value)
+
+    def get_by_id(
+        self,
+        key: Hashable,
+        marker: Hashable,
+        employee_id: Any,
+        lookup: Callable[[Any], Any],
+    ) -> Any:
+        """Найти сотрудника по id через LRU; при промахе вызвать lookup(employee_id)."""
+        lru_key = (key, employee_id)
+        with self._lock:
+            entry = self._by_id.get(lru_key)
+            if entry is not None and entry[0] == marker:
+                self._by_id.move_to_end(lru_key)
+                self.id_hits += 1
+                return entry[1]
+            self.id_misses += 1
+        record = lookup(employee_id)
+        if record is not None:
+            with self._lock:
+                self._by_id[lru_key] = (marker, record)
+                self._by_id.move_to_end(lru_key)
+                while len(self._by_id) > self._lru_size:
+                    self._by_id.popitem(last=False)
+        return record
+
+    def _drop_ids(self, key: Hashable) -> None:
+        for lru_key in [k for k in self._by_id if k[0] == key]:
+            del self._by_id[lru_key]
+
+    def info(self) -> dict[str, int]:
+        """Счётчики попаданий/промахов и размеры кэша."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "id_hits": self.id_hits,
+                "id_misses": self.id_misses,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+                "id_entries": len(self._by_id),
+            }
+
+    def clear(self) -> None:
+        """Сбросить все записи и счётчики."""
+        with self._lock:
+            self._entries.clear()
+            self._by_id.clear()
+            self.hits = self.misses = 0
+            self.id_hits = self.id_misses = 0
+            self.invalidations = 0
+
+
+roster_cache = RosterCache()
+
+
+def cache_info() -> dict[str, int]:
+    """Счётчики общего кэша сотрудников."""
+    return roster_cache.info()
+
+
+def clear_cache() -> None:
+    """Очистить общий кэш сотрудников."""
+    roster_cache.clear()
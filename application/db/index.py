@@ -0,0 +1,58 @@
+"""Lookup index over a loaded employee roster."""
+
+__all__ = ["RosterIndex"]
+
+from collections.abc import Iterable
+from typing import Any
+
+
+class RosterIndex:
+    """
+    Индексы по id, employee_code и department_id.
+
+    Строится один раз на загрузку списка сотрудников (хранится в общем кэше
+    рядом со списком) — поиск по ключу стоит O(1) при любом размере штата.
+    С compact=True записи хранятся как EmployeeRecord (application.db.roster).
+    """
+
+    __slots__ = ("employees", "by_id", "by_code", "by_department")
+
+    def __init__(self, employees: Iterable[dict[str, Any]], compact: bool = False) -> None:
+        if compact:
+            from application.db.roster import compact_records
+
+            self.employees: list[dict[str, Any]] = compact_records(employees)
+        else:
+            self.employees = list(employees)
+        self.by_id: dict[Any, dict[str, Any]] = {}
+        self.by_code: dict[str, dict[str, Any]] = {}
+        self.by_department: dict[Any, list[dict[str, Any]]] = {}
+        for emp in self.employees:
+            self.by_id.setdefault(emp.get("id"), emp)
+            code = emp.get("employee_code")
+            if code:
+                self.by_code.setdefault(code, emp)
+            self.by_department.setdefault(emp.get("department_id"), []).append(emp)
+
+    def __len__(self) -> int:
+        return len(self.employees)
+
+    def get(self, employee_id: Any) -> dict[str, Any] | None:
+        """Сотрудник по id."""
+        return self.by_id.get(employee_id)
+
+    def get_by_code(self, employee_code: str) -> dict[str, Any] | None:
+        """Сотрудник по табельному коду (employee_code)."""
+        return self.by_code.get(employee_code)
+
+    def in_department(self, department_id: Any) -> list[dict[str, Any]]:
+        """Сотрудники отдела в порядке списка."""
+        return self.by_department.get(department_id, [])
+
+    def page(
+        self, offset: int = 0, limit: int | None = None, department_id: Any = None
+    ) -> list[dict[str, Any]]:
+        """Окно списка (всего штата или отдела): limit записей начиная с offset."""
+        source = self.employees if department_id is None else self.in_department(department_id)
+        stop = None if limit is None else offset + limit
+        return source[offset:stop]
@@ -0,0 +1,179 @@
+"""Incremental reader for the top-level arrays of employees.json."""
+
+__all__ = ["iter_array", "load_value", "iter_employee_records"]
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, TextIO
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+# Предел размера одного значения (символов): битая запись не дочитывает файл до конца
+MAX_VALUE_SIZE = 16 << 20
+
+_WHITESPACE = " \t\n\r"
+_decoder = json.JSONDecoder()
+
+
+class _Reader:
+    """
+    Буфер поверх текстового файла: значения JSON разбираются по одному через
+    JSONDecoder.raw_decode, прочитанная часть буфера отбрасывается — память
+    ограничена размером одного значения (не больше max_value_size), а не файла.
+    """
+
+    def __init__(self, f: TextIO, chunk_size: int, max_value_size: int = MAX_VALUE_SIZE) -> None:
+        self._f = f
+        self._chunk_size = chunk_size
+        self._max_value_size = max_value_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._dropped_bytes = 0  # байт файла до начала буфера
+
+    def _fill(self, size: int | None = None) -> bool:
+        if self._eof:
+            return False
+        if self._pos:
+            self._dropped_bytes += len(self._buf[: self._pos].encode("utf-8"))
+            self._buf = self._buf[self._pos :]
+            self._pos = 0
+        chunk = self._f.read(size or self._chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buf += chunk
+        return True
+
+    def _error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self._buf, self._pos)
+
+    def offset(self) -> int:
+        """Смещение текущей позиции в файле, байт."""
+        return self._dropped_bytes + len(self._buf[: self._pos].encode("utf-8"))
+
+    def peek(self) -> str:
+        """Следующий непробельный символ ("" в конце файла)."""
+        while True:
+            buf = self._buf
+            pos = self._pos
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buf):
+                return buf[pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, ch: str) -> None:
+        if self.peek() != ch:
+            raise self._error(f"Expecting '{ch}'")
+        self._pos += 1
+
+    def value(self) -> Any:
+        """Разобрать одно значение JSON, дочитывая файл по мере надобности."""
+        self.peek()
+        while True:
+            try:
+                obj, end = _decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                # Значение не поместилось в буфер — читаем больше (с ростом порции),
+                # но не дальше max_value_size от его начала
+                pending = len(self._buf) - self._pos
+                if pending > self._max_value_size:
+                    raise self._error(
+                        f"Значение JSON с байта {self.offset()} не разобрано "
+                        f"в пределах {self._max_value_size} символов"
+                    ) from None
+                if not self._fill(max(self._chunk_size, pending)):
+                    raise
+                continue
+            # Число или литерал на краю буфера может быть обрезано
+            if end == len(self._buf) and not self._eof and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def items(self) -> Iterator[Any]:
+        """Элементы массива по одному."""
+        self.expect("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            ch = self.peek()
+            self._pos += 1
+            if ch == "]":
+                return
+            if ch != ",":
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def members(self) -> Iterator[tuple[str, "_Reader"]]:
+        """Ключи объекта верхнего уровня; значение читает вызывающий."""
+        self.expect("{")
+        if self.peek() == "}":
+            return
+        while True:
+            key = self.value()
+            self.expect(":")
+            yield key, self
+            ch = self.peek()
+            self._pos += 1
+            if ch == "}":
+                return
+            if ch != ",":
+                self._pos -= 1
+                raise self._error("Expecting ',' delimiter")
+
+    def skip(self) -> None:
+        """Пропустить значение; массивы — поэлементно, без накопления."""
+        if self.peek() == "[":
+            for _ in self.items():
+                pass
+        else:
+            self.value()
+
+
+def iter_array(
+    path: Path,
+    key: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_value_size: int = MAX_VALUE_SIZE,
+) -> Iterator[Any]:
+    """
+    Элементы массива data[key] из JSON-объекта в файле, по одному.
+
+    Остальные ключи верхнего уровня пропускаются; если ключа нет — ничего.
+    Ошибки формата — json.JSONDecodeError, как у json.load(); значение, не
+    разобранное в пределах max_value_size символов, — тоже ошибка (с
+    байтовым смещением его начала), без чтения остатка файла.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size, max_value_size)
+        for name, member in reader.members():
+            if name == key and member.peek() == "[":
+                yield from member.items()
+                return
+            member.skip()
+
+
+def load_value(path: Path, key: str, default: Any = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Any:
+    """Значение data[key] без загрузки остальных ключей целиком."""
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _Reader(f, chunk_size)
+        for name, member in reader.members():
+            if name == key:
+                return member.value()
+            member.skip()
+    return default
+
+
+def iter_employee_records(
+    path: Path, active_only: bool = True, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[dict[str, Any]]:
+    """Сотрудники из массива "employees", с фильтром is_active по ходу чтения."""
+    for emp in iter_array(path, "employees", chunk_size):
+        if not active_only or emp.get("is_active", True):
+            yield emp
@@ -1,12 +1,35 @@
 """Module for employee data access."""
 
-__all__ = ["get_employees"]
+__all__ = ["get_employees", "get_employee", "iter_employees", "iter_employee_pages"]
 
+import itertools
 import json
 import logging
+import os
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Any
 
+from application.db.cache import json_marker, roster_cache
+from application.db.index import RosterIndex
+from application.db.json_stream import iter_employee_records
+from application.db.queries import (
+    MONEY_FIELDS,
+    employee_query,
+    profile_fields,
+    roster_version_query,
+    row_converter,
+)
+from application.db.roster import copy_record
+from application.db.snapshot import SnapshotRoster, db_snapshot_path, load_db_roster, load_roster
+from application.metrics import inc, stage
+from utils.money import to_decimal
+
 logger = logging.getLogger(__name__)
 
 # Вывод источника данных (с fallback для консолей без Unicode)
@@ -20,6 +43,13 @@ def _print_source(index: int) -> None:
     except UnicodeEncodeError:
         print(_SOURCE_LABELS_ASCII[index])
 
+# Сколько ждать БД, пока JSON загружается параллельно (секунды); 0 — источники по очереди
+HEDGE_DEADLINE = float(os.getenv("BALANSOFT_HEDGE_DEADLINE", "0"))
+# Потоков для загрузок из БД с hedge_deadline на процесс
+HEDGE_WORKERS = 4
+
+_MISSING = object()
+
 # Минимальные тестовые данные при отсутствии JSON и БД
 _FALLBACK_EMPLOYEES = [
     {"id": 0, "full_name": "Тестовый Сотрудник", "position": "Должность", "base_salary": 0, "is_active": True},
@@ -27,29 +57,67 @@ _FALLBACK_EMPLOYEES = [
 
 
 def _get_json_path() -> Path:
-    """Путь к файлу employees.json."""
+    """Путь к файлу employees.json (переопределяется BALANSOFT_EMPLOYEES_JSON)."""
+    override = os.getenv("BALANSOFT_EMPLOYEES_JSON")
+    if override:
+        return Path(override)
     return Path(__file__).resolve().parent.parent.parent / "data" / "employees.json"
 
 
-def _try_load_from_db() -> list[dict[str, Any]] | None:
+def _load_db_snapshot(marker: Any) -> SnapshotRoster | None:
+    """Активные сотрудники из снимка БД (--from-db), если он собран при версии marker."""
+    with stage("snapshot_open"):
+        roster = load_db_roster(db_snapshot_path(_get_json_path()), marker, active_only=True)
+    if roster is not None:
+        inc("balansoft_rows_loaded_total", len(roster), source="snapshot")
+    return roster
+
+
+def _try_load_from_db() -> RosterIndex | SnapshotRoster | None:
     """
     Опционально загрузить сотрудников из БД.
     Весь код работы с БД изолирован; при отсутствии sqlalchemy/asyncpg не импортируется.
+    Результат (индекс по id/коду/отделу) кэшируется до изменения счётчика
+    roster_version, который ведут триггеры БД; снимок из БД, собранный при той
+    же версии, заменяет запрос.
     """
     try:
         from database.session import SessionLocal
+
+        if SessionLocal is None:  # БД не настроена: SQLAlchemy не импортируется
+            return None
+
         from database.models import Employee
 
-        if SessionLocal is None or Employee is None:
+        if Employee is None:
             return None
 
-        from sqlalchemy import select
+        from database.health import db_available
+
+        with stage("source_probe"):
+            if not db_available():
+                return None
 
         db = SessionLocal()
         try:
-            result = db.execute(select(Employee).where(Employee.is_active == True))
-            rows = result.scalars().all()
-            return [_employee_row_to_dict(row) for row in rows]
+            with stage("db_marker"):
+                marker = db.execute(roster_version_query()).scalar()
+            if marker is None:  # нет строки счётчика — без кэширования
+                marker = object()
+
+            def load() -> RosterIndex | SnapshotRoster:
+                snapshot = _load_db_snapshot(marker)
+                if snapshot is not None:
+                    return snapshot
+                convert = row_converter("full")
+                with stage("db_query"):
+                    rows = db.execute(employee_query("full"))
+                with stage("row_conversion", source="db"):
+                    index = RosterIndex((convert(row) for row in rows), compact=True)
+                inc("balansoft_rows_loaded_total", len(index), source="db")
+                return index
+
+            return roster_cache.get("db", marker, load)
         finally:
             db.close()
     except ImportError as e:
@@ -57,49 +125,84 @@ def _try_load_from_db() -> list[dict[str, Any]] | None:
         return None
     except Exception as e:
         logger.warning("БД недоступна, используем другой источник: %s", e)
+        _record_db_failure()
         return None
 
 
-def _employee_row_to_dict(row: Any) -> dict[str, Any]:
-    """Привести строку БД к формату, совместимому с JSON."""
-    return {
-        "id": getattr(row, "id", None),
-        "employee_code": getattr(row, "employee_code", ""),
-        "full_name": getattr(row, "full_name", ""),
-        "first_name": getattr(row, "first_name", ""),
-        "last_name": getattr(row, "last_name", ""),
-        "middle_name": getattr(row, "middle_name"),
-        "birth_date": _date_to_str(getattr(row, "birth_date", None)),
-        "hire_date": _date_to_str(getattr(row, "hire_date", None)),
-        "department_id": getattr(row, "department_id", None),
-        "department": "",
-        "position": getattr(row, "position", ""),
-        "tariff_grade": getattr(row, "tariff_grade", 1),
-        "coefficient": float(getattr(row, "coefficient", 1.0)),
-        "base_salary": float(getattr(row, "base_salary", 0)),
-        "tax_deduction": float(getattr(row, "tax_deduction", 0)),
-        "special_conditions": getattr(row, "special_conditions", None),
-        "is_active": getattr(row, "is_active", True),
-    }
-
-
-def _date_to_str(value: Any) -> str | None:
-    """Преобразовать date/datetime в строку YYYY-MM-DD."""
-    if value is None:
+def _try_get_from_db(employee_id: int | None, employee_code: str | None) -> dict[str, Any] | None:
+    """
+    Найти одного активного сотрудника в БД по первичному ключу или уникальному
+    employee_code (одна строка по индексу, с названием отдела из JOIN).
+    None — не найден или БД недоступна.
+    """
+    try:
+        from database.session import SessionLocal
+
+        if SessionLocal is None:  # БД не настроена: SQLAlchemy не импортируется
+            return None
+
+        from database.models import Employee
+
+        if Employee is None:
+            return None
+
+        from database.health import db_available
+
+        if not db_available():
+            return None
+
+        if employee_id is not None:
+            stmt = employee_query("full", employee_id=employee_id)
+        else:
+            stmt = employee_query("full", employee_code=employee_code)
+
+        db = SessionLocal()
+        try:
+            row = db.execute(stmt).first()
+            return None if row is None else row_converter("full")(row)
+        finally:
+            db.close()
+    except ImportError as e:
+        logger.debug("БД не используется: отсутствуют зависимости (%s)", e)
+        return None
+    except Exception as e:
+        logger.warning("БД недоступна, используем другой источник: %s", e)
+        _record_db_failure()
         return None
-    if hasattr(value, "isoformat"):
-        return value.isoformat()[:10]
-    return str(value)[:10]
 
 
-def _load_from_json() -> list[dict[str, Any]] | None:
-    """Загрузить сотрудников из JSON. При ошибке вернуть None."""
+def _record_db_failure() -> None:
+    """Сообщить размыкателю о сбое БД: следующие вызовы её пропустят."""
+    from database.health import breaker
+
+    inc("balansoft_db_errors_total")
+    breaker.record_failure()
+
+
+def _load_from_json() -> RosterIndex | SnapshotRoster | None:
+    """Загрузить сотрудников из JSON (через кэш по mtime/size). При ошибке вернуть None."""
     path = _get_json_path()
+    return roster_cache.get(("json", "active"), json_marker(path), lambda: _read_json(path))
+
+
+def _read_json(path: Path) -> RosterIndex | SnapshotRoster | None:
+    """
+    Активные сотрудники из JSON: через бинарный снимок (application.db.snapshot),
+    а если он недоступен — разбором файла с построением индекса.
+    """
+    with stage("snapshot_open"):
+        roster = load_roster(path, active_only=True)
+    if roster is not None:
+        inc("balansoft_rows_loaded_total", len(roster), source="snapshot")
+        return roster
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        with stage("json_parse"), open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
         employees = data.get("employees", [])
-        return [e for e in employees if e.get("is_active", True)]
+        with stage("row_conversion", source="json"):
+            index = RosterIndex((e for e in employees if e.get("is_active", True)), compact=True)
+        inc("balansoft_rows_loaded_total", len(index), source="json")
+        return index
     except FileNotFoundError:
         logger.debug("Файл не найден: %s", path)
         return None
@@ -108,7 +211,132 @@ def _load_from_json() -> list[dict[str, Any]] | None:
         return None
 
 
-def get_employees(use_db_if_available: bool = True) -> list[dict[str, Any]]:
+def _count_fallback(source: str, loaded: Any, reason: str | None = None) -> None:
+    """Счётчик перехода к следующему источнику: недоступен, пуст или не успел (deadline)."""
+    if reason is None:
+        reason = "unavailable" if loaded is None else "empty"
+    inc("balansoft_fallback_total", source=source, reason=reason)
+
+
+class _DaemonPool:
+    """
+    Ограниченный пул фоновых потоков: не больше max_workers на процесс,
+    задачи сверх них ждут в очереди (и могут быть отменены через Future).
+
+    Потоки-демоны: зависшее подключение к БД не задерживает завершение
+    процесса (потоки ThreadPoolExecutor ждутся при выходе).
+    """
+
+    def __init__(self, max_workers: int, name: str) -> None:
+        self._max_workers = max_workers
+        self._name = name
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._lock = threading.Lock()
+        self._workers = 0
+
+    def submit(self, fn: Callable[[], Any]) -> Future:
+        """Поставить fn() в очередь и вернуть Future с результатом."""
+        future: Future = Future()
+        self._queue.put((fn, future))
+        with self._lock:
+            if self._workers < self._max_workers:
+                self._workers += 1
+                name = f"{self._name}-{self._workers}"
+                threading.Thread(target=self._work, name=name, daemon=True).start()
+        return future
+
+    def _work(self) -> None:
+        while True:
+            fn, future = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+
+
+_db_pool = _DaemonPool(HEDGE_WORKERS, "balansoft-db")
+
+
+def _db_configured() -> bool:
+    """Настроена ли БД (есть фабрика сессий); без этого параллельная загрузка не нужна."""
+    try:
+        from database.session import SessionLocal
+    except ImportError:
+        return False
+    return SessionLocal is not None
+
+
+def _db_roster_warm() -> bool:
+    """
+    БД недавно отвечала и её ростер в кэше: загрузка — один запрос маркера,
+    ждать JSON параллельно незачем.
+    """
+    from database.health import breaker
+
+    return breaker.recently_ok() and roster_cache.has("db")
+
+
+def _late_db_result(result: Any) -> None:
+    """
+    Итог загрузки из БД, не уложившейся в hedge_deadline (размыкатель уже
+    отметил её как сбой): успешный ответ снова открывает путь к БД, ошибки
+    учтены самим загрузчиком.
+    """
+    if result is not None:
+        from database.health import breaker
+
+        breaker.record_success()
+
+
+def _on_db_deadline(future: Future) -> None:
+    """
+    БД не ответила за hedge_deadline: отменить загрузку, если она ещё в
+    очереди, иначе отметить зависание в размыкателе (следующие вызовы
+    пропускают БД) и забрать результат, когда он придёт.
+    """
+    if future.cancel():
+        return
+    _record_db_failure()
+
+    def done(f: Future) -> None:
+        if not f.cancelled() and f.exception() is None:
+            _late_db_result(f.result())
+
+    future.add_done_callback(done)
+
+
+def _copies(records: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Обычные словари вместо общих записей кэша (EmployeeRecord или dict)."""
+    return [copy_record(emp) for emp in records]
+
+
+def _copy(record: dict[str, Any] | None) -> dict[str, Any] | None:
+    return None if record is None else copy_record(record)
+
+
+def _select(
+    index: RosterIndex | SnapshotRoster,
+    department_id: int | None,
+    offset: int = 0,
+    limit: int | None = None,
+) -> list[dict[str, Any]]:
+    """Выборка из индекса — копиями: изменение результата не затрагивает кэш."""
+    if offset or limit is not None:
+        return _copies(index.page(offset, limit, department_id))
+    if department_id is None:
+        return _copies(index.employees)
+    return _copies(index.in_department(department_id))
+
+
+def get_employees(
+    use_db_if_available: bool = True,
+    department_id: int | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+    hedge_deadline: float | None = None,
+) -> list[dict[str, Any]]:
     """
     Умная функция получения сотрудников.
 
@@ -120,31 +348,308 @@ def get_employees(use_db_if_available: bool = True) -> list[dict[str, Any]]:
     5. Всегда выводится источник данных (📊 БД / 📄 JSON / 🧪 Тест).
 
     Проект работает без установки sqlalchemy/asyncpg; БД — опциональное дополнение.
+    Повторные вызовы обслуживаются из общего кэша (application.db.cache), пока
+    файл или БД не изменились.
+
+    С hedge_deadline > 0 загрузка из БД идёт в фоновом пуле (не больше
+    HEDGE_WORKERS потоков), а JSON (снимок) тем временем загружается в
+    вызывающем потоке: результат БД используется, если пришёл за
+    hedge_deadline секунд, иначе — уже загруженный JSON. При деградации БД
+    ожидание — max(JSON, hedge_deadline) вместо таймаута БД плюс JSON;
+    опоздавшая загрузка отмечается в размыкателе как сбой, продолжается в
+    фоне и попадает в кэш (успешный ответ снимает отметку). Без настроенной
+    БД или при тёплом кэше БД загрузка идёт по очереди, без фоновых потоков.
 
     Args:
         use_db_if_available: использовать БД, если она доступна.
+        department_id: вернуть только сотрудников отдела (поиск по индексу).
+        offset: пропустить первых offset сотрудников (после фильтра по отделу).
+        limit: вернуть не больше limit сотрудников; из бинарного снимка
+            декодируются только записи этого окна.
+        hedge_deadline: сколько ждать БД при параллельной загрузке JSON
+            (секунды); None — BALANSOFT_HEDGE_DEADLINE, 0 — по очереди.
 
     Returns:
         Список словарей сотрудников в едином формате из любого источника.
     """
     logger.info("Вызов get_employees()")
+    index = _resolve_source(use_db_if_available, hedge_deadline)
+    return _select(index, department_id, offset, limit)
+
+
+def _resolve_source(
+    use_db_if_available: bool, hedge_deadline: float | None = None
+) -> RosterIndex | SnapshotRoster:
+    """Выбрать источник (БД → JSON → тест), вывести его метку и вернуть загруженный ростер."""
+    if hedge_deadline is None:
+        hedge_deadline = HEDGE_DEADLINE
+    from_json: Any = _MISSING
 
     # 1–2. Пробуем БД, если разрешено
     if use_db_if_available:
-        from_db = _try_load_from_db()
+        reason = None
+        if hedge_deadline > 0 and _db_configured() and not _db_roster_warm():
+            # БД — в пуле, JSON — в этом потоке, пока она отвечает
+            started = time.monotonic()
+            db_future = _db_pool.submit(_try_load_from_db)
+            from_json = _load_from_json()
+            try:
+                remaining = hedge_deadline - (time.monotonic() - started)
+                from_db = db_future.result(timeout=max(remaining, 0))
+            except FutureTimeoutError:
+                logger.warning(
+                    "БД не ответила за %.2f с, используем другой источник", hedge_deadline
+                )
+                _on_db_deadline(db_future)
+                from_db, reason = None, "deadline"
+        else:
+            from_db = _try_load_from_db()
         if from_db is not None and len(from_db) > 0:
             _print_source(0)
+            inc("balansoft_source_total", source="db")
             logger.info("Загружено %s сотрудников из БД", len(from_db))
             return from_db
+        _count_fallback("db", from_db, reason)
 
     # 3–4. JSON, затем тест
-    from_json = _load_from_json()
+    if from_json is _MISSING:
+        from_json = _load_from_json()
     if from_json is not None and len(from_json) > 0:
         _print_source(1)
+        inc("balansoft_source_total", source="json")
         logger.info("Загружено %s сотрудников из файла", len(from_json))
         return from_json
+    _count_fallback("json", from_json)
 
     # 5. Fallback
+    _print_source(2)
+    inc("balansoft_source_total", source="fallback")
+    logger.warning("Используются тестовые данные (JSON и БД недоступны)")
+    return RosterIndex(_FALLBACK_EMPLOYEES)
+
+
+def iter_employee_pages(
+    page_size: int = 50,
+    use_db_if_available: bool = True,
+    department_id: int | None = None,
+    offset: int = 0,
+    limit: int | None = None,
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Сотрудники страницами по page_size — для вывода больших списков.
+
+    Источник выбирается один раз, как в get_employees(); каждая страница
+    берётся из индекса только при запросе следующей, так что первая
+    страница доступна сразу, а из бинарного снимка декодируются только
+    выведенные записи.
+
+    Args:
+        page_size: сотрудников на странице.
+        use_db_if_available: использовать БД, если она доступна.
+        department_id: только сотрудники отдела.
+        offset: пропустить первых offset сотрудников.
+        limit: всего не больше limit сотрудников (None — до конца списка).
+    """
+    if page_size < 1:
+        raise ValueError("page_size должен быть положительным")
+    index = _resolve_source(use_db_if_available)
+    remaining = limit
+    while remaining is None or remaining > 0:
+        size = page_size if remaining is None else min(page_size, remaining)
+        page = index.page(offset, size, department_id)
+        if not page:
+            return
+        yield _copies(page)
+        offset += len(page)
+        if remaining is not None:
+            remaining -= len(page)
+
+
+def get_employee(
+    employee_id: int | None = None,
+    employee_code: str | None = None,
+    use_db_if_available: bool = True,
+) -> dict[str, Any] | None:
+    """
+    Найти активного сотрудника по id или табельному коду (employee_code).
+
+    Источники в том же порядке, что у get_employees(): в БД — запрос по
+    первичному ключу или уникальному индексу, в JSON — поиск по индексу
+    загруженного списка.
+
+    Args:
+        employee_id: id сотрудника.
+        employee_code: табельный код (используется, если id не задан).
+        use_db_if_available: использовать БД, если она доступна.
+
+    Returns:
+        Словарь сотрудника или None, если не найден.
+    """
+    if employee_id is None and employee_code is None:
+        raise ValueError("Нужно указать employee_id или employee_code")
+
+    if use_db_if_available:
+        from_db = _try_get_from_db(employee_id, employee_code)
+        if from_db is not None:
+            return from_db
+
+    index = _load_from_json()
+    if index is None:
+        return None
+    if employee_id is not None:
+        return _copy(index.get(employee_id))
+    return _copy(index.get_by_code(employee_code))
+
+
+def _iter_db_rows(
+    batch_size: int, profile: str, filters: dict[str, Any], exact: bool = False
+) -> Iterator[dict[str, Any]]:
+    """Сотрудники из БД: колонки профиля, фильтры в SQL, порции по batch_size (yield_per)."""
+    from database.session import SessionLocal
+
+    if SessionLocal is None:
+        return
+
+    stmt = employee_query(profile, **filters).execution_options(yield_per=batch_size)
+    convert = row_converter(profile, exact)
+    db = SessionLocal()
+    try:
+        for row in db.execute(stmt):
+            yield convert(row)
+    finally:
+        db.close()
+
+
+def _try_iter_from_db(
+    batch_size: int, profile: str, filters: dict[str, Any], exact: bool = False
+) -> Iterator[dict[str, Any]] | None:
+    """Начать потоковое чтение из БД; None — БД недоступна или пуста."""
+    rows = _iter_db_rows(batch_size, profile, filters, exact)
+    try:
+        from database.health import db_available
+
+        if not db_available():
+            return None
+        first = next(rows)
+    except StopIteration:
+        return None
+    except ImportError as e:
+        logger.debug("БД не используется: отсутствуют зависимости (%s)", e)
+        return None
+    except Exception as e:
+        logger.warning("БД недоступна, используем другой источник: %s", e)
+        _record_db_failure()
+        return None
+    return itertools.chain((first,), rows)
+
+
+def _matches(
+    emp: dict[str, Any],
+    department_id: int | None = None,
+    grade_min: int | None = None,
+    grade_max: int | None = None,
+) -> bool:
+    """Те же фильтры, что employee_query(), для записей из JSON."""
+    if department_id is not None and emp.get("department_id") != department_id:
+        return False
+    grade = emp.get("tariff_grade")
+    if grade_min is not None and (grade is None or grade < grade_min):
+        return False
+    if grade_max is not None and (grade is None or grade > grade_max):
+        return False
+    return True
+
+
+def _iter_json_records(profile: str, filters: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    records = iter_employee_records(_get_json_path())
+    if any(value is not None for value in filters.values()):
+        records = (emp for emp in records if _matches(emp, **filters))
+    if profile != "full":
+        fields = profile_fields(profile)
+        records = ({name: emp.get(name) for name in fields} for emp in records)
+    return records
+
+
+def _try_iter_from_json(profile: str, filters: dict[str, Any]) -> Iterator[dict[str, Any]] | None:
+    """Начать потоковое чтение JSON; None — файла нет, он повреждён в начале или пуст."""
+    records = _iter_json_records(profile, filters)
+    try:
+        first = next(records)
+    except StopIteration:
+        return None
+    except FileNotFoundError:
+        logger.debug("Файл не найден: %s", _get_json_path())
+        return None
+    except json.JSONDecodeError as e:
+        logger.warning("Ошибка чтения JSON: %s", e)
+        return None
+    return itertools.chain((first,), records)
+
+
+def _exact_money(records: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Денежные поля записей JSON — в Decimal (float через кратчайшее представление)."""
+    for emp in records:
+        emp = dict(emp)
+        for name in MONEY_FIELDS:
+            if emp.get(name) is not None:
+                emp[name] = to_decimal(emp[name])
+        yield emp
+
+
+def iter_employees(
+    use_db_if_available: bool = True,
+    batch_size: int = 1000,
+    profile: str = "full",
+    department_id: int | None = None,
+    grade_min: int | None = None,
+    grade_max: int | None = None,
+    exact: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """
+    Потоковый вариант get_employees(): сотрудники по одному, без списка в памяти.
+
+    Источники и их порядок те же (БД → JSON → тестовые данные). JSON читается
+    инкрементально (application.db.json_stream), из БД строки забираются
+    порциями по batch_size. Кэш не используется, поэтому потребление памяти
+    не зависит от размера штата.
+
+    Из БД выбираются только колонки профиля (application.db.queries.PROFILES:
+    "full", "listing", "payroll"), фильтры выполняются в SQL; для JSON те же
+    фильтры и набор полей применяются по ходу чтения.
+
+    Args:
+        use_db_if_available: использовать БД, если она доступна.
+        batch_size: размер порции строк при чтении из БД.
+        profile: набор полей записи.
+        department_id: только сотрудники отдела.
+        grade_min: минимальный разряд тарифной сетки (включительно).
+        grade_max: максимальный разряд тарифной сетки (включительно).
+        exact: денежные поля (оклад, вычет, коэффициент) — Decimal из любого
+            источника; из NUMERIC-колонок БД без промежуточного float, для
+            calculate_salaries(..., exact=True).
+
+    Yields:
+        Словари сотрудников в том же формате, что и get_employees().
+    """
+    logger.info("Вызов iter_employees()")
+
+    profile_fields(profile)  # неизвестный профиль — ValueError сразу, а не на первой строке
+    filters = {"department_id": department_id, "grade_min": grade_min, "grade_max": grade_max}
+
+    if use_db_if_available:
+        from_db = _try_iter_from_db(batch_size, profile, filters, exact)
+        if from_db is not None:
+            _print_source(0)
+            yield from from_db
+            return
+
+    from_json = _try_iter_from_json(profile, filters)
+    if from_json is not None:
+        _print_source(1)
+        yield from _exact_money(from_json) if exact else from_json
+        return
+
     _print_source(2)
     logger.warning("Используются тестовые данные (JSON и БД недоступны)")
-    return list(_FALLBACK_EMPLOYEES)
+    fallback = (emp for emp in _FALLBACK_EMPLOYEES if _matches(emp, **filters))
+    yield from _exact_money(fallback) if exact else fallback
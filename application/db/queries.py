@@ -0,0 +1,173 @@
+"""Column-projected employee queries: only the needed columns, filters in SQL."""
+
+__all__ = [
+    "MONEY_FIELDS",
+    "PROFILES",
+    "employee_query",
+    "profile_fields",
+    "roster_version_query",
+    "row_converter",
+]
+
+from collections.abc import Callable, Sequence
+from typing import Any
+
+# Наборы колонок под сценарии; "full" совпадает с форматом записи из JSON
+PROFILES: dict[str, tuple[str, ...]] = {
+    "full": (
+        "id",
+        "employee_code",
+        "full_name",
+        "first_name",
+        "last_name",
+        "middle_name",
+        "birth_date",
+        "hire_date",
+        "department_id",
+        "department",
+        "position",
+        "tariff_grade",
+        "coefficient",
+        "base_salary",
+        "tax_deduction",
+        "special_conditions",
+        "is_active",
+    ),
+    "listing": (
+        "id",
+        "employee_code",
+        "full_name",
+        "department_id",
+        "department",
+        "position",
+        "base_salary",
+    ),
+    "payroll": (
+        "id",
+        "full_name",
+        "department_id",
+        "department",
+        "base_salary",
+        "tax_deduction",
+        "special_conditions",
+    ),
+}
+
+
+def _to_float(value: Any) -> float | None:
+    return None if value is None else float(value)
+
+
+def _to_date_str(value: Any) -> str | None:
+    """Преобразовать date/datetime в строку YYYY-MM-DD."""
+    if value is None:
+        return None
+    if hasattr(value, "isoformat"):
+        return value.isoformat()[:10]
+    return str(value)[:10]
+
+
+def _to_department(value: Any) -> str:
+    return value or ""
+
+
+# Колонки NUMERIC: в точном режиме остаются Decimal, иначе приводятся к float
+MONEY_FIELDS = ("coefficient", "base_salary", "tax_deduction")
+
+# Поля, которые приводятся к формату JSON после выборки
+_CONVERTERS: dict[str, Callable[[Any], Any]] = {
+    "birth_date": _to_date_str,
+    "hire_date": _to_date_str,
+    **{name: _to_float for name in MONEY_FIELDS},
+    "department": _to_department,
+}
+
+
+def profile_fields(profile: str) -> tuple[str, ...]:
+    """Поля профиля; неизвестный профиль — ValueError."""
+    try:
+        return PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Неизвестный профиль выборки: {profile!r}") from None
+
+
+def employee_query(
+    profile: str = "full",
+    department_id: int | None = None,
+    active: bool | None = True,
+    grade_min: int | None = None,
+    grade_max: int | None = None,
+    employee_id: int | None = None,
+    employee_code: str | None = None,
+) -> Any:
+    """
+    SELECT только колонок профиля (кортежи строк, без ORM-объектов).
+
+    Название отдела подтягивается JOIN'ом с departments; фильтры по отделу,
+    активности, диапазону разрядов и ключам выполняются в SQL.
+    Порядок — по id.
+    """
+    from sqlalchemy import select
+
+    from database.models import Department, Employee
+
+    fields = profile_fields(profile)
+    columns = [
+        Department.name.label("department") if name == "department" else getattr(Employee, name)
+        for name in fields
+    ]
+    stmt = select(*columns)
+    if "department" in fields:
+        stmt = stmt.outerjoin(Department, Department.id == Employee.department_id)
+    if active is not None:
+        stmt = stmt.where(Employee.is_active == active)
+    if department_id is not None:
+        stmt = stmt.where(Employee.department_id == department_id)
+    if grade_min is not None:
+        stmt = stmt.where(Employee.tariff_grade >= grade_min)
+    if grade_max is not None:
+        stmt = stmt.where(Employee.tariff_grade <= grade_max)
+    if employee_id is not None:
+        stmt = stmt.where(Employee.id == employee_id)
+    if employee_code is not None:
+        stmt = stmt.where(Employee.employee_code == employee_code)
+    return stmt.order_by(Employee.id)
+
+
+def roster_version_query() -> Any:
+    """
+    SELECT счётчика изменений штата (строка roster_version по первичному ключу).
+
+    Счётчик увеличивают триггеры на employees и departments, поэтому он
+    меняется при любой записи, в том числе сырым SQL, COPY и пакетным upsert.
+    """
+    from sqlalchemy import select
+
+    from database.models import RosterVersion
+
+    return select(RosterVersion.version).where(RosterVersion.id == 1)
+
+
+def row_converter(
+    profile: str, exact: bool = False
+) -> Callable[[Sequence[Any]], dict[str, Any]]:
+    """
+    Функция «кортеж строки → словарь» для профиля (конвертеры выбраны заранее).
+
+    С exact=True денежные поля (MONEY_FIELDS) остаются Decimal, как их вернул
+    драйвер, — без округления через float перед расчётом в копейках.
+    """
+    fields = profile_fields(profile)
+    conversions = [
+        (name, _CONVERTERS[name])
+        for name in fields
+        if name in _CONVERTERS and not (exact and name in MONEY_FIELDS)
+    ]
+
+    def convert(row: Sequence[Any]) -> dict[str, Any]:
+        record = dict(zip(fields, row))
+        for name, conv in conversions:
+            record[name] = conv(record[name])
+        return record
+
+    return convert
@@ -0,0 +1,610 @@
+"""
+Binary roster snapshot: employees.json compiled into a memory-mapped file.
+
+Layout (little-endian, every section aligned to 8 bytes):
+
+    header        magic, format version, flags (built from the DB), layout CRC,
+                  row/string counts, source mtime_ns and size
+    kinds         one byte per row for each numeric field (absent/None/int/...)
+    int columns   int64 per row: id, department_id, tariff_grade, age
+    float columns float64 per row: coefficient, base_salary, tax_deduction
+    str columns   uint32 string-table index per row for each text field
+    id order      uint32 row numbers sorted by id (binary search by id)
+    code order    uint32 row numbers sorted by employee_code
+    dept order    uint32 row numbers sorted by department_id, list order within
+                  a department (a department is one contiguous range)
+    string table  uint64 offsets + UTF-8 blob, each distinct string once
+
+Values that do not fit their column (special_conditions, unknown keys, odd
+types) are stored per row as a JSON object in the "_extra" text column.
+
+Build from the JSON (rebuilt automatically when the file's mtime/size
+change) or from the DB. A snapshot built from the DB is a separate file
+(employees.db.snap) holding every row, active or not, and the DB's
+roster_version instead of a file marker; the DB loader uses it while that
+version is current, the JSON loaders never do:
+
+    python -m application.db.snapshot [--from-db] [--output PATH]
+"""
+
+__all__ = [
+    "Snapshot",
+    "SnapshotRoster",
+    "build_db_snapshot",
+    "build_snapshot",
+    "db_snapshot_path",
+    "load_db_roster",
+    "load_roster",
+    "snapshot_path",
+]
+
+import bisect
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from application.db.json_stream import iter_employee_records
+from application.db.roster import EmployeeRecord
+from utils.files import default_file_mode
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"BSNP"
+VERSION = 2
+
+_INT_FIELDS = ("id", "department_id", "tariff_grade", "age")
+_FLOAT_FIELDS = ("coefficient", "base_salary", "tax_deduction")
+_BOOL_FIELDS = ("is_active",)
+_STRING_FIELDS = (
+    "employee_code",
+    "full_name",
+    "first_name",
+    "last_name",
+    "middle_name",
+    "birth_date",
+    "hire_date",
+    "department",
+    "position",
+    "passport_series",
+    "passport_number",
+    "snils",
+    "inn",
+    "bank_account",
+    "bank_name",
+    "phone",
+    "email",
+    "notes",
+    "_extra",
+)
+_KIND_FIELDS = (*_INT_FIELDS, *_FLOAT_FIELDS, *_BOOL_FIELDS)
+
+# Состояние значения числового поля в строке
+_ABSENT, _NONE, _INT, _FLOAT, _FALSE, _TRUE = range(6)
+# Индексы строковой таблицы: 0 — поля нет, 1 — null
+_STR_ABSENT, _STR_NONE = 0, 1
+
+# Изменение набора или порядка колонок делает старые снимки недействительными
+_LAYOUT_CRC = zlib.crc32(
+    ";".join(
+        ",".join(group) for group in (_INT_FIELDS, _FLOAT_FIELDS, _BOOL_FIELDS, _STRING_FIELDS)
+    ).encode()
+)
+# Флаги заголовка
+_FLAG_FROM_DB = 1
+_HEADER = struct.Struct("<4sHHIQQQQQqq")
+_HEADER_SIZE = 72
+_INT64_MAX = 2**63 - 1
+_FLOAT_EXACT = 2**53
+
+_MISSING = object()
+_KNOWN = frozenset((*_KIND_FIELDS, *_STRING_FIELDS[:-1]))
+
+
+def _aligned(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def snapshot_path(json_path: Path) -> Path:
+    """Файл снимка для JSON: рядом с ним или в BALANSOFT_SNAPSHOT_DIR."""
+    directory = os.getenv("BALANSOFT_SNAPSHOT_DIR")
+    base = Path(directory) if directory else json_path.parent
+    return base / f"{json_path.stem}.snap"
+
+
+def db_snapshot_path(json_path: Path) -> Path:
+    """Файл снимка, собранного из БД (--from-db): рядом со снимком JSON."""
+    return snapshot_path(json_path).with_suffix(".db.snap")
+
+
+def _snapshots_enabled() -> bool:
+    return os.getenv("BALANSOFT_SNAPSHOT", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.index: dict[str, int] = {}
+        self.blob = bytearray()
+        self.offsets = array("Q", [0, 0, 0])  # 0 — поля нет, 1 — null
+
+    def add(self, value: str) -> int:
+        idx = self.index.get(value)
+        if idx is None:
+            idx = self.index[value] = len(self.offsets) - 1
+            self.blob += value.encode("utf-8")
+            self.offsets.append(len(self.blob))
+        return idx
+
+
+def _write_array(f: Any, arr: array) -> None:
+    if sys.byteorder != "little":
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    data = arr.tobytes()
+    f.write(data)
+    f.write(b"\0" * (_aligned(len(data)) - len(data)))
+
+
+def build_snapshot(
+    employees: Iterable[dict[str, Any]],
+    path: Path,
+    source: tuple[int, int] = (0, 0),
+    from_db: bool = False,
+) -> int:
+    """
+    Записать снимок в path (атомарно: временный файл + os.replace).
+
+    Args:
+        employees: записи сотрудников (можно потоком).
+        path: файл снимка.
+        source: (mtime_ns, size) исходного JSON для проверки актуальности;
+            для снимка из БД — (roster_version, 0); (0, 0) — без привязки.
+        from_db: пометить снимок как собранный из БД — загрузчики JSON его
+            не используют.
+
+    Returns:
+        Количество строк.
+    """
+    strings = _StringTable()
+    kinds = {name: array("B") for name in _KIND_FIELDS}
+    ints = {name: array("q") for name in _INT_FIELDS}
+    floats = {name: array("d") for name in _FLOAT_FIELDS}
+    texts = {name: array("I") for name in _STRING_FIELDS}
+
+    for emp in employees:
+        extra: dict[str, Any] = {}
+        for key, value in emp.items():
+            if key not in _KNOWN:
+                extra[key] = value
+        for name in _INT_FIELDS:
+            value = emp.get(name, _MISSING)
+            kind, number = _ABSENT, 0
+            if value is None:
+                kind = _NONE
+            elif type(value) is int and -_INT64_MAX <= value <= _INT64_MAX:
+                kind, number = _INT, value
+            elif value is not _MISSING:
+                extra[name] = value
+            kinds[name].append(kind)
+            ints[name].append(number)
+        for name in _FLOAT_FIELDS:
+            value = emp.get(name, _MISSING)
+            kind, number = _ABSENT, 0.0
+            if value is None:
+                kind = _NONE
+            elif type(value) is float:
+                kind, number = _FLOAT, value
+            elif type(value) is int and abs(value) <= _FLOAT_EXACT:
+                kind, number = _INT, float(value)
+            elif value is not _MISSING:
+                extra[name] = value
+            kinds[name].append(kind)
+            floats[name].append(number)
+        for name in _BOOL_FIELDS:
+            value = emp.get(name, _MISSING)
+            kind = _ABSENT
+            if value is None:
+                kind = _NONE
+            elif value is True or value is False:
+                kind = _TRUE if value else _FALSE
+            elif value is not _MISSING:
+                extra[name] = value
+            kinds[name].append(kind)
+        for name in _STRING_FIELDS[:-1]:
+            value = emp.get(name, _MISSING)
+            idx = _STR_ABSENT
+            if value is None:
+                idx = _STR_NONE
+            elif type(value) is str:
+                idx = strings.add(value)
+            elif value is not _MISSING:
+                extra[name] = value
+            texts[name].append(idx)
+        texts["_extra"].append(
+            strings.add(json.dumps(extra, ensure_ascii=False)) if extra else _STR_ABSENT
+        )
+
+    n_rows = len(texts["_extra"])
+    ids = ints["id"]
+    id_kinds = kinds["id"]
+    id_rows = (r for r in range(n_rows) if id_kinds[r] == _INT)
+    id_order = array("I", sorted(id_rows, key=ids.__getitem__))
+    codes = texts["employee_code"]
+    code_text = {idx: value for value, idx in strings.index.items()}
+    code_rows = (r for r in range(n_rows) if codes[r] > _STR_NONE)
+    code_order = array("I", sorted(code_rows, key=lambda r: code_text[codes[r]]))
+    dept_ids = ints["department_id"]
+    dept_kinds = kinds["department_id"]
+    dept_rows = (r for r in range(n_rows) if dept_kinds[r] == _INT)
+    dept_order = array("I", sorted(dept_rows, key=dept_ids.__getitem__))
+
+    header = _HEADER.pack(
+        MAGIC,
+        VERSION,
+        _FLAG_FROM_DB if from_db else 0,
+        _LAYOUT_CRC,
+        n_rows,
+        len(strings.offsets) - 1,
+        len(id_order),
+        len(code_order),
+        len(dept_order),
+        source[0],
+        source[1],
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+            for name in _KIND_FIELDS:
+                _write_array(f, kinds[name])
+            for name in _INT_FIELDS:
+                _write_array(f, ints[name])
+            for name in _FLOAT_FIELDS:
+                _write_array(f, floats[name])
+            for name in _STRING_FIELDS:
+                _write_array(f, texts[name])
+            _write_array(f, id_order)
+            _write_array(f, code_order)
+            _write_array(f, dept_order)
+            _write_array(f, strings.offsets)
+            f.write(strings.blob)
+        os.chmod(tmp, default_file_mode())
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return n_rows
+
+
+class Snapshot:
+    """
+    Открытый снимок: колонки — memoryview поверх mmap, без копирования.
+
+    Несколько процессов, открывших один файл, делят его страницы в памяти.
+    Строки декодируются только для запрошенных записей.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) < _HEADER_SIZE:
+            raise ValueError(f"Снимок повреждён: {self.path}")
+        (
+            magic,
+            version,
+            flags,
+            layout,
+            self.n_rows,
+            n_strings,
+            n_id_order,
+            n_code_order,
+            n_dept_order,
+            mtime_ns,
+            size,
+        ) = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or version != VERSION or layout != _LAYOUT_CRC:
+            raise ValueError(f"Неподдерживаемый формат снимка: {self.path}")
+        self.source = (mtime_ns, size)
+        self.from_db = bool(flags & _FLAG_FROM_DB)
+
+        view = memoryview(self._mmap)
+        offset = _HEADER_SIZE
+
+        def take(typecode: str, count: int) -> memoryview:
+            nonlocal offset
+            nbytes = struct.calcsize(typecode) * count
+            column = view[offset : offset + nbytes].cast(typecode)
+            offset += _aligned(nbytes)
+            return column
+
+        n = self.n_rows
+        self._kinds = {name: take("B", n) for name in _KIND_FIELDS}
+        self._ints = {name: take("q", n) for name in _INT_FIELDS}
+        self._floats = {name: take("d", n) for name in _FLOAT_FIELDS}
+        self._texts = {name: take("I", n) for name in _STRING_FIELDS}
+        self._id_order = take("I", n_id_order)
+        self._code_order = take("I", n_code_order)
+        self._dept_order = take("I", n_dept_order)
+        self._offsets = take("Q", n_strings + 1)
+        self._blob = view[offset:]
+        if len(self._blob) < self._offsets[-1]:
+            raise ValueError(f"Снимок повреждён: {self.path}")
+        self._strings: dict[int, str] = {}
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    def column(self, name: str) -> memoryview:
+        """Числовая колонка без копирования (например, для np.frombuffer)."""
+        if name in self._ints:
+            return self._ints[name]
+        if name in self._floats:
+            return self._floats[name]
+        raise KeyError(name)
+
+    def string(self, idx: int) -> str:
+        value = self._strings.get(idx)
+        if value is None:
+            start, end = self._offsets[idx], self._offsets[idx + 1]
+            value = self._strings[idx] = str(self._blob[start:end], "utf-8")
+        return value
+
+    def is_active(self, row: int) -> bool:
+        """is_active строки (отсутствующее поле считается True, как в JSON)."""
+        return self._kinds["is_active"][row] != _FALSE
+
+    def row(self, row: int) -> dict[str, Any]:
+        """Запись строки row в формате employees.json."""
+        record: dict[str, Any] = {}
+        for name, kinds in self._kinds.items():
+            kind = kinds[row]
+            if kind == _ABSENT:
+                continue
+            if kind == _NONE:
+                record[name] = None
+            elif kind == _INT:
+                value = self._ints[name][row] if name in self._ints else self._floats[name][row]
+                record[name] = int(value)
+            elif kind == _FLOAT:
+                record[name] = self._floats[name][row]
+            else:
+                record[name] = kind == _TRUE
+        for name, column in self._texts.items():
+            idx = column[row]
+            if idx == _STR_ABSENT:
+                continue
+            if name == "_extra":
+                record.update(json.loads(self.string(idx)))
+            else:
+                record[name] = None if idx == _STR_NONE else self.string(idx)
+        return record
+
+    def find_id(self, employee_id: Any) -> int | None:
+        """Первая строка с данным id (двоичный поиск) или None."""
+        if type(employee_id) is not int:
+            return None
+        ids = self._ints["id"]
+        order = self._id_order
+        pos = bisect.bisect_left(order, employee_id, key=ids.__getitem__)
+        if pos < len(order) and ids[order[pos]] == employee_id:
+            return order[pos]
+        return None
+
+    def find_code(self, employee_code: str) -> int | None:
+        """Первая строка с данным employee_code (двоичный поиск) или None."""
+        codes = self._texts["employee_code"]
+        order = self._code_order
+        pos = bisect.bisect_left(order, employee_code, key=lambda r: self.string(codes[r]))
+        if pos < len(order) and self.string(codes[order[pos]]) == employee_code:
+            return order[pos]
+        return None
+
+    def rows_in_department(self, department_id: Any) -> memoryview:
+        """Строки отдела в порядке списка — срез таблицы dept order (двоичный поиск)."""
+        order = self._dept_order
+        if type(department_id) is not int:
+            return order[:0]
+        column = self._ints["department_id"]
+        start = bisect.bisect_left(order, department_id, key=column.__getitem__)
+        stop = bisect.bisect_right(order, department_id, lo=start, key=column.__getitem__)
+        return order[start:stop]
+
+
+class SnapshotRoster:
+    """
+    Ростер поверх снимка с интерфейсом RosterIndex (employees, get,
+    get_by_code, in_department).
+
+    Поиск по id и коду декодирует одну строку; полный список сотрудников
+    строится только при первом обращении к employees.
+    """
+
+    def __init__(self, snapshot: Snapshot, active_only: bool = False) -> None:
+        self.snapshot = snapshot
+        self.active_only = active_only
+        if active_only:
+            self.rows: Any = [r for r in range(len(snapshot)) if snapshot.is_active(r)]
+        else:
+            self.rows = range(len(snapshot))
+        self._employees: list[EmployeeRecord] | None = None
+        self._decoded: dict[int, EmployeeRecord] = {}
+        self._pool: dict[Any, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _decode(self, row: int) -> EmployeeRecord:
+        # Одна строка — один объект, как у RosterIndex (поиск по id и коду совпадает)
+        record = self._decoded.get(row)
+        if record is None:
+            record = self._decoded[row] = EmployeeRecord(self.snapshot.row(row), self._pool)
+        return record
+
+    def _record(self, row: int | None) -> EmployeeRecord | None:
+        if row is None or (self.active_only and not self.snapshot.is_active(row)):
+            return None
+        return self._decode(row)
+
+    @property
+    def employees(self) -> list[EmployeeRecord]:
+        if self._employees is None:
+            self._employees = [self._decode(r) for r in self.rows]
+        return self._employees
+
+    def get(self, employee_id: Any) -> EmployeeRecord | None:
+        """Сотрудник по id."""
+        return self._record(self.snapshot.find_id(employee_id))
+
+    def get_by_code(self, employee_code: str) -> EmployeeRecord | None:
+        """Сотрудник по табельному коду (employee_code)."""
+        return self._record(self.snapshot.find_code(employee_code))
+
+    def in_department(self, department_id: Any) -> list[EmployeeRecord]:
+        """Сотрудники отдела в порядке списка."""
+        found = (self._record(r) for r in self.snapshot.rows_in_department(department_id))
+        return [emp for emp in found if emp is not None]
+
+    def page(
+        self, offset: int = 0, limit: int | None = None, department_id: Any = None
+    ) -> list[EmployeeRecord]:
+        """
+        Окно списка (всего штата или отдела): limit записей начиная с offset.
+        Декодируются только строки окна — полный список не строится.
+        """
+        stop = None if limit is None else offset + limit
+        if department_id is None:
+            if self._employees is not None:
+                return self._employees[offset:stop]
+            return [self._decode(r) for r in self.rows[offset:stop]]
+        rows = self.snapshot.rows_in_department(department_id)
+        if self.active_only:
+            rows = [r for r in rows if self.snapshot.is_active(r)]
+        return [self._decode(r) for r in rows[offset:stop]]
+
+
+def _open_fresh(json_path: Path) -> Snapshot:
+    """
+    Открыть снимок JSON-файла, пересобрав его, если JSON изменился.
+    Снимок из БД на месте снимка JSON тоже пересобирается из JSON.
+    """
+    st = os.stat(json_path)
+    source = (st.st_mtime_ns, st.st_size)
+    path = snapshot_path(json_path)
+    try:
+        snapshot = Snapshot(path)
+        if not snapshot.from_db and snapshot.source == source:
+            return snapshot
+    except (OSError, ValueError) as e:
+        logger.debug("Снимок %s недоступен (%s), собираем заново", path, e)
+    n = build_snapshot(iter_employee_records(json_path, active_only=False), path, source)
+    logger.info("Собран снимок %s: %s сотрудников", path, n)
+    return Snapshot(path)
+
+
+def load_roster(json_path: Path, active_only: bool = False) -> SnapshotRoster | None:
+    """
+    Ростер из снимка JSON-файла (BALANSOFT_SNAPSHOT=0 отключает снимки).
+
+    Returns:
+        SnapshotRoster или None — снимки отключены, JSON нет или он повреждён,
+        снимок нельзя записать; тогда вызывающий читает JSON как обычно.
+    """
+    if not _snapshots_enabled():
+        return None
+    try:
+        return SnapshotRoster(_open_fresh(Path(json_path)), active_only=active_only)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Снимок не используется: %s", e)
+        return None
+
+
+def load_db_roster(path: Path, version: Any, active_only: bool = True) -> SnapshotRoster | None:
+    """
+    Ростер из снимка БД, если он собран при той же версии roster_version.
+
+    Returns:
+        SnapshotRoster или None — снимки отключены, файла нет, он повреждён,
+        собран из JSON или при другой версии штата; тогда читается БД.
+    """
+    if not _snapshots_enabled():
+        return None
+    try:
+        snapshot = Snapshot(path)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug("Снимок БД не используется: %s", e)
+        return None
+    if not snapshot.from_db or snapshot.source != (version, 0):
+        return None
+    return SnapshotRoster(snapshot, active_only=active_only)
+
+
+def build_db_snapshot(path: Path, batch_size: int = 5000) -> int:
+    """
+    Собрать снимок из БД: все сотрудники (включая неактивных, как в JSON),
+    с пометкой «из БД» и текущей версией roster_version — в одной транзакции.
+
+    Raises:
+        RuntimeError: БД не настроена или недоступна (без перехода на JSON).
+    """
+    from database.health import db_available
+    from database.session import SessionLocal
+
+    if SessionLocal is None or not db_available():
+        raise RuntimeError("БД не настроена или недоступна: снимок из БД не собран")
+
+    from application.db.queries import employee_query, roster_version_query, row_converter
+
+    db = SessionLocal()
+    try:
+        version = db.execute(roster_version_query()).scalar()
+        if version is None:
+            raise RuntimeError("В БД нет счётчика roster_version: примените миграции")
+        stmt = employee_query("full", active=None).execution_options(yield_per=batch_size)
+        convert = row_converter("full")
+        records = (convert(row) for row in db.execute(stmt))
+        return build_snapshot(records, path, (version, 0), from_db=True)
+    finally:
+        db.close()
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Сборка бинарного снимка сотрудников")
+    parser.add_argument("--from-db", action="store_true", help="собрать из БД, а не из JSON")
+    parser.add_argument("--output", type=Path, help="файл снимка")
+    args = parser.parse_args()
+
+    from application.db.people import _get_json_path
+
+    json_path = _get_json_path()
+    if args.from_db:
+        output = args.output or db_snapshot_path(json_path)
+        try:
+            n = build_db_snapshot(output)
+        except RuntimeError as e:
+            parser.exit(1, f"Ошибка: {e}\n")
+    else:
+        output = args.output or snapshot_path(json_path)
+        st = os.stat(json_path)
+        records = iter_employee_records(json_path, active_only=False)
+        n = build_snapshot(records, output, (st.st_mtime_ns, st.st_size))
+    print(f"OK: {n} сотрудников → {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,335 @@
+"""Streaming export of payroll results to CSV, Parquet (pyarrow) and XLSX (openpyxl)."""
+
+__all__ = [
+    "PAYROLL_COLUMNS",
+    "MONEY_COLUMNS",
+    "write_csv",
+    "write_parquet",
+    "write_xlsx",
+    "export_payroll",
+]
+
+import argparse
+import csv
+import itertools
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from decimal import Decimal
+from operator import itemgetter
+from pathlib import Path
+from typing import Any
+
+from application.metrics import inc, stage
+from utils.files import default_file_mode
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+try:
+    from openpyxl import Workbook
+except ImportError:
+    Workbook = None
+
+logger = logging.getLogger(__name__)
+
+# Колонки выгрузки по умолчанию (ключи результата iter_payroll())
+PAYROLL_COLUMNS = (
+    "employee_id",
+    "employee_code",
+    "employee_name",
+    "department_id",
+    "department",
+    "base_salary",
+    "tax_deduction",
+    "ndfl",
+    "special_deduction",
+    "net_salary",
+)
+MONEY_COLUMNS = frozenset(
+    ("base_salary", "tax_deduction", "ndfl", "special_deduction", "net_salary")
+)
+
+# Строк в одной группе строк Parquet
+DEFAULT_ROW_GROUP_SIZE = 100_000
+
+FORMATS = ("csv", "parquet", "xlsx")
+
+
+# Разделитель значений внутри строки денежных колонок (не встречается в числах)
+_SEP = "\x1f"
+
+
+def _money_text(value: Any, decimal_separator: str) -> str:
+    """One amount with two decimals (slow path for None and mixed types)."""
+    if value is None:
+        return ""
+    text = str(value) if isinstance(value, Decimal) else "%.2f" % value
+    return text.replace(".", decimal_separator)
+
+
+def _tuple_getter(keys: Sequence[Any]) -> Callable[[Any], tuple[Any, ...]]:
+    """itemgetter that always returns a tuple (itemgetter of one key returns the value)."""
+    if len(keys) == 1:
+        key = keys[0]
+        return lambda item: (item[key],)
+    if not keys:
+        return lambda item: ()
+    return itemgetter(*keys)
+
+
+def _csv_rows(
+    results: Iterable[dict[str, Any]],
+    columns: Sequence[str],
+    decimal_separator: str,
+    counter: list[int],
+) -> Iterator[Sequence[Any]]:
+    """
+    CSV rows with amounts formatted in bulk; counter[0] counts the rows.
+
+    All amounts of a row are rendered by one %-format into one string (%.2f
+    for float results, str() for Decimal ones, which already carry two
+    places), the decimal separator is swapped with one str.translate per
+    row, and the cells are taken with itemgetter. No per-cell Python
+    formatting or str.replace on the hot path; results missing a column
+    go through the slow path.
+    """
+    text_columns = [c for c in columns if c not in MONEY_COLUMNS]
+    money_columns = [c for c in columns if c in MONEY_COLUMNS]
+    get_text = _tuple_getter(text_columns)
+    get_money = _tuple_getter(money_columns)
+    # Порядок колонок, если суммы идут не после всех текстовых колонок
+    position = {c: i for i, c in enumerate((*text_columns, *money_columns))}
+    order = [position[c] for c in columns]
+    arrange = None if order == sorted(order) else itemgetter(*order)
+    translate = str.maketrans(".", decimal_separator)
+    template = None
+    count = 0
+    for result in results:
+        count += 1
+        try:
+            text = get_text(result)
+            money = get_money(result)
+        except KeyError:
+            text = tuple(result.get(c) for c in text_columns)
+            money = tuple(result.get(c) for c in money_columns)
+        if template is None and money:
+            spec = "%s" if isinstance(money[0], Decimal) else "%.2f"
+            template = _SEP.join([spec] * len(money))
+        try:
+            cells = (template % money).translate(translate).split(_SEP) if money else []
+        except TypeError:
+            cells = [_money_text(value, decimal_separator) for value in money]
+        row = [*text, *cells]
+        yield row if arrange is None else arrange(row)
+    counter[0] = count
+
+
+def _batches(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    iterator = iter(items)
+    while batch := list(itertools.islice(iterator, size)):
+        yield batch
+
+
+def _atomic_path(path: Path) -> tuple[Path, Callable[[], None], Callable[[], None]]:
+    """Temp file next to path with commit (os.replace) and rollback callbacks."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    os.close(fd)
+
+    def commit() -> None:
+        # mkstemp creates 0o600; the export gets the mode open() would give it
+        os.chmod(tmp, default_file_mode())
+        os.replace(tmp, path)
+
+    return Path(tmp), commit, lambda: os.unlink(tmp)
+
+
+def write_csv(
+    results: Iterable[dict[str, Any]],
+    path: Path | str,
+    columns: Sequence[str] = PAYROLL_COLUMNS,
+    delimiter: str = ";",
+    decimal_separator: str = ",",
+) -> int:
+    """
+    Write payroll results to CSV as they arrive.
+
+    The defaults (";" between fields, "," in amounts, UTF-8 with BOM) open
+    correctly in Russian-locale spreadsheets. Rows are formatted and written
+    one by one through the buffered file, so memory does not depend on the
+    number of results.
+
+    Returns:
+        Number of rows written.
+    """
+    counter = [0]
+    tmp, commit, rollback = _atomic_path(Path(path))
+    try:
+        with stage("export", format="csv"), open(
+            tmp, "w", encoding="utf-8-sig", newline=""
+        ) as f:
+            writer = csv.writer(f, delimiter=delimiter)
+            writer.writerow(columns)
+            writer.writerows(_csv_rows(results, columns, decimal_separator, counter))
+        commit()
+    except BaseException:
+        rollback()
+        raise
+    count = counter[0]
+    inc("balansoft_export_rows_total", count, format="csv")
+    return count
+
+
+def _require_pyarrow() -> None:
+    if pa is None:
+        raise RuntimeError("pyarrow не установлен. pip install pyarrow")
+
+
+def _parquet_schema(columns: Sequence[str], exact: bool) -> "pa.Schema":
+    money = pa.decimal128(18, 2) if exact else pa.float64()
+    types = {"employee_id": pa.int64(), "department_id": pa.int64()}
+    return pa.schema(
+        [
+            (column, money if column in MONEY_COLUMNS else types.get(column, pa.string()))
+            for column in columns
+        ]
+    )
+
+
+def write_parquet(
+    results: Iterable[dict[str, Any]],
+    path: Path | str,
+    columns: Sequence[str] = PAYROLL_COLUMNS,
+    exact: bool | None = None,
+    row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+) -> int:
+    """
+    Write payroll results to Parquet one row group at a time (requires pyarrow).
+
+    Amounts are decimal(18, 2) for exact (Decimal) results and float64
+    otherwise; exact=None detects the mode from the first result. At most
+    one row group is held in memory.
+
+    Returns:
+        Number of rows written.
+    """
+    _require_pyarrow()
+    batches = _batches(results, row_group_size)
+    first = next(batches, [])
+    if exact is None:
+        exact = bool(first) and isinstance(first[0].get("net_salary"), Decimal)
+    schema = _parquet_schema(columns, exact)
+    count = 0
+    tmp, commit, rollback = _atomic_path(Path(path))
+    try:
+        with stage("export", format="parquet"), pq.ParquetWriter(tmp, schema) as writer:
+            for batch in itertools.chain((first,), batches):
+                data = {column: [result.get(column) for result in batch] for column in columns}
+                writer.write_table(pa.Table.from_pydict(data, schema=schema))
+                count += len(batch)
+        commit()
+    except BaseException:
+        rollback()
+        raise
+    inc("balansoft_export_rows_total", count, format="parquet")
+    return count
+
+
+def write_xlsx(
+    results: Iterable[dict[str, Any]],
+    path: Path | str,
+    columns: Sequence[str] = PAYROLL_COLUMNS,
+    sheet_title: str = "Ведомость",
+) -> int:
+    """
+    Write payroll results to XLSX in openpyxl write-only mode (requires openpyxl).
+
+    Rows are streamed to the file; amounts stay numeric cells.
+
+    Returns:
+        Number of rows written.
+    """
+    if Workbook is None:
+        raise RuntimeError("openpyxl не установлен. pip install openpyxl")
+    get_row = _tuple_getter(columns)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    sheet.append(list(columns))
+    count = 0
+    tmp, commit, rollback = _atomic_path(Path(path))
+    try:
+        with stage("export", format="xlsx"):
+            for result in results:
+                sheet.append(get_row(result))
+                count += 1
+            workbook.save(tmp)
+        commit()
+    except BaseException:
+        rollback()
+        raise
+    inc("balansoft_export_rows_total", count, format="xlsx")
+    return count
+
+
+def _detect_format(path: Path, fmt: str | None) -> str:
+    fmt = fmt or path.suffix.lstrip(".").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Неизвестный формат выгрузки: {fmt!r} (ожидается {', '.join(FORMATS)})")
+    return fmt
+
+
+def export_payroll(
+    path: Path | str,
+    fmt: str | None = None,
+    employee_ids: Iterable[int] | None = None,
+    exact: bool = False,
+    columns: Sequence[str] = PAYROLL_COLUMNS,
+) -> int:
+    """
+    Calculate the payroll and stream it into a file.
+
+    Args:
+        path: output file; the format is taken from its suffix unless fmt is given.
+        fmt: "csv", "parquet" or "xlsx".
+        employee_ids: IDs to export; None means every active employee.
+        exact: calculate in integer kopecks (Parquet amounts become decimal).
+        columns: result keys to export, PAYROLL_COLUMNS by default.
+
+    Returns:
+        Number of rows written.
+    """
+    from application.salary import iter_payroll
+
+    path = Path(path)
+    fmt = _detect_format(path, fmt)
+    results = iter_payroll(employee_ids, exact=exact)
+    if fmt == "csv":
+        count = write_csv(results, path, columns)
+    elif fmt == "parquet":
+        count = write_parquet(results, path, columns, exact=exact)
+    else:
+        count = write_xlsx(results, path, columns)
+    logger.info("Выгружено строк: %s (%s)", count, path)
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Выгрузка расчётной ведомости в файл")
+    parser.add_argument("output", type=Path, help="файл .csv, .parquet или .xlsx")
+    parser.add_argument("--format", choices=FORMATS, help="формат (по умолчанию — по расширению)")
+    parser.add_argument("--exact", action="store_true", help="расчёт в копейках (Decimal)")
+    parser.add_argument("--ids", type=int, nargs="+", help="только указанные сотрудники")
+    args = parser.parse_args()
+
+    count = export_payroll(args.output, args.format, args.ids, exact=args.exact)
+    print(f"Выгружено строк: {count} → {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""Lightweight hot-path instrumentation: stage timings, counters and histograms."""
+
+__all__ = [
+    "Metrics",
+    "metrics",
+    "stage",
+    "inc",
+    "observe",
+    "export_prometheus",
+    "export_json",
+    "write_metrics",
+]
+
+import atexit
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Границы гистограмм по умолчанию (секунды): от долей миллисекунды до минуты
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 60.0)
+
+# Имя гистограммы длительности этапов (метка stage)
+STAGE_METRIC = "balansoft_stage_seconds"
+
+_HELP = {
+    STAGE_METRIC: "Duration of data loading and calculation stages",
+    "balansoft_source_total": "Employee lists served, by source (db, json, fallback)",
+    "balansoft_fallback_total": "Source skipped for the next one, by source and reason",
+    "balansoft_rows_loaded_total": "Employee records loaded from a source (cache misses)",
+    "balansoft_db_errors_total": "Database errors that opened the circuit breaker",
+    "balansoft_salary_calculations_total": "Employee salaries calculated",
+    "balansoft_salary_memo_total": "Memoized salary lookups, by result (hit, miss)",
+}
+
+LabelKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def _key(name: str, labels: dict[str, Any]) -> LabelKey:
+    if not labels:
+        return name, ()
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class _Histogram:
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # последний — +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        total = 0
+        result = []
+        for bound, count in zip((*self.bounds, math.inf), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class _Stage:
+    """Context manager timing one stage into the stage histogram."""
+
+    __slots__ = ("_metrics", "_key", "_start")
+
+    def __init__(self, metrics: "Metrics", key: LabelKey) -> None:
+        self._metrics = metrics
+        self._key = key
+
+    def __enter__(self) -> "_Stage":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self._metrics._observe(self._key, time.perf_counter() - self._start)
+
+
+class _NoStage:
+    """Shared no-op stage used while metrics are disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoStage":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        return None
+
+
+_NO_STAGE = _NoStage()
+
+
+class Metrics:
+    """
+    In-process registry of counters and histograms.
+
+    While disabled every call returns after a single attribute check, so the
+    instrumentation can stay on the hot paths. Labels are keyword arguments;
+    values are converted to strings.
+    """
+
+    def __init__(self, enabled: bool = False, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.enabled = enabled
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: dict[LabelKey, float] = {}
+        self._histograms: dict[LabelKey, _Histogram] = {}
+
+    def stage(self, name: str, **labels: Any) -> _Stage | _NoStage:
+        """Time a block: ``with metrics.stage("json_parse"): ...``."""
+        if not self.enabled:
+            return _NO_STAGE
+        labels["stage"] = name
+        return _Stage(self, _key(STAGE_METRIC, labels))
+
+    def inc(self, name: str, value: float = 1, **labels: Any) -> None:
+        """Add value to a counter."""
+        if not self.enabled:
+            return
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record a value in a histogram."""
+        if self.enabled:
+            self._observe(_key(name, labels), value)
+
+    def _observe(self, key: LabelKey, value: float) -> None:
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(self.buckets)
+            histogram.observe(value)
+
+    def reset(self) -> None:
+        """Drop all recorded values."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def export_json(self) -> dict[str, Any]:
+        """Counters and histograms as a JSON-serializable dict."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": h.count,
+                    "sum": h.sum,
+                    "buckets": {
+                        "+Inf" if math.isinf(bound) else repr(bound): count
+                        for bound, count in h.cumulative()
+                    },
+                }
+                for (name, labels), h in sorted(self._histograms.items())
+            ]
+        return {"counters": counters, "histograms": histograms}
+
+    def export_prometheus(self) -> str:
+        """Counters and histograms in the Prometheus text exposition format."""
+        lines: list[str] = []
+        seen: set[str] = set()
+
+        def header(name: str, kind: str) -> None:
+            if name in seen:
+                return
+            seen.add(name)
+            if name in _HELP:
+                lines.append(f"# HELP {name} {_HELP[name]}")
+            lines.append(f"# TYPE {name} {kind}")
+
+        with self._lock:
+            for (name, labels), value in sorted(self._counters.items()):
+                header(name, "counter")
+                lines.append(f"{name}{_labels(labels)} {_number(value)}")
+            for (name, labels), h in sorted(self._histograms.items()):
+                header(name, "histogram")
+                for bound, count in h.cumulative():
+                    le = "+Inf" if math.isinf(bound) else repr(bound)
+                    lines.append(f"{name}_bucket{_labels((*labels, ('le', le)))} {count}")
+                lines.append(f"{name}_sum{_labels(labels)} {_number(h.sum)}")
+                lines.append(f"{name}_count{_labels(labels)} {h.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+
+def _labels(labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return ""
+    parts = []
+    for k, v in labels:
+        v = v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{k}="{v}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+# Общий реестр процесса; включается BALANSOFT_METRICS=1 или metrics.enabled = True
+metrics = Metrics(enabled=os.getenv("BALANSOFT_METRICS", "0") not in ("", "0"))
+
+stage = metrics.stage
+inc = metrics.inc
+observe = metrics.observe
+export_prometheus = metrics.export_prometheus
+export_json = metrics.export_json
+
+
+def write_metrics(path: Path | str) -> None:
+    """Write the shared registry to a file: JSON for *.json, Prometheus text otherwise."""
+    path = Path(path)
+    if path.suffix == ".json":
+        path.write_text(json.dumps(export_json(), ensure_ascii=False, indent=2), encoding="utf-8")
+    else:
+        path.write_text(export_prometheus(), encoding="utf-8")
+
+
+def _write_at_exit(path: str) -> None:
+    try:
+        write_metrics(path)
+    except OSError as e:
+        logger.warning("Метрики не записаны в %s: %s", path, e)
+
+
+# BALANSOFT_METRICS_FILE — сбросить метрики в файл при завершении процесса
+# (например, для node_exporter textfile collector)
+_metrics_file = os.getenv("BALANSOFT_METRICS_FILE")
+if metrics.enabled and _metrics_file:
+    atexit.register(_write_at_exit, _metrics_file)
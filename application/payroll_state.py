@@ -0,0 +1,327 @@
+"""Persisted payroll results with incremental recalculation of changed employees."""
+
+__all__ = ["PayrollState", "record_hash"]
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from pathlib import Path
+from typing import Any
+
+from utils.files import default_file_mode
+from utils.money import from_kopecks, to_kopecks
+
+logger = logging.getLogger(__name__)
+
+# Поля записи, от которых зависит результат расчёта и его место в итогах
+_INPUT_FIELDS = (
+    "id",
+    "full_name",
+    "department_id",
+    "department",
+    "base_salary",
+    "tax_deduction",
+    "special_conditions",
+    "is_active",
+)
+_TOTAL_FIELDS = ("base_salary", "ndfl", "special_deduction", "net_salary")
+_MONEY_FIELDS = (*_TOTAL_FIELDS, "tax_deduction")
+
+FORMAT_VERSION = 1
+
+
+def record_hash(employee: dict[str, Any]) -> str:
+    """Stable hash of the salary-relevant fields of an employee record."""
+    values = [employee.get(name) for name in _INPUT_FIELDS]
+    encoded = json.dumps(values, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(encoded.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _rule_version() -> str:
+    """
+    Calculation rules the stored results depend on (a change forces a full
+    recalculation): the salary memo's rules_version(), NDFL rate and deduction
+    types generation.
+    """
+    from application.salary_memo import rules_version
+
+    return repr(rules_version())
+
+
+class _Entry:
+    __slots__ = ("hash", "result", "department_id", "department", "version", "kopecks")
+
+    def __init__(
+        self,
+        hash: str,
+        result: dict[str, Any],
+        department_id: Any,
+        department: str,
+        version: int,
+    ) -> None:
+        self.hash = hash
+        self.result = result
+        self.department_id = department_id
+        self.department = department
+        self.version = version
+        self.kopecks = tuple(to_kopecks(result[field]) for field in _TOTAL_FIELDS)
+
+
+class PayrollState:
+    """
+    Payroll results of the current period with department and company totals.
+
+    Each employee's result is stored with the hash of the record it was
+    calculated from. A correction recalculates only the changed employees and
+    patches the aggregates: the old contribution is subtracted and the new one
+    added. Totals are kept in integer kopecks, so patching never drifts.
+
+    Changes are found either from an explicit dirty set (mark_dirty() +
+    recalculate(), O(changed)) or by diffing record hashes against the
+    current roster (sync(): hashing is O(all), calculation O(changed)).
+    Every recalculation bumps the state version; entries remember the
+    version they were calculated in.
+    """
+
+    def __init__(self, exact: bool = False) -> None:
+        self.exact = exact
+        self.version = 0
+        self.rule = _rule_version()
+        self._entries: dict[Any, _Entry] = {}
+        self._departments: dict[Any, dict[str, Any]] = {}
+        self._totals = self._empty()
+        self._dirty: set[Any] = set()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _empty() -> dict[str, Any]:
+        return {"headcount": 0, "kopecks": [0] * len(_TOTAL_FIELDS)}
+
+    def _calculate(self, employee: dict[str, Any]) -> dict[str, Any]:
+        from utils import salary_calculator
+
+        if self.exact:
+            return salary_calculator.calculate_employee_salary_exact(employee)
+        return salary_calculator.calculate_employee_salary(employee)
+
+    def _add(self, entry: _Entry, sign: int) -> None:
+        dept = self._departments.get(entry.department_id)
+        if dept is None:
+            dept = self._departments[entry.department_id] = self._empty()
+            dept["department"] = entry.department
+        for bucket in (dept, self._totals):
+            bucket["headcount"] += sign
+            kopecks = bucket["kopecks"]
+            for i, value in enumerate(entry.kopecks):
+                kopecks[i] += sign * value
+        if dept["headcount"] == 0:
+            del self._departments[entry.department_id]
+
+    def _store(self, employee_id: Any, entry: _Entry | None) -> None:
+        if entry is None:
+            old = self._entries.pop(employee_id, None)
+        else:
+            old = self._entries.get(employee_id)
+        if old is not None:
+            self._add(old, -1)
+        if entry is not None:
+            self._entries[employee_id] = entry
+            self._add(entry, +1)
+
+    def _begin(self) -> None:
+        rule = _rule_version()
+        if rule != self.rule:
+            # Правила расчёта изменились — все результаты в состоянии устарели
+            self.rule = rule
+            for entry in self._entries.values():
+                entry.hash = ""
+            self._dirty.update(self._entries)
+        self.version += 1
+
+    def _apply(self, employee: dict[str, Any], digest: str | None = None) -> None:
+        employee_id = employee.get("id")
+        if not employee.get("is_active", True):
+            self._store(employee_id, None)
+            return
+        entry = _Entry(
+            digest or record_hash(employee),
+            self._calculate(employee),
+            employee.get("department_id"),
+            employee.get("department", ""),
+            self.version,
+        )
+        self._store(employee_id, entry)
+
+    def apply(self, employees: Iterable[dict[str, Any]]) -> int:
+        """Recalculate the given (changed or new) employees; inactive ones are removed."""
+        self._begin()
+        count = 0
+        for employee in employees:
+            self._apply(employee)
+            self._dirty.discard(employee.get("id"))
+            count += 1
+        return count
+
+    def remove(self, employee_ids: Iterable[Any]) -> int:
+        """Drop employees from the results (dismissed or deleted)."""
+        self._begin()
+        count = 0
+        for employee_id in employee_ids:
+            if employee_id in self._entries:
+                self._store(employee_id, None)
+                count += 1
+            self._dirty.discard(employee_id)
+        return count
+
+    def mark_dirty(self, employee_ids: Iterable[Any]) -> None:
+        """Remember employees whose records changed; recalculate() picks them up."""
+        self._dirty.update(employee_ids)
+
+    @property
+    def dirty(self) -> frozenset[Any]:
+        return frozenset(self._dirty)
+
+    def recalculate(self, lookup: Callable[[Any], dict[str, Any] | None]) -> int:
+        """
+        Recalculate the dirty set only.
+
+        Args:
+            lookup: employee record by id (e.g. RosterIndex.get); None means
+                the employee no longer exists and is removed.
+
+        Returns:
+            Number of employees recalculated or removed.
+        """
+        self._begin()
+        dirty, self._dirty = self._dirty, set()
+        for employee_id in dirty:
+            employee = lookup(employee_id)
+            if employee is None:
+                self._store(employee_id, None)
+            else:
+                self._apply(employee)
+        return len(dirty)
+
+    def sync(self, employees: Iterable[dict[str, Any]]) -> int:
+        """
+        Bring the results in line with the full roster by comparing record hashes.
+
+        Only new and changed employees are recalculated; employees missing
+        from the roster are removed.
+
+        Returns:
+            Number of employees recalculated or removed.
+        """
+        self._begin()
+        seen: set[Any] = set()
+        changed = 0
+        for employee in employees:
+            employee_id = employee.get("id")
+            seen.add(employee_id)
+            digest = record_hash(employee)
+            entry = self._entries.get(employee_id)
+            if entry is not None and entry.hash == digest:
+                continue
+            if entry is None and not employee.get("is_active", True):
+                continue
+            self._apply(employee, digest)
+            changed += 1
+        for employee_id in [i for i in self._entries if i not in seen]:
+            self._store(employee_id, None)
+            changed += 1
+        self._dirty.clear()
+        return changed
+
+    def _money(self, kopecks: int) -> Any:
+        return from_kopecks(kopecks) if self.exact else kopecks / 100
+
+    def _bucket(self, bucket: dict[str, Any]) -> dict[str, Any]:
+        result: dict[str, Any] = {"headcount": bucket["headcount"]}
+        for field, kopecks in zip(_TOTAL_FIELDS, bucket["kopecks"]):
+            result[field] = self._money(kopecks)
+        return result
+
+    def payroll(self) -> dict[str, Any]:
+        """Results and totals in the calculate_payroll() format."""
+        departments = {}
+        for dept_id, bucket in self._departments.items():
+            dept = self._bucket(bucket)
+            dept["department_id"] = dept_id
+            dept["department"] = bucket["department"]
+            departments[dept_id] = dept
+        return {
+            "results": [entry.result for entry in self._entries.values()],
+            "departments": departments,
+            "totals": self._bucket(self._totals),
+            "not_found": [],
+            "version": self.version,
+        }
+
+    def entry_version(self, employee_id: Any) -> int | None:
+        """State version in which the employee's result was last calculated."""
+        entry = self._entries.get(employee_id)
+        return None if entry is None else entry.version
+
+    def save(self, path: Path | str) -> None:
+        """Write the state to a JSON file (atomically: temp file + os.replace)."""
+        path = Path(path)
+        data = {
+            "format": FORMAT_VERSION,
+            "rule": self.rule,
+            "exact": self.exact,
+            "version": self.version,
+            "entries": [
+                [entry.hash, entry.version, entry.department_id, entry.department, entry.result]
+                for entry in self._entries.values()
+            ],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, default=str)
+            os.chmod(tmp, default_file_mode())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: Path | str, exact: bool = False) -> "PayrollState":
+        """
+        Read a saved state; aggregates are rebuilt from the stored results.
+
+        A missing or unreadable file, another money mode or changed
+        calculation rules give an empty state (the next sync() is a full run).
+        """
+        state = cls(exact=exact)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return state
+        except (OSError, ValueError) as e:
+            logger.warning("Состояние расчёта не прочитано, полный пересчёт: %s", e)
+            return state
+        if (
+            data.get("format") != FORMAT_VERSION
+            or data.get("rule") != state.rule
+            or data.get("exact") != exact
+        ):
+            logger.info("Состояние расчёта устарело (формат, правила или режим), полный пересчёт")
+            return state
+
+        state.version = data["version"]
+        for digest, version, dept_id, department, result in data["entries"]:
+            if exact:
+                for field in _MONEY_FIELDS:
+                    result[field] = Decimal(result[field])
+            entry = _Entry(digest, result, dept_id, department, version)
+            state._store(result["employee_id"], entry)
+        return state
@@ -1,35 +1,110 @@
 """Module for salary calculation."""
 
-__all__ = ["calculate_salary"]
+__all__ = [
+    "calculate_salary",
+    "calculate_salary_async",
+    "calculate_payroll",
+    "iter_payroll",
+    "calculate_annual_payroll",
+    "update_payroll",
+    "load_tariff_grid",
+    "validate_roster",
+]
 
 import json
 import logging
+import os
+from collections.abc import Iterable, Iterator
+from decimal import Decimal
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from application.db.cache import json_marker, roster_cache
+from application.db.index import RosterIndex
+from application.db.snapshot import SnapshotRoster, load_roster
+from application.metrics import inc, stage
+
+if TYPE_CHECKING:
+    from application.salary_memo import SalaryMemo
+    from utils.salary_rules import TariffGrid
 
 logger = logging.getLogger(__name__)
 
+# Суммируемые поля результата расчёта (итоги по отделам и компании)
+_TOTAL_FIELDS = ("base_salary", "ndfl", "special_deduction", "net_salary")
+
 
 def _get_data_path() -> Path:
-    """Get path to employees JSON file."""
+    """Get path to employees JSON file (BALANSOFT_EMPLOYEES_JSON overrides)."""
+    override = os.getenv("BALANSOFT_EMPLOYEES_JSON")
+    if override:
+        return Path(override)
     return Path(__file__).resolve().parent.parent / "data" / "employees.json"
 
 
-def _load_employee_by_id(employee_id: int) -> dict[str, Any] | None:
-    """Load employee by ID from JSON."""
+def _load_index() -> RosterIndex | SnapshotRoster:
+    """Index over all employee records from JSON (cached until the file changes)."""
     data_path = _get_data_path()
+    marker = json_marker(data_path)
+    return roster_cache.get(("json", "all"), marker, lambda: _build_index(data_path))
+
+
+def _build_index(data_path: Path) -> RosterIndex | SnapshotRoster:
+    """Roster from the binary snapshot; parse the JSON if snapshots are unavailable."""
+    with stage("snapshot_open"):
+        roster = load_roster(data_path)
+    if roster is not None:
+        inc("balansoft_rows_loaded_total", len(roster), source="snapshot")
+        return roster
+    employees = _read_employees(data_path)
+    with stage("row_conversion", source="json"):
+        index = RosterIndex(employees, compact=True)
+    inc("balansoft_rows_loaded_total", len(index), source="json")
+    return index
+
+
+def _load_employees() -> list[dict[str, Any]]:
+    """Load all employee records from JSON."""
+    return _load_index().employees
+
+
+def _read_employees(data_path: Path) -> list[dict[str, Any]]:
+    """Read all employee records from JSON in a single read."""
     try:
-        with open(data_path, "r", encoding="utf-8") as f:
+        with stage("json_parse"), open(data_path, "r", encoding="utf-8") as f:
             data = json.load(f)
-        for emp in data.get("employees", []):
-            if emp.get("id") == employee_id:
-                return emp
+        return data.get("employees", [])
     except (FileNotFoundError, json.JSONDecodeError):
-        pass
-    return None
+        return []
+
+
+def _load_employee_by_id(employee_id: int) -> dict[str, Any] | None:
+    """Load employee by ID from JSON (per-id LRU in the shared roster cache)."""
+    data_path = _get_data_path()
+    return roster_cache.get_by_id(
+        ("json", "all"), json_marker(data_path), employee_id, _find_employee
+    )
+
 
+def _find_employee(employee_id: int) -> dict[str, Any] | None:
+    return _load_index().get(employee_id)
 
-def calculate_salary(employee_id: int = 3) -> dict[str, Any]:
+
+def _empty_totals(zero: Any = 0.0) -> dict[str, Any]:
+    totals: dict[str, Any] = {"headcount": 0}
+    for field in _TOTAL_FIELDS:
+        totals[field] = zero
+    return totals
+
+
+def _salary_memo() -> "SalaryMemo":
+    """Shared memoized calculator (identical inputs are calculated once)."""
+    from application.salary_memo import salary_memo
+
+    return salary_memo
+
+
+def calculate_salary(employee_id: int = 3, exact: bool = False) -> dict[str, Any]:
     """
     Calculate salary for an employee.
 
@@ -38,30 +113,365 @@ def calculate_salary(employee_id: int = 3) -> dict[str, Any]:
 
     Args:
         employee_id: ID of employee to calculate (default: 3 - Баба Яга).
+        exact: calculate in integer kopecks and return Decimal amounts.
 
     Returns:
         Dict with employee_name, base_salary, ndfl, special_deduction, net_salary.
     """
     logger.info("Вызов calculate_salary()")
 
-    from utils.salary_calculator import calculate_employee_salary
-
     employee = _load_employee_by_id(employee_id)
     if not employee:
-        logger.warning(f"Сотрудник с id={employee_id} не найден")
+        logger.warning("Сотрудник с id=%s не найден", employee_id)
         return {"employee_name": "Не найден", "net_salary": 0}
 
-    result = calculate_employee_salary(employee)
+    with stage("calculation"):
+        result = _salary_memo().calculate(employee, exact)
+    inc("balansoft_salary_calculations_total")
+
+    if logger.isEnabledFor(logging.INFO):
+        _log_result(result)
+
+    return result
+
+
+class _Amount:
+    """Amount rendered with space-separated thousands only when a log record is formatted."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+
+    def __str__(self) -> str:
+        return f"{self.value:,}".replace(",", " ")
 
-    logger.info(f"Расчет для: {result['employee_name']}")
-    logger.info(f"Оклад: {result['base_salary']:,} руб.".replace(",", " "))
-    logger.info(f"НДФЛ: {result['ndfl']:,} руб.".replace(",", " "))
+
+def _log_result(result: dict[str, Any]) -> None:
+    logger.info("Расчет для: %s", result["employee_name"])
+    logger.info("Оклад: %s руб.", _Amount(result["base_salary"]))
+    logger.info("НДФЛ: %s руб.", _Amount(result["ndfl"]))
 
     if result["special_deduction"] > 0:
         cond_type = (result.get("special_conditions") or {}).get("type", "unknown")
         label = "ИП" if cond_type == "executive_proceedings" else "Алименты"
-        logger.info(f"Удержание ({label}): {result['special_deduction']:,} руб.".replace(",", " "))
+        logger.info("Удержание (%s): %s руб.", label, _Amount(result["special_deduction"]))
 
-    logger.info(f"К выплате: {result['net_salary']:,} руб.".replace(",", " "))
+    logger.info("К выплате: %s руб.", _Amount(result["net_salary"]))
 
-    return result
+
+async def calculate_salary_async(
+    employee_id: int = 3, exact: bool = False, use_db_if_available: bool = True
+) -> dict[str, Any]:
+    """
+    Async salary calculation for concurrent lookups (e.g. a web service).
+
+    Unlike calculate_salary(), the employee is looked up through the async
+    data layer: database first (AsyncSession), then the JSON file.
+
+    Args:
+        employee_id: ID of employee to calculate (default: 3 - Баба Яга).
+        exact: calculate in integer kopecks and return Decimal amounts.
+        use_db_if_available: look the employee up in the database first.
+
+    Returns:
+        Dict with employee_name, base_salary, ndfl, special_deduction, net_salary.
+    """
+    from application.db.async_people import get_employee
+
+    employee = await get_employee(employee_id, use_db_if_available=use_db_if_available)
+    if not employee:
+        logger.warning("Сотрудник с id=%s не найден", employee_id)
+        return {"employee_name": "Не найден", "net_salary": 0}
+
+    return _salary_memo().calculate(employee, exact)
+
+
+def _select_employees(
+    employee_ids: Iterable[int] | None,
+) -> tuple[list[dict[str, Any]], list[Any]]:
+    """Active employees (all, or the given IDs in request order) and IDs not found."""
+    if employee_ids is None:
+        return [e for e in _load_employees() if e.get("is_active", True)], []
+    index = _load_index()
+    selected = []
+    not_found = []
+    for emp_id in dict.fromkeys(employee_ids):
+        employee = index.get(emp_id)
+        if employee is None or not employee.get("is_active", True):
+            not_found.append(emp_id)
+        else:
+            selected.append(employee)
+    return selected, not_found
+
+
+def calculate_payroll(
+    employee_ids: Iterable[int] | None = None,
+    exact: bool = False,
+    workers: int | None = 1,
+    chunk_size: int | None = None,
+    by_department: bool = False,
+) -> dict[str, Any]:
+    """
+    Calculate payroll for the whole roster in one pass.
+
+    The employees file is read once; every active employee (or only those
+    listed in employee_ids, looked up in the roster index) goes through
+    calculate_employee_salary(); employees with identical inputs (base
+    salary, tax deduction, special deduction) are calculated once.
+
+    Args:
+        employee_ids: IDs to calculate; None means every active employee.
+        exact: calculate in integer kopecks; amounts and totals are Decimal
+            and add up without float drift.
+        workers: worker processes for the calculation (None: all CPUs,
+            1: serial). Small rosters are always calculated serially.
+        chunk_size: employees per worker task.
+        by_department: split work by department_id instead of by chunk.
+
+    Returns:
+        Dict with per-employee "results" (roster order, or the order of
+        employee_ids), "departments" totals keyed by department_id,
+        company "totals" and "not_found" IDs.
+    """
+    logger.info("Вызов calculate_payroll()")
+
+    zero = Decimal(0) if exact else 0.0
+
+    selected, not_found = _select_employees(employee_ids)
+
+    with stage("calculation"):
+        if workers == 1:
+            results = _salary_memo().calculate_many(selected, exact)
+        else:
+            from utils.salary_parallel import DEFAULT_CHUNK_SIZE, calculate_salaries_parallel
+
+            results = calculate_salaries_parallel(
+                selected,
+                workers=workers,
+                chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                by_department=by_department,
+                exact=exact,
+            )
+    inc("balansoft_salary_calculations_total", len(results))
+
+    departments: dict[Any, dict[str, Any]] = {}
+    totals = _empty_totals(zero)
+
+    for employee, result in zip(selected, results):
+        dept_id = employee.get("department_id")
+        dept = departments.get(dept_id)
+        if dept is None:
+            dept = departments[dept_id] = _empty_totals(zero)
+            dept["department_id"] = dept_id
+            dept["department"] = employee.get("department", "")
+        dept["headcount"] += 1
+        totals["headcount"] += 1
+        for field in _TOTAL_FIELDS:
+            value = result[field]
+            dept[field] += value
+            totals[field] += value
+
+    # Округляем суммы один раз, после накопления (точные суммы уже в копейках)
+    if not exact:
+        for bucket in (totals, *departments.values()):
+            for field in _TOTAL_FIELDS:
+                bucket[field] = round(bucket[field], 2)
+
+    if not_found:
+        logger.warning("Сотрудники не найдены или неактивны: %s", not_found)
+    logger.info("Рассчитано сотрудников: %s", totals["headcount"])
+
+    return {
+        "results": results,
+        "departments": departments,
+        "totals": totals,
+        "not_found": not_found,
+    }
+
+
+def iter_payroll(
+    employee_ids: Iterable[int] | None = None, exact: bool = False
+) -> Iterator[dict[str, Any]]:
+    """
+    Calculate payroll lazily, one result at a time (for streaming exports).
+
+    Results are those of calculate_payroll() in the same order, extended with
+    employee_code, department_id and department; no totals are kept, so
+    memory does not grow with the number of results consumed.
+
+    Args:
+        employee_ids: IDs to calculate; None means every active employee.
+        exact: calculate in integer kopecks and return Decimal amounts.
+    """
+    logger.info("Вызов iter_payroll()")
+
+    selected, not_found = _select_employees(employee_ids)
+    if not_found:
+        logger.warning("Сотрудники не найдены или неактивны: %s", not_found)
+    results = _salary_memo().iter_calculate(selected, exact)
+    for result, employee in zip(results, selected):
+        result["employee_code"] = employee.get("employee_code")
+        result["department_id"] = employee.get("department_id")
+        result["department"] = employee.get("department", "")
+        yield result
+    inc("balansoft_salary_calculations_total", len(selected))
+
+
+# Годовые суммы по сотруднику (поле отчёта → матрица calculate_year())
+_ANNUAL_FIELDS = (
+    ("income", "gross"),
+    ("tax_deduction", "tax_deduction"),
+    ("taxable", "taxable"),
+    ("ndfl", "ndfl"),
+    ("special_deduction", "special_deduction"),
+    ("net_salary", "net_salary"),
+)
+
+
+def calculate_annual_payroll(
+    year: int, employee_ids: Iterable[int] | None = None
+) -> dict[str, Any]:
+    """
+    Calculate payroll for all 12 months of a year (requires numpy).
+
+    Unlike calling calculate_payroll() month by month, this goes through
+    utils.salary_periods.calculate_year(): hire dates and start dates of
+    special conditions are respected, deductions are capped by max_percent
+    and NDFL is withheld on a cumulative basis from the start of the year.
+    Amounts are exact (Decimal, kopecks).
+
+    Args:
+        year: calendar year.
+        employee_ids: IDs to calculate; None means every active employee.
+
+    Returns:
+        Dict with per-employee annual "employees" summaries (2-NDFL style:
+        income, tax_deduction, taxable, ndfl, special_deduction, net_salary,
+        months_worked), company totals per month ("months"), annual "totals",
+        "not_found" IDs and the raw month x employee "matrix" in kopecks.
+    """
+    from utils.money import from_kopecks
+    from utils.salary_periods import calculate_year
+
+    logger.info("Вызов calculate_annual_payroll(%s)", year)
+
+    selected, not_found = _select_employees(employee_ids)
+    matrix = calculate_year(selected, year)
+
+    annual = {field: matrix[source].sum(axis=0).tolist() for field, source in _ANNUAL_FIELDS}
+    months_worked = matrix["employed"].sum(axis=0).tolist()
+    employees = []
+    for i, employee in enumerate(selected):
+        summary: dict[str, Any] = {
+            "employee_id": employee.get("id"),
+            "employee_name": employee.get("full_name"),
+            "months_worked": months_worked[i],
+        }
+        for field, _ in _ANNUAL_FIELDS:
+            summary[field] = from_kopecks(annual[field][i])
+        employees.append(summary)
+
+    monthly = {field: matrix[source].sum(axis=1).tolist() for field, source in _ANNUAL_FIELDS}
+    headcount = matrix["employed"].sum(axis=1).tolist()
+    months = []
+    for m in range(len(headcount)):
+        month: dict[str, Any] = {"month": m + 1, "headcount": headcount[m]}
+        for field, _ in _ANNUAL_FIELDS:
+            month[field] = from_kopecks(monthly[field][m])
+        months.append(month)
+
+    totals: dict[str, Any] = {"headcount": len(selected)}
+    for field, _ in _ANNUAL_FIELDS:
+        totals[field] = from_kopecks(sum(annual[field]))
+
+    if not_found:
+        logger.warning("Сотрудники не найдены или неактивны: %s", not_found)
+
+    return {
+        "year": year,
+        "employees": employees,
+        "months": months,
+        "totals": totals,
+        "not_found": not_found,
+        "matrix": matrix,
+    }
+
+
+def update_payroll(
+    state_path: Path | str,
+    employee_ids: Iterable[int] | None = None,
+    exact: bool = False,
+) -> dict[str, Any]:
+    """
+    Incremental payroll: recalculate only employees that changed since the last run.
+
+    The previous results are loaded from state_path (application.payroll_state),
+    changed employees are recalculated, department and company totals are
+    patched, and the new state is saved back. The first run, or a run after
+    the calculation rules changed, calculates everyone.
+
+    Args:
+        state_path: JSON file with the persisted payroll state.
+        employee_ids: IDs known to have changed (O(changed)); None compares
+            record hashes with the whole roster instead.
+        exact: calculate in integer kopecks and return Decimal amounts.
+
+    Returns:
+        Same structure as calculate_payroll() plus "version" (state version)
+        and "recalculated" (employees recalculated or removed in this run).
+    """
+    from application.payroll_state import PayrollState
+
+    logger.info("Вызов update_payroll()")
+
+    state = PayrollState.load(state_path, exact=exact)
+    index = _load_index()
+    if employee_ids is None or len(state) == 0:
+        recalculated = state.sync(index.employees)
+    else:
+        state.mark_dirty(employee_ids)
+        recalculated = state.recalculate(index.get)
+    state.save(state_path)
+
+    logger.info("Пересчитано сотрудников: %s (версия %s)", recalculated, state.version)
+    payroll = state.payroll()
+    payroll["recalculated"] = recalculated
+    return payroll
+
+
+def load_tariff_grid() -> "TariffGrid":
+    """Company tariff grid from JSON, compiled once (cached until the file changes)."""
+    from application.db.json_stream import load_value
+    from utils.salary_rules import TariffGrid
+
+    data_path = _get_data_path()
+
+    def build() -> TariffGrid:
+        company = load_value(data_path, "company", default={}) or {}
+        grid = load_value(data_path, "tariff_grid", default=[]) or []
+        return TariffGrid(grid, company.get("base_salary_grade_1", 0))
+
+    return roster_cache.get(("json", "tariff_grid"), json_marker(data_path), build)
+
+
+def validate_roster(employee_ids: Iterable[int] | None = None) -> list[dict[str, Any]]:
+    """
+    Check grades, coefficients and salaries against the tariff grid in one pass.
+
+    base_salary is expected to equal base_salary_grade_1 × coefficient, and
+    the coefficient must lie within its grade's range (utils.salary_rules).
+
+    Args:
+        employee_ids: IDs to check; None means every active employee.
+
+    Returns:
+        List of issues (employee_id, code and details); empty if all is consistent.
+    """
+    logger.info("Вызов validate_roster()")
+
+    selected, _ = _select_employees(employee_ids)
+    issues = load_tariff_grid().validate(selected)
+    if issues:
+        logger.warning("Нарушений тарифной сетки: %s", len(issues))
+    return issues
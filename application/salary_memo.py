@@ -0,0 +1,176 @@
+"""Memoized salary calculation: identical inputs are calculated once per rule version."""
+
+__all__ = ["SalaryMemo", "salary_memo", "rules_version", "calculate_salaries"]
+
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
+from typing import Any
+
+from application.metrics import inc
+from utils import salary_calculator, salary_rules
+from utils.salary_rules import deduction_rule
+
+# Сколько различных наборов входных данных помнить (0 — только в пределах одного расчёта)
+DEFAULT_MEMO_SIZE = int(os.getenv("BALANSOFT_SALARY_MEMO_SIZE", "65536"))
+
+
+def rules_version() -> tuple[Any, ...]:
+    """Version of the calculation rules: NDFL rate and deduction types generation."""
+    return (salary_calculator.NDFL_RATE, salary_rules.RULES_GENERATION)
+
+
+def _amounts(base_salary: Any, tax_deduction: Any, conditions: Any, exact: bool) -> tuple:
+    """Amounts for one input tuple, computed by the regular calculator."""
+    employee = {
+        "base_salary": base_salary,
+        "tax_deduction": tax_deduction,
+        "special_conditions": conditions,
+    }
+    if exact:
+        result = salary_calculator.calculate_employee_salary_exact(employee)
+        return (
+            result["base_salary"],
+            result["tax_deduction"],
+            result["ndfl"],
+            result["special_deduction"],
+            result["net_salary"],
+        )
+    result = salary_calculator.calculate_employee_salary(employee)
+    return result["ndfl"], result["special_deduction"], result["net_salary"]
+
+
+class SalaryMemo:
+    """
+    Bounded LRU cache of salary amounts keyed by calculation inputs.
+
+    Salaries come from a tariff grid, so many employees share the same base
+    salary, tax deduction and special deduction: the amounts for such a
+    tuple are calculated once and fanned out. Keys are (rule version, money
+    mode, base salary, tax deduction, compiled deduction rule), so changing
+    NDFL_RATE or the deduction types makes old entries unreachable and the
+    LRU evicts them.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_lock", "_entries")
+
+    def __init__(self, maxsize: int = DEFAULT_MEMO_SIZE) -> None:
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, tuple] = OrderedDict()
+
+    def _get(self, key: Hashable) -> tuple | None:
+        with self._lock:
+            amounts = self._entries.get(key)
+            if amounts is not None:
+                self._entries.move_to_end(key)
+            return amounts
+
+    def _put(self, key: Hashable, amounts: tuple) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = amounts
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def iter_calculate(
+        self, employees: Iterable[dict[str, Any]], exact: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield calculate_employee_salary() (or _exact) results for every employee.
+
+        Identical input tuples within one run are grouped in a local table
+        (no locking); the shared LRU is consulted once per distinct tuple.
+        """
+        prefix = (rules_version(), exact)
+        seen: dict[Hashable, tuple] = {}
+        hits = misses = 0
+        try:
+            for employee in employees:
+                get = employee.get
+                base_salary = get("base_salary", 0)
+                tax_deduction = get("tax_deduction", 0)
+                conditions = get("special_conditions")
+                local_key = (base_salary, tax_deduction, deduction_rule(conditions))
+                amounts = seen.get(local_key)
+                if amounts is None:
+                    key = (*prefix, *local_key)
+                    amounts = self._get(key)
+                    if amounts is None:
+                        misses += 1
+                        amounts = _amounts(base_salary, tax_deduction, conditions, exact)
+                        self._put(key, amounts)
+                    else:
+                        hits += 1
+                    if len(seen) >= max(self.maxsize, 1024):
+                        seen.clear()
+                    seen[local_key] = amounts
+                else:
+                    hits += 1
+                if exact:
+                    base_salary, tax_deduction, ndfl, special_deduction, net = amounts
+                else:
+                    ndfl, special_deduction, net = amounts
+                yield {
+                    "employee_id": get("id"),
+                    "employee_name": get("full_name"),
+                    "base_salary": base_salary,
+                    "tax_deduction": tax_deduction,
+                    "ndfl": ndfl,
+                    "special_deduction": special_deduction,
+                    "special_conditions": conditions,
+                    "net_salary": net,
+                }
+        finally:
+            self._count(hits, misses)
+
+    def calculate_many(
+        self, employees: Iterable[dict[str, Any]], exact: bool = False
+    ) -> list[dict[str, Any]]:
+        """Results for a batch of employees (see iter_calculate())."""
+        return list(self.iter_calculate(employees, exact))
+
+    def calculate(self, employee: dict[str, Any], exact: bool = False) -> dict[str, Any]:
+        """Result for one employee."""
+        return next(self.iter_calculate((employee,), exact))
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+        if hits:
+            inc("balansoft_salary_memo_total", hits, result="hit")
+        if misses:
+            inc("balansoft_salary_memo_total", misses, result="miss")
+
+    def info(self) -> dict[str, Any]:
+        """Hits, misses, hit ratio and cache size."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / total if total else 0.0,
+                "entries": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all entries and counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+salary_memo = SalaryMemo()
+
+
+def calculate_salaries(
+    employees: Iterable[dict[str, Any]], exact: bool = False
+) -> list[dict[str, Any]]:
+    """Calculate a batch of employees through the shared salary_memo."""
+    return salary_memo.calculate_many(employees, exact)
@@ -0,0 +1 @@
+"""Benchmarks for Balansoft (run as python -m benchmarks.<name>)."""
@@ -0,0 +1,81 @@
+"""
+Пропускная способность конкурентных запросов: async get_employee() против
+синхронного get_employee() в пуле потоков.
+
+По умолчанию — временная SQLite (aiosqlite); для PostgreSQL передайте --url.
+
+    python -m benchmarks.bench_async --requests 2000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--url", help="DATABASE_URL (по умолчанию временная SQLite)")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+
+    import database.async_session
+    import database.session
+    from application.db import async_people, people
+    from database.models import Base
+    from database.seed import (
+        iter_employees_json,
+        load_departments,
+        seed_departments_bulk,
+        seed_employees_bulk,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = args.url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            seed_departments_bulk(conn, load_departments())
+            seed_employees_bulk(conn, iter_employees_json(), progress=None)
+        database.session.SessionLocal = sessionmaker(bind=engine)
+
+        async_engine = create_async_engine(database.async_session.to_async_url(url))
+        database.async_session.AsyncSessionLocal = async_sessionmaker(async_engine)
+
+        ids = [random.randint(1, 10) for _ in range(args.requests)]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            list(pool.map(lambda i: people.get_employee(i), ids))
+        sync_time = time.perf_counter() - start
+
+        async def run_async() -> None:
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def one(employee_id: int) -> None:
+                async with semaphore:
+                    await async_people.get_employee(employee_id)
+
+            await asyncio.gather(*(one(i) for i in ids))
+            await async_engine.dispose()
+
+        start = time.perf_counter()
+        asyncio.run(run_async())
+        async_time = time.perf_counter() - start
+        engine.dispose()
+
+    print(f"requests={args.requests:,} concurrency={args.concurrency}")
+    print(f"sync (threads): {sync_time:6.2f}s  {args.requests / sync_time:8,.0f} req/s")
+    print(f"async:          {async_time:6.2f}s  {args.requests / async_time:8,.0f} req/s")
+
+
+if __name__ == "__main__":
+    main()
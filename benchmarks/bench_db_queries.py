@@ -0,0 +1,86 @@
+"""
+Чтение штата из БД: ORM-сущности (select(Employee) + атрибуты) против
+проекции колонок с фильтрами в SQL (application.db.queries).
+
+По умолчанию — временная SQLite с синтетическим штатом; для PostgreSQL передайте --url.
+
+    python -m benchmarks.bench_db_queries --employees 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--url", help="DATABASE_URL (по умолчанию временная SQLite)")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine, select
+    from sqlalchemy.orm import sessionmaker
+
+    from application.db.queries import employee_query, row_converter
+    from benchmarks.synthetic import write_roster
+    from database.models import Base, Employee
+    from database.seed import (
+        iter_employees_json,
+        load_departments,
+        seed_departments_bulk,
+        seed_employees_bulk,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["BALANSOFT_EMPLOYEES_JSON"] = str(
+            write_roster(args.employees, Path(tmp) / "employees.json")
+        )
+        url = args.url or f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_engine(url)
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            seed_departments_bulk(conn, load_departments())
+            seed_employees_bulk(conn, iter_employees_json(), progress=None)
+        Session = sessionmaker(bind=engine)
+
+        def orm_full() -> int:
+            # Прежний путь: сущности целиком, все колонки и учёт в identity map
+            with Session() as db:
+                rows = db.execute(select(Employee).where(Employee.is_active.is_(True)))
+                return sum(
+                    1
+                    for (e,) in rows
+                    if {
+                        "id": e.id,
+                        "full_name": e.full_name,
+                        "department_id": e.department_id,
+                        "base_salary": float(e.base_salary),
+                    }
+                )
+
+        def projected(profile: str, **filters) -> int:
+            convert = row_converter(profile)
+            stmt = employee_query(profile, **filters).execution_options(yield_per=args.batch_size)
+            with Session() as db:
+                return sum(1 for row in db.execute(stmt) if convert(row))
+
+        cases = [
+            ("ORM select(Employee)", orm_full),
+            ("projected full", lambda: projected("full")),
+            ("projected payroll", lambda: projected("payroll")),
+            ("projected listing, dept=3", lambda: projected("listing", department_id=3)),
+        ]
+        print(f"employees={args.employees:,}")
+        for name, func in cases:
+            start = time.perf_counter()
+            n = func()
+            elapsed = time.perf_counter() - start
+            print(f"{name:28s} {elapsed:6.2f}s  {n:>9,} rows  {n / elapsed:10,.0f} rows/s")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Итоги по отделам: GROUP BY по всем сотрудникам против таблицы department_summary.
+
+Штат заполняется пакетным upsert (триггеры ведут department_summary), затем
+каждый запрос выполняется --repeat раз. По умолчанию — временная SQLite; для
+PostgreSQL передайте --url.
+
+    python -m benchmarks.bench_department_summary --size 100000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_roster
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--url", help="DATABASE_URL (по умолчанию временная SQLite)")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine, func, select
+
+    from database.department_summary import get_department_summary
+    from database.models import Base, Employee
+    from database.seed import (
+        iter_employees_json,
+        load_departments,
+        seed_departments_bulk,
+        seed_employees_bulk,
+    )
+
+    group_by = (
+        select(
+            Employee.department_id,
+            func.count(),
+            func.sum(Employee.base_salary),
+            func.sum(Employee.tax_deduction),
+        )
+        .where(Employee.is_active == True)  # noqa: E712
+        .group_by(Employee.department_id)
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_roster(args.size, Path(tmp) / "employees.json")
+        os.environ["BALANSOFT_EMPLOYEES_JSON"] = str(path)
+        engine = create_engine(args.url or f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            seed_departments_bulk(conn, load_departments())
+            seed_employees_bulk(conn, iter_employees_json(), progress=None)
+        seed = time.perf_counter() - start
+        print(f"заполнение (с триггерами): {seed:7.2f}s  {args.size / seed:10,.0f} строк/с")
+
+        with engine.connect() as conn:
+            for label, run in (
+                ("GROUP BY employees", lambda: conn.execute(group_by).all()),
+                ("department_summary", lambda: get_department_summary(conn)),
+            ):
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    run()
+                elapsed = (time.perf_counter() - start) / args.repeat * 1000
+                print(f"{label:<20} {elapsed:9.2f} мс/запрос")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Бенчмарк выгрузки ведомости: write_csv() против csv.writer с format_currency()
+по каждой ячейке, и полная выгрузка export_payroll() (расчёт + запись).
+
+    python -m benchmarks.bench_export --size 1000000
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_synthetic_roster
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def _peak_mb() -> float:
+    if resource is None:
+        return float("nan")
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _naive_csv(results, path: Path) -> None:
+    from application.export import MONEY_COLUMNS, PAYROLL_COLUMNS
+    from utils.formatters import format_currency
+
+    with open(path, "w", encoding="utf-8-sig", newline="") as f:
+        writer = csv.writer(f, delimiter=";")
+        writer.writerow(PAYROLL_COLUMNS)
+        for r in results:
+            writer.writerow(
+                [
+                    format_currency(r[c], "") if c in MONEY_COLUMNS else r.get(c)
+                    for c in PAYROLL_COLUMNS
+                ]
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=200_000)
+    parser.add_argument("--format", default="csv", choices=("csv", "parquet", "xlsx"))
+    args = parser.parse_args()
+
+    from application.export import export_payroll, write_csv
+    from application.salary import calculate_salary, iter_payroll
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["BALANSOFT_SNAPSHOT_DIR"] = tmp
+        roster = write_synthetic_roster(args.size, Path(tmp) / "employees.json")
+        os.environ["BALANSOFT_EMPLOYEES_JSON"] = str(roster)
+        calculate_salary(1)  # справочник загружается вне замеров
+
+        start = time.perf_counter()
+        results = list(iter_payroll())
+        calc = time.perf_counter() - start
+        print(f"расчёт:            {calc:7.2f}s  ({len(results):,} строк)")
+
+        out = Path(tmp) / "payroll.csv"
+        start = time.perf_counter()
+        _naive_csv(results, out)
+        naive = time.perf_counter() - start
+        print(f"csv + format_currency: {naive:7.2f}s  {len(results) / naive:12,.0f} строк/с")
+
+        start = time.perf_counter()
+        write_csv(results, out)
+        fast = time.perf_counter() - start
+        print(f"write_csv:         {fast:7.2f}s  {len(results) / fast:12,.0f} строк/с"
+              f"  x{naive / fast:.1f}")
+        del results
+
+        out = Path(tmp) / f"payroll.{args.format}"
+        start = time.perf_counter()
+        count = export_payroll(out, args.format)
+        full = time.perf_counter() - start
+        print(f"export_payroll ({args.format}): {full:7.2f}s  {count / full:12,.0f} строк/с"
+              f"  {out.stat().st_size / 1e6:.1f} МБ, пик RSS {_peak_mb():.0f} МБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Задержка get_employees() при деградации БД: по очереди и с параллельной загрузкой JSON.
+
+Медленная БД имитируется подменой загрузчика (и проверки настроек БД): он
+ждёт --db-delay секунд (как таймаут подключения) и возвращает None. Печатаются p50/p99 по --calls
+вызовам; кэш JSON сбрасывается перед каждым вызовом (холодный разбор).
+
+    python -m benchmarks.bench_hedge --db-delay 0.5 --deadline 0.1 --calls 20
+"""
+
+import argparse
+import logging
+import statistics
+import time
+
+from application.db import people
+from application.db.cache import clear_cache
+
+
+def _run(calls: int, deadline: float) -> list[float]:
+    timings = []
+    for _ in range(calls):
+        clear_cache()
+        start = time.perf_counter()
+        people.get_employees(hedge_deadline=deadline)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--db-delay", type=float, default=0.5)
+    parser.add_argument("--deadline", type=float, default=0.1)
+    parser.add_argument("--calls", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    def degraded_db() -> None:
+        time.sleep(args.db_delay)
+        return None
+
+    people._try_load_from_db = degraded_db
+    people._db_configured = lambda: True
+    for label, deadline in (("по очереди", 0.0), ("параллельно", args.deadline)):
+        timings = sorted(_run(args.calls, deadline))
+        p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))]
+        print(
+            f"{label:<12} p50 {statistics.median(timings) * 1000:8.1f} мс"
+            f"   p99 {p99 * 1000:8.1f} мс"
+        )
+
+
+if __name__ == "__main__":
+    main()
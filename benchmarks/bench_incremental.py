@@ -0,0 +1,56 @@
+"""
+Пересчёт после правки: полный расчёт против PayrollState (только изменённые).
+
+    python -m benchmarks.bench_incremental --employees 100000 --changed 100
+"""
+
+import argparse
+import random
+import time
+
+from application.payroll_state import PayrollState
+from benchmarks.synthetic import make_roster
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--changed", type=int, default=100)
+    args = parser.parse_args()
+
+    employees = make_roster(args.employees)["employees"]
+    by_id = {e["id"]: e for e in employees}
+
+    start = time.perf_counter()
+    state = PayrollState()
+    state.sync(employees)
+    full_time = time.perf_counter() - start
+
+    changed = random.sample(list(by_id), args.changed)
+    for employee_id in changed:
+        employee = by_id[employee_id]
+        by_id[employee_id] = dict(employee, base_salary=employee["base_salary"] + 1000)
+
+    start = time.perf_counter()
+    state.mark_dirty(changed)
+    state.recalculate(by_id.get)
+    dirty_time = time.perf_counter() - start
+
+    for employee_id in changed:
+        employee = by_id[employee_id]
+        by_id[employee_id] = dict(employee, tax_deduction=employee.get("tax_deduction", 0) + 100)
+    employees = list(by_id.values())
+
+    start = time.perf_counter()
+    n = state.sync(employees)
+    sync_time = time.perf_counter() - start
+    assert n == args.changed
+
+    print(f"employees={args.employees:,} changed={args.changed:,}")
+    print(f"full calculation:        {full_time * 1000:9.1f} ms")
+    print(f"dirty set (mark_dirty):  {dirty_time * 1000:9.1f} ms")
+    print(f"hash diff (sync):        {sync_time * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
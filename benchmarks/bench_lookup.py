@@ -0,0 +1,45 @@
+"""
+Бенчмарк поиска сотрудника по индексу при росте штата.
+
+    python -m benchmarks.bench_lookup --sizes 10 1000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+
+from application.db.index import RosterIndex
+from benchmarks.synthetic import make_roster
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1_000, 100_000, 1_000_000])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for n in args.sizes:
+        employees = make_roster(n)["employees"]
+        start = time.perf_counter()
+        index = RosterIndex(employees)
+        build = time.perf_counter() - start
+
+        ids = [rng.randint(1, n) for _ in range(args.lookups)]
+        codes = [f"SYN-{i:07d}" for i in ids]
+
+        start = time.perf_counter()
+        for employee_id in ids:
+            index.get(employee_id)
+        by_id = (time.perf_counter() - start) / args.lookups * 1e9
+
+        start = time.perf_counter()
+        for code in codes:
+            index.get_by_code(code)
+        by_code = (time.perf_counter() - start) / args.lookups * 1e9
+
+        print(f"n={n:>9,}  build={build:7.3f}s  by_id={by_id:6.0f} ns  by_code={by_code:6.0f} ns")
+
+
+if __name__ == "__main__":
+    main()
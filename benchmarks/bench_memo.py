@@ -0,0 +1,51 @@
+"""
+Расчёт штата с запоминанием по входным данным против расчёта каждого сотрудника.
+
+На синтетическом штате (benchmarks.synthetic) сравниваются calculate_employee_salary()
+по каждому сотруднику и SalaryMemo.calculate_many() — холодный кэш и повторный
+прогон — в обычном и точном режиме денег.
+
+    python -m benchmarks.bench_memo --size 100000
+"""
+
+import argparse
+import time
+
+from application.salary_memo import SalaryMemo
+from benchmarks.synthetic import generate_employees
+from utils.salary_calculator import calculate_employee_salary, calculate_employee_salary_exact
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    employees = list(generate_employees(args.size, seed=args.seed))
+    for exact in (False, True):
+        calculate = calculate_employee_salary_exact if exact else calculate_employee_salary
+        start = time.perf_counter()
+        for employee in employees:
+            calculate(employee)
+        plain = time.perf_counter() - start
+
+        memo = SalaryMemo()
+        start = time.perf_counter()
+        memo.calculate_many(employees, exact)
+        cold = time.perf_counter() - start
+        start = time.perf_counter()
+        memo.calculate_many(employees, exact)
+        warm = time.perf_counter() - start
+
+        info = memo.info()
+        print(
+            f"{'точный' if exact else 'float':<7} по одному {plain:7.3f}s"
+            f"  память: холодный {cold:7.3f}s (x{plain / cold:.1f})"
+            f"  повторный {warm:7.3f}s (x{plain / warm:.1f})"
+            f"  наборов {info['entries']}, попаданий {info['hit_ratio']:.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
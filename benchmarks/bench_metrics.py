@@ -0,0 +1,40 @@
+"""
+Стоимость инструментирования: calculate_salary() с выключенными и включёнными метриками.
+
+    python -m benchmarks.bench_metrics --calls 100000
+"""
+
+import argparse
+import logging
+import time
+
+from application.metrics import metrics
+
+
+def _run(calls: int) -> float:
+    from application.salary import calculate_salary
+
+    start = time.perf_counter()
+    for i in range(calls):
+        calculate_salary(i % 10 + 1)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    _run(100)  # прогрев кэша справочника
+
+    for enabled in (False, True):
+        metrics.enabled = enabled
+        seconds = _run(args.calls)
+        label = "метрики вкл " if enabled else "метрики выкл"
+        print(f"{label}: {seconds:7.3f}s  {seconds / args.calls * 1e6:6.2f} мкс/вызов")
+    print(metrics.export_prometheus())
+
+
+if __name__ == "__main__":
+    main()
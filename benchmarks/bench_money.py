@@ -0,0 +1,50 @@
+"""
+Бенчмарк точного режима (копейки/Decimal) против float в calculate_payroll().
+
+    python -m benchmarks.bench_money --size 100000 --max-ratio 2.0
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_roster
+
+
+def _best_of(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    args = parser.parse_args()
+
+    from application.salary import calculate_payroll
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_roster(args.size, Path(tmp) / "employees.json")
+        os.environ["BALANSOFT_EMPLOYEES_JSON"] = str(path)
+
+        float_time = _best_of(lambda: calculate_payroll(), args.repeat)
+        exact_time = _best_of(lambda: calculate_payroll(exact=True), args.repeat)
+
+    ratio = exact_time / float_time
+    print(f"n={args.size:,}  float={float_time:.3f}s  exact={exact_time:.3f}s  ratio={ratio:.2f}")
+    if ratio > args.max_ratio:
+        print(f"FAIL: точный режим медленнее float более чем в {args.max_ratio}x")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
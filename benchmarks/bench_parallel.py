@@ -0,0 +1,43 @@
+"""
+Масштабирование calculate_salaries_parallel() по числу процессов.
+
+    python -m benchmarks.bench_parallel --size 1000000 --workers 1 2 4 8
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks.synthetic import make_roster
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--by-department", action="store_true")
+    args = parser.parse_args()
+
+    from utils.salary_parallel import calculate_salaries_parallel
+
+    employees = make_roster(args.size)["employees"]
+    print(f"n={args.size:,}  cpu_count={os.cpu_count()}")
+
+    baseline = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        calculate_salaries_parallel(
+            employees,
+            workers=workers,
+            chunk_size=args.chunk_size,
+            min_parallel=0,
+            by_department=args.by_department,
+        )
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers}  {elapsed:7.2f}s  {args.size / elapsed:12,.0f} emp/s  x{baseline / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Бенчмарк calculate_payroll() против цикла calculate_salary().
+
+Перед замерами выполняется один холодный calculate_payroll() (разбор JSON,
+сборка снимка, декодирование штата) — его время печатается отдельно как
+load. Мемо-кэш сумм сбрасывается перед каждым вариантом, так что оба считают
+на тёплом кэше штата с нуля.
+
+    python -m benchmarks.bench_payroll --sizes 1000 10000 100000 --loop-limit 20000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_roster
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument(
+        "--loop-limit",
+        type=int,
+        default=20_000,
+        help="максимальный размер, для которого меряется цикл calculate_salary "
+        "(по вызову на сотрудника, с логированием и метриками каждого)",
+    )
+    args = parser.parse_args()
+
+    from application.salary import calculate_payroll, calculate_salary
+    from application.salary_memo import salary_memo
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            path = write_roster(n, Path(tmp) / f"employees_{n}.json")
+            os.environ["BALANSOFT_EMPLOYEES_JSON"] = str(path)
+
+            load = _timed(calculate_payroll)
+            salary_memo.clear()
+            batch = _timed(calculate_payroll)
+            line = f"n={n:>9,}  load={load:7.3f}s  payroll={batch:8.3f}s  {n / batch:12,.0f} emp/s"
+            if n <= args.loop_limit:
+                salary_memo.clear()
+                loop = _timed(lambda: [calculate_salary(i) for i in range(1, n + 1)])
+                line += f"  loop={loop:8.3f}s  speedup x{loop / batch:,.1f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Запись результатов расчёта в payroll_results: по строке против пакетной записи.
+
+Пакетная запись — COPY в PostgreSQL (psycopg/psycopg2) или пакетный INSERT в
+прочих СУБД. По умолчанию — временная SQLite; для PostgreSQL передайте --url.
+
+    python -m benchmarks.bench_payroll_store --size 100000 --batch-size 5000
+"""
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--url", help="DATABASE_URL (по умолчанию временная SQLite)")
+    parser.add_argument("--skip-rows", action="store_true", help="не мерить запись по строке")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+
+    from application.salary_memo import calculate_salaries
+    from benchmarks.synthetic import generate_employees
+    from database.models import Base
+    from database.payroll_results import get_department_totals, write_payroll_results
+
+    employees = list(generate_employees(args.size))
+    results = calculate_salaries(employees, exact=True)
+    for result, employee in zip(results, employees):
+        result["employee_code"] = employee["employee_code"]
+        result["department_id"] = employee["department_id"]
+        result["department"] = employee["department"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(args.url or f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+
+        modes = [("пакетами", args.batch_size)]
+        if not args.skip_rows:
+            modes.insert(0, ("по строке", 1))
+        for label, batch_size in modes:
+            start = time.perf_counter()
+            with engine.begin() as conn:
+                write_payroll_results(
+                    conn, "2026-10", results, batch_size=batch_size, replace_period=True
+                )
+            elapsed = time.perf_counter() - start
+            print(f"{label:<10} {elapsed:8.2f}s  {args.size / elapsed:12,.0f} строк/с")
+
+        start = time.perf_counter()
+        with engine.connect() as conn:
+            totals = get_department_totals(conn, "2026-10")
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"итоги по {len(totals['departments'])} отделам: {elapsed:.1f} мс")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Годовой расчёт: матрица 12 x N (utils.salary_periods) против 12 * N вызовов
+calculate_employee_salary_exact().
+
+    python -m benchmarks.bench_periods --employees 100000
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import make_roster
+from utils.salary_calculator import calculate_employee_salary_exact
+from utils.salary_periods import calculate_year
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--year", type=int, default=2024)
+    args = parser.parse_args()
+
+    employees = make_roster(args.employees)["employees"]
+
+    start = time.perf_counter()
+    matrix = calculate_year(employees, args.year)
+    matrix_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(12):
+        for employee in employees:
+            calculate_employee_salary_exact(employee)
+    loop_time = time.perf_counter() - start
+
+    cells = matrix["gross"].size
+    print(f"employees={args.employees:,} cells={cells:,}")
+    print(f"period matrix:        {matrix_time:6.2f}s  {cells / matrix_time:12,.0f} cells/s")
+    print(f"12 x single calls:    {loop_time:6.2f}s  {cells / loop_time:12,.0f} cells/s")
+    print(f"speedup: {loop_time / matrix_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
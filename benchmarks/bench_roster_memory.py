@@ -0,0 +1,65 @@
+"""
+Память на сотрудника и скорость полного прохода: записи-dict из json.load()
+против EmployeeRecord (__slots__, общие строки и числа).
+
+    python -m benchmarks.bench_roster_memory --sizes 10000 100000 300000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from application.db.roster import compact_records
+from benchmarks.synthetic import make_roster
+from utils.salary_calculator import calculate_employee_salary
+
+
+def _retained(build) -> tuple[object, float]:
+    """Построить ростер и вернуть его вместе с удерживаемой памятью в байтах."""
+    gc.collect()
+    tracemalloc.start()
+    roster = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return roster, current
+
+
+def _scan(employees) -> tuple[float, float]:
+    start = time.perf_counter()
+    total = sum(e.get("base_salary", 0) for e in employees)
+    field_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for e in employees:
+        calculate_employee_salary(e)
+    calc_time = time.perf_counter() - start
+    assert total
+    return field_time, calc_time
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        # Как после json.load(): у каждой записи свои объекты строк и чисел
+        raw = json.dumps(make_roster(n)["employees"], ensure_ascii=False)
+        dicts, dict_bytes = _retained(lambda: json.loads(raw))
+        records, record_bytes = _retained(lambda: compact_records(json.loads(raw)))
+        dict_scan, dict_calc = _scan(dicts)
+        record_scan, record_calc = _scan(records)
+        print(
+            f"n={n:>9,}  dict: {dict_bytes / n:6.0f} B/emp  "
+            f"scan {dict_scan:5.2f}s calc {dict_calc:5.2f}s  |  "
+            f"EmployeeRecord: {record_bytes / n:6.0f} B/emp  "
+            f"scan {record_scan:5.2f}s calc {record_calc:5.2f}s  "
+            f"({dict_bytes / record_bytes:.1f}x less memory)"
+        )
+        del dicts, records
+
+
+if __name__ == "__main__":
+    main()
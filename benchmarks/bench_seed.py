@@ -0,0 +1,69 @@
+"""
+Бенчмарк заполнения БД: db.merge() по строке против пакетного upsert.
+
+По умолчанию — временная SQLite; для PostgreSQL передайте --url.
+
+    python -m benchmarks.bench_seed --size 20000 --batch-size 5000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.synthetic import write_roster
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--url", help="DATABASE_URL (по умолчанию временная SQLite)")
+    parser.add_argument("--skip-merge", action="store_true", help="не мерить db.merge()")
+    args = parser.parse_args()
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import Session
+
+    from database.models import Base
+    from database.seed import (
+        clear_tables,
+        iter_employees_json,
+        load_departments,
+        seed_departments,
+        seed_departments_bulk,
+        seed_employees,
+        seed_employees_bulk,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = write_roster(args.size, Path(tmp) / "employees.json")
+        os.environ["BALANSOFT_EMPLOYEES_JSON"] = str(path)
+        engine = create_engine(args.url or f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+
+        if not args.skip_merge:
+            start = time.perf_counter()
+            with Session(engine) as db:
+                seed_departments(db, load_departments())
+                seed_employees(db, iter_employees_json())
+            merge = time.perf_counter() - start
+            print(f"merge: {merge:7.2f}s  {args.size / merge:10,.0f} строк/с")
+            with engine.begin() as conn:
+                clear_tables(conn)
+
+        for label in ("bulk insert", "bulk upsert"):
+            start = time.perf_counter()
+            with engine.begin() as conn:
+                seed_departments_bulk(conn, load_departments())
+                seed_employees_bulk(
+                    conn, iter_employees_json(), batch_size=args.batch_size, progress=None
+                )
+            bulk = time.perf_counter() - start
+            print(f"{label}: {bulk:7.2f}s  {args.size / bulk:10,.0f} строк/с")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
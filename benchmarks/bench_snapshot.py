@@ -0,0 +1,92 @@
+"""
+Холодный старт: разбор employees.json (json.load) против бинарного снимка (mmap).
+
+Для каждого размера штата — время в процессе (загрузка и поиск одного
+сотрудника, полный список) и время запуска нового интерпретатора,
+считающего зарплату одного сотрудника, и выборка одного отдела
+(таблица dept order вместо просмотра всех строк).
+
+    python -m benchmarks.bench_snapshot --sizes 10000 100000 1000000
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from application.db.index import RosterIndex
+from application.db.snapshot import Snapshot, SnapshotRoster, build_snapshot, snapshot_path
+from benchmarks.synthetic import write_roster
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+
+def _timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def _json_lookup(path: Path, employee_id: int) -> None:
+    with open(path, "r", encoding="utf-8") as f:
+        index = RosterIndex(json.load(f)["employees"], compact=True)
+    assert index.get(employee_id)
+
+
+def _snapshot_lookup(path: Path, employee_id: int) -> None:
+    assert SnapshotRoster(Snapshot(path)).get(employee_id)
+
+
+def _cold_start(path: Path, employee_id: int, snapshot: bool) -> float:
+    env = dict(os.environ, BALANSOFT_EMPLOYEES_JSON=str(path))
+    env["BALANSOFT_SNAPSHOT"] = "1" if snapshot else "0"
+    code = f"from application.salary import calculate_salary; calculate_salary({employee_id})"
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code], cwd=_ROOT, env=env, check=True, capture_output=True
+    )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            path = write_roster(n, Path(tmp) / f"employees_{n}.json")
+            snap = snapshot_path(path)
+            st = path.stat()
+            with open(path, "r", encoding="utf-8") as f:
+                employees = json.load(f)["employees"]
+            build = _timed(lambda: build_snapshot(employees, snap, (st.st_mtime_ns, st.st_size)))
+            del employees
+            target = n // 2
+
+            json_time = _timed(lambda: _json_lookup(path, target))
+            snap_time = _timed(lambda: _snapshot_lookup(snap, target))
+            full_time = _timed(lambda: SnapshotRoster(Snapshot(snap)).employees)
+            snapshot = Snapshot(snap)
+            dept_time = _timed(lambda: snapshot.rows_in_department(1))
+            dept_rows = len(snapshot.rows_in_department(1))
+            cold_json = _cold_start(path, target, snapshot=False)
+            cold_snap = _cold_start(path, target, snapshot=True)
+            json_mb = st.st_size / 2**20
+            snap_mb = snap.stat().st_size / 2**20
+            print(f"n={n:>9,} json={json_mb:6.1f} MiB snap={snap_mb:6.1f} MiB build {build:5.2f}s")
+            print(
+                f"  load+get: json.load {json_time * 1000:8.1f} ms  "
+                f"snapshot {snap_time * 1000:6.2f} ms  "
+                f"(full list from snapshot {full_time:5.2f}s)"
+            )
+            print(f"  department rows: {dept_time * 1000:6.3f} ms ({dept_rows:,} rows)")
+            print(f"  cold start: json {cold_json:5.2f}s  snapshot {cold_snap:5.2f}s")
+
+
+if __name__ == "__main__":
+    main()
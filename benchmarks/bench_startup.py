@@ -0,0 +1,127 @@
+"""
+Холодный старт CLI: время запуска main.py и run.py и самые дорогие импорты.
+
+Каждый скрипт запускается --runs раз в отдельном процессе с `python -X importtime`;
+берётся медиана полного времени процесса и суммарного времени импортов, а из
+последнего прогона — самые дорогие модули верхнего уровня. С --baseline рост
+медианы больше --threshold — регрессия (код выхода 1).
+
+    python -m benchmarks.bench_startup --output startup.json
+    python -m benchmarks.bench_startup --baseline startup.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Скрипт и аргументы короткого запуска (одна строка списка, без пейджера)
+SCRIPTS = {
+    "main.py": ["--limit", "1"],
+    "run.py": ["--limit", "1", "--no-pager"],
+}
+
+
+def parse_importtime(stderr: str) -> dict[str, int]:
+    """
+    Накопленное время импорта (мкс) модулей верхнего уровня из вывода -X importtime.
+
+    Строка: `import time: self [us] | cumulative | imported package`; вложенные
+    импорты выделены отступом в последней колонке и уже входят в cumulative
+    родителя, поэтому учитываются только модули без отступа.
+    """
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|", 2)
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue  # заголовок
+        name = parts[2].rstrip()
+        if name.startswith(" ") and not name.startswith("  "):
+            name = name[1:]
+        if name.startswith(" "):
+            continue
+        modules[name] = modules.get(name, 0) + int(parts[1])
+    return modules
+
+
+def measure(script: str, args: list[str], runs: int) -> dict[str, Any]:
+    """Запустить скрипт runs раз; медианы времени процесса и импортов, топ модулей."""
+    env = dict(os.environ, BALANSOFT_METRICS="0")
+    wall, imports = [], []
+    modules: dict[str, int] = {}
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", script, *args],
+            cwd=ROOT,
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        wall.append(time.perf_counter() - start)
+        if proc.returncode != 0:
+            return {"error": proc.stderr.strip().splitlines()[-1:] or ["exit code"]}
+        modules = parse_importtime(proc.stderr)
+        imports.append(sum(modules.values()) / 1e6)
+    top = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:10]
+    return {
+        "seconds": round(statistics.median(wall), 4),
+        "import_seconds": round(statistics.median(imports), 4),
+        "runs": runs,
+        "top_imports": {name: round(us / 1e6, 4) for name, us in top},
+    }
+
+
+def main() -> None:
+    from benchmarks.suite import compare
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--scripts", nargs="+", choices=sorted(SCRIPTS), default=list(SCRIPTS))
+    parser.add_argument("--output", type=Path, help="сохранить результаты в JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON прошлого прогона для сравнения")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    results = {"python": sys.version.split()[0], "results": {}}
+    for script in args.scripts:
+        result = measure(script, SCRIPTS[script], args.runs)
+        results["results"][script] = result
+        if "error" in result:
+            print(f"{script:<10} ошибка: {result['error']}")
+            continue
+        print(
+            f"{script:<10} {result['seconds']:7.3f}s всего,"
+            f" {result['import_seconds']:7.3f}s импорты"
+        )
+        for name, seconds in result["top_imports"].items():
+            print(f"    {seconds * 1000:8.1f} мс  {name}")
+
+    if args.output:
+        args.output.write_text(json.dumps(results, ensure_ascii=False, indent=2), encoding="utf-8")
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(
+            {"results": {k: {"seconds": v.get("seconds")} for k, v in results["results"].items()}},
+            baseline,
+            args.threshold,
+        )
+        for line in regressions:
+            print(f"РЕГРЕССИЯ {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
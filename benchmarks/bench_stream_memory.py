@@ -0,0 +1,59 @@
+"""
+Пиковая память: json.load() против потокового чтения employees.json.
+
+    python -m benchmarks.bench_stream_memory --sizes 10000 100000 300000
+"""
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from application.db.json_stream import iter_employee_records
+from benchmarks.synthetic import write_roster
+
+
+def _measure(fn) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def _json_load(path: Path) -> None:
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    count = sum(1 for e in data["employees"] if e.get("is_active", True))
+    assert count
+
+
+def _stream(path: Path) -> None:
+    count = sum(1 for _ in iter_employee_records(path))
+    assert count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 300_000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            path = write_roster(n, Path(tmp) / f"employees_{n}.json")
+            size_mb = path.stat().st_size / 2**20
+            load_time, load_peak = _measure(lambda: _json_load(path))
+            stream_time, stream_peak = _measure(lambda: _stream(path))
+            print(
+                f"n={n:>9,} file={size_mb:7.1f} MiB  "
+                f"json.load: {load_time:6.2f}s peak={load_peak:8.1f} MiB  "
+                f"stream: {stream_time:6.2f}s peak={stream_peak:6.2f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
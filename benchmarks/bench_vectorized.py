@@ -0,0 +1,39 @@
+"""
+Бенчмарк NumPy-ядра расчёта против скалярного calculate_employee_salary().
+
+    python -m benchmarks.bench_vectorized --rows 1000000
+"""
+
+import argparse
+import time
+
+from benchmarks.synthetic import make_roster
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    from utils.salary_calculator import calculate_employee_salary
+    from utils.salary_vectorized import calculate_salary_columns, employee_columns
+
+    employees = make_roster(args.rows)["employees"]
+    columns = employee_columns(employees)
+
+    start = time.perf_counter()
+    for emp in employees:
+        calculate_employee_salary(emp)
+    scalar = time.perf_counter() - start
+
+    start = time.perf_counter()
+    calculate_salary_columns(**columns)
+    vectorized = time.perf_counter() - start
+
+    print(f"rows={args.rows:,}")
+    print(f"scalar     {scalar:8.3f}s  {args.rows / scalar:14,.0f} rows/s")
+    print(f"vectorized {vectorized:8.3f}s  {args.rows / vectorized:14,.0f} rows/s  x{scalar / vectorized:,.1f}")
+
+
+if __name__ == "__main__":
+    main()
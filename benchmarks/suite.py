@@ -0,0 +1,267 @@
+"""
+Сквозной бенчмарк расчёта зарплаты на реалистичных синтетических штатах.
+
+Для каждого размера генерируется справочник (benchmarks.synthetic.generate_employees),
+каждый сценарий запускается в отдельном процессе: время, пропускная способность
+и пиковая память пишутся в JSON. С --baseline результаты сравниваются с
+сохранённым прогоном; замедление или рост памяти больше --threshold —
+регрессия (код выхода 1).
+
+    python -m benchmarks.suite --sizes 1000 100000 1000000 --output bench.json
+    python -m benchmarks.suite --sizes 1000 100000 --baseline bench.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.synthetic import write_synthetic_roster
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Число случайных calculate_salary() на прогон
+SALARY_LOOKUPS = 1_000
+
+
+def _peak_memory_mb() -> float:
+    """Пиковая память процесса сценария (RSS; без resource — пик tracemalloc)."""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux — килобайты, macOS — байты
+        return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+    import tracemalloc
+
+    return tracemalloc.get_traced_memory()[1] / (1024 * 1024)
+
+
+# Сценарий: setup() выполняется без замера и возвращает функцию замера,
+# которая возвращает число обработанных элементов.
+Case = Callable[[int], Callable[[], int]]
+
+
+def _get_employees(n: int) -> Callable[[], int]:
+    from application.db.people import get_employees
+
+    return lambda: len(get_employees(use_db_if_available=False))
+
+
+def _case_get_employees(n: int) -> Callable[[], int]:
+    from application.db.snapshot import load_roster
+
+    load_roster(Path(os.environ["BALANSOFT_EMPLOYEES_JSON"]))  # снимок строится заранее
+    return _get_employees(n)
+
+
+def _case_get_employees_json(n: int) -> Callable[[], int]:
+    os.environ["BALANSOFT_SNAPSHOT"] = "0"
+    return _get_employees(n)
+
+
+def _case_calculate_salary(n: int) -> Callable[[], int]:
+    from application.salary import calculate_salary
+
+    calculate_salary(1)  # загрузка справочника — в сценариях get_employees
+    ids = random.Random(0).choices(range(1, n + 1), k=SALARY_LOOKUPS)
+
+    def run() -> int:
+        for employee_id in ids:
+            calculate_salary(employee_id)
+        return len(ids)
+
+    return run
+
+
+def _case_calculate_payroll(n: int) -> Callable[[], int]:
+    from application.salary import calculate_payroll, calculate_salary
+
+    calculate_salary(1)
+    return lambda: len(calculate_payroll()["results"])
+
+
+def _case_seed(n: int) -> Callable[[], int]:
+    from sqlalchemy import create_engine
+
+    from database.models import Base
+    from database.seed import iter_employees_json, load_departments, seed_departments_bulk
+    from database.seed import seed_employees_bulk
+
+    db_path = Path(os.environ["BALANSOFT_EMPLOYEES_JSON"]).with_suffix(".bench.db")
+    db_path.unlink(missing_ok=True)
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(engine)
+
+    def run() -> int:
+        with engine.begin() as conn:
+            seed_departments_bulk(conn, load_departments())
+            count = seed_employees_bulk(conn, iter_employees_json(), progress=None)
+        engine.dispose()
+        db_path.unlink(missing_ok=True)
+        return count
+
+    return run
+
+
+def _case_format(n: int) -> Callable[[], int]:
+    from application.salary import calculate_payroll
+    from utils.formatters import format_currency
+
+    results = calculate_payroll()["results"]
+
+    def run() -> int:
+        for r in results:
+            format_currency(r["base_salary"])
+            format_currency(r["ndfl"])
+            format_currency(r["special_deduction"])
+            format_currency(r["net_salary"])
+        return len(results) * 4
+
+    return run
+
+
+CASES: dict[str, Case] = {
+    "get_employees": _case_get_employees,
+    "get_employees_json": _case_get_employees_json,
+    "calculate_salary": _case_calculate_salary,
+    "calculate_payroll": _case_calculate_payroll,
+    "seed_bulk": _case_seed,
+    "format_currency": _case_format,
+}
+
+
+def run_case(name: str, n: int) -> dict[str, Any]:
+    """Выполнить сценарий в текущем процессе (справочник — BALANSOFT_EMPLOYEES_JSON)."""
+    if resource is None:
+        import tracemalloc
+
+        tracemalloc.start()
+    measure = CASES[name](n)
+    start = time.perf_counter()
+    items = measure()
+    seconds = time.perf_counter() - start
+    return {
+        "seconds": round(seconds, 6),
+        "items": items,
+        "items_per_second": round(items / seconds, 1) if seconds > 0 else None,
+        "peak_memory_mb": round(_peak_memory_mb(), 1),
+    }
+
+
+def _spawn(name: str, n: int, roster: Path, env: dict[str, str]) -> dict[str, Any]:
+    result_file = roster.with_suffix(f".{name}.json")
+    cmd = [
+        sys.executable, "-m", "benchmarks.suite",
+        "--run-case", name, "--size", str(n), "--result-file", str(result_file),
+    ]  # fmt: skip
+    env = {**env, "BALANSOFT_EMPLOYEES_JSON": str(roster)}
+    proc = subprocess.run(cmd, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        tail = (proc.stderr or proc.stdout).strip().splitlines()[-1:]
+        return {"error": tail[0] if tail else f"exit code {proc.returncode}"}
+    return json.loads(result_file.read_text(encoding="utf-8"))
+
+
+def compare(
+    results: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[str]:
+    """
+    Регрессии относительно базового прогона.
+
+    Сравниваются сценарии, которые есть в обоих прогонах: время и пиковая
+    память, выросшие больше чем в (1 + threshold) раз.
+    """
+    regressions = []
+    for key, current in results.get("results", {}).items():
+        base = baseline.get("results", {}).get(key)
+        if not base or "error" in base or "error" in current:
+            continue
+        for metric in ("seconds", "peak_memory_mb"):
+            old, new = base.get(metric), current.get(metric)
+            if old and new and new > old * (1 + threshold):
+                regressions.append(f"{key}: {metric} {old} -> {new} (+{new / old - 1:.0%})")
+    return regressions
+
+
+def _print_row(key: str, result: dict[str, Any]) -> None:
+    if "error" in result:
+        print(f"{key:<32} ошибка: {result['error']}")
+        return
+    rate = result["items_per_second"] or 0
+    print(
+        f"{key:<32} {result['seconds']:9.3f}s {rate:14,.0f}/s"
+        f" {result['peak_memory_mb']:9.1f} МБ"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--seed", type=int, default=0, help="seed генератора штата")
+    parser.add_argument("--output", type=Path, help="записать результаты в JSON")
+    parser.add_argument("--baseline", type=Path, help="JSON прошлого прогона для сравнения")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="допустимый рост времени/памяти (0.2 = 20%%)"
+    )
+    # Внутренний режим: один сценарий в дочернем процессе
+    parser.add_argument("--run-case", choices=sorted(CASES), help=argparse.SUPPRESS)
+    parser.add_argument("--size", type=int, help=argparse.SUPPRESS)
+    parser.add_argument("--result-file", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        result = run_case(args.run_case, args.size)
+        args.result_file.write_text(json.dumps(result), encoding="utf-8")
+        return
+
+    report: dict[str, Any] = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "seed": args.seed,
+        },
+        "results": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        env = {**os.environ, "BALANSOFT_SNAPSHOT_DIR": tmp}
+        for n in args.sizes:
+            start = time.perf_counter()
+            roster = write_synthetic_roster(n, Path(tmp) / f"employees_{n}.json", args.seed)
+            print(f"штат n={n:,}: сгенерирован за {time.perf_counter() - start:.1f}s")
+            for name in args.cases:
+                key = f"{name}@{n}"
+                report["results"][key] = result = _spawn(name, n, roster, env)
+                _print_row(key, result)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Результаты: {args.output}")
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare(report, baseline, args.threshold)
+        for line in regressions:
+            print(f"РЕГРЕССИЯ {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"Регрессий нет (порог {args.threshold:.0%})")
+
+
+if __name__ == "__main__":
+    main()
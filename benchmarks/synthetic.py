@@ -0,0 +1,141 @@
+"""Синтетические ростеры на основе data/employees.json для бенчмарков."""
+
+import copy
+import json
+import random
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+_SOURCE = Path(__file__).resolve().parent.parent / "data" / "employees.json"
+
+
+def load_template() -> dict[str, Any]:
+    """Исходный справочник компании."""
+    with open(_SOURCE, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_roster(n: int) -> dict[str, Any]:
+    """Справочник с n сотрудниками: копии исходных 10 с новыми id и кодами."""
+    data = load_template()
+    templates = data["employees"]
+    employees = []
+    for i in range(n):
+        emp = copy.deepcopy(templates[i % len(templates)])
+        emp["id"] = i + 1
+        emp["employee_code"] = f"SYN-{i + 1:07d}"
+        employees.append(emp)
+    data["employees"] = employees
+    data["company"]["employee_count"] = n
+    return data
+
+
+def write_roster(n: int, path: Path) -> Path:
+    """Записать синтетический справочник в path."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(make_roster(n), f, ensure_ascii=False)
+    return path
+
+
+# Доли для реалистичного штата: разряды, стандартные вычеты на детей, удержания
+_GRADE_WEIGHTS = {1: 10, 2: 20, 3: 25, 4: 25, 5: 15, 6: 5}
+_TAX_DEDUCTIONS = ((0, 70), (1400, 18), (2800, 8), (6000, 4))
+_ALIMONY_SHARE = 0.05  # по исполнительным листам на алименты
+_ALIMONY_PERCENTS = ((25, 1, 60), (33, 2, 30), (50, 3, 10))  # (процент, детей, вес)
+_PROCEEDINGS_SHARE = 0.03  # исполнительное производство
+_OFF_GRID_SHARE = 0.05  # оклад отличается от сетки (персональная надбавка)
+_INACTIVE_SHARE = 0.03
+
+
+def _weighted(rng: random.Random, pairs: Iterable[tuple[Any, int]]) -> Any:
+    values, weights = zip(*pairs)
+    return rng.choices(values, weights)[0]
+
+
+def _date(rng: random.Random, first_year: int, last_year: int) -> str:
+    return f"{rng.randint(first_year, last_year)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+
+
+def generate_employees(n: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    """
+    Реалистичный штат из n сотрудников по схеме employees.json (по одному).
+
+    Разряды и коэффициенты — по tariff_grid, оклад = оклад 1-го разряда ×
+    коэффициент (у ~5% — персональный оклад), стандартные вычеты на детей у
+    ~30%, алименты у ~5% и исполнительное производство у ~3% сотрудников,
+    ~3% неактивных. Результат воспроизводим для одного seed.
+    """
+    data = load_template()
+    rng = random.Random(seed)
+    templates = data["employees"]
+    departments = data["departments"]
+    grid = {row["grade"]: row for row in data["tariff_grid"]}
+    base = data["company"]["base_salary_grade_1"]
+    grade_pairs = list(_GRADE_WEIGHTS.items())
+
+    for i in range(1, n + 1):
+        emp = dict(rng.choice(templates))
+        dept = rng.choice(departments)
+        grade = _weighted(rng, grade_pairs)
+        low, high = grid[grade]["min_coefficient"], grid[grade]["max_coefficient"]
+        coefficient = round(rng.uniform(low, high), 1)
+        salary = base * coefficient
+        if rng.random() < _OFF_GRID_SHARE:
+            salary *= rng.uniform(0.95, 1.15)
+
+        conditions = None
+        roll = rng.random()
+        if roll < _ALIMONY_SHARE:
+            percent, children, _ = _weighted(rng, ((p, p[2]) for p in _ALIMONY_PERCENTS))
+            conditions = {
+                "type": "alimony",
+                "description": f"Алименты на {children} детей",
+                "deduction_percent": percent,
+                "start_date": _date(rng, 2019, 2024),
+                "child_count": children,
+                "max_percent": 70,
+            }
+        elif roll < _ALIMONY_SHARE + _PROCEEDINGS_SHARE:
+            conditions = {
+                "type": "executive_proceedings",
+                "description": "Исполнительное производство",
+                "deduction_percent": rng.choice([10, 20, 30, 50]),
+                "start_date": _date(rng, 2021, 2024),
+                "case_number": f"ИП-{i}/{rng.randint(2021, 2024)}",
+                "max_percent": 50,
+            }
+
+        emp.update(
+            id=i,
+            employee_code=f"{dept['code']}-{i:07d}",
+            department_id=dept["id"],
+            department=dept["name"],
+            tariff_grade=grade,
+            coefficient=coefficient,
+            base_salary=round(salary, 2),
+            tax_deduction=_weighted(rng, _TAX_DEDUCTIONS),
+            hire_date=_date(rng, 2015, 2024),
+            birth_date=_date(rng, 1960, 2004),
+            special_conditions=conditions,
+            is_active=rng.random() >= _INACTIVE_SHARE,
+        )
+        yield emp
+
+
+def write_synthetic_roster(n: int, path: Path, seed: int = 0) -> Path:
+    """Записать реалистичный справочник из n сотрудников потоком (память не растёт с n)."""
+    data = load_template()
+    data["company"]["employee_count"] = n
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("{")
+        for key, value in data.items():
+            if key != "employees":
+                f.write(f"{json.dumps(key)}: {json.dumps(value, ensure_ascii=False)}, ")
+        f.write('"employees": [')
+        for i, emp in enumerate(generate_employees(n, seed)):
+            if i:
+                f.write(",\n")
+            f.write(json.dumps(emp, ensure_ascii=False))
+        f.write("]}")
+    return path
@@ -0,0 +1,90 @@
+"""
+Async PostgreSQL connection via asyncpg (optional).
+
+Как и database.session, движок и фабрика сессий создаются при первом
+обращении (get_async_engine(), get_async_sessionmaker() или атрибуты
+async_engine, AsyncSessionLocal); импорт модуля побочных эффектов не имеет.
+"""
+
+import threading
+from typing import Any, AsyncIterator, Optional
+
+from database.session import database_url
+
+_lock = threading.RLock()  # фабрика сессий внутри блокировки создаёт движок
+
+
+def to_async_url(url: str) -> str:
+    """postgresql:// → postgresql+asyncpg://, sqlite:// → sqlite+aiosqlite://."""
+    scheme, sep, rest = url.partition("://")
+    driverless = scheme.split("+", 1)[0]
+    if driverless == "postgresql":
+        return f"postgresql+asyncpg{sep}{rest}"
+    if driverless == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+def _create_async_engine() -> Any:
+    url = database_url()
+    if url is None:
+        return None
+    try:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from database.config import engine_options
+
+        async_url = to_async_url(url)
+        return create_async_engine(async_url, **engine_options(async_url))
+    except ImportError:
+        return None
+
+
+def _create_async_sessionmaker() -> Any:
+    engine = get_async_engine()
+    if engine is None:
+        return None
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+def _lazy(name: str, factory: Any) -> Any:
+    module = globals()
+    if name not in module:
+        with _lock:
+            if name not in module:
+                module[name] = factory()
+    return module[name]
+
+
+def get_async_engine() -> Any:
+    """Async-движок (создаётся при первом вызове); None — БД не настроена или нет драйвера."""
+    return _lazy("async_engine", _create_async_engine)
+
+
+def get_async_sessionmaker() -> Any:
+    """Фабрика AsyncSession поверх get_async_engine(); None — БД недоступна."""
+    return _lazy("AsyncSessionLocal", _create_async_sessionmaker)
+
+
+async def get_async_db() -> AsyncIterator[Optional[object]]:
+    """Get async database session."""
+    factory = get_async_sessionmaker()
+    if factory is None:
+        raise RuntimeError("БД не настроена: задайте DATABASE_URL и установите sqlalchemy")
+    async with factory() as db:
+        yield db
+
+
+def __getattr__(name: str) -> Any:
+    if name == "async_engine":
+        return get_async_engine()
+    if name == "AsyncSessionLocal":
+        return get_async_sessionmaker()
+    if name == "DATABASE_URL":
+        return database_url()
+    if name == "ASYNC_DATABASE_URL":
+        url = database_url()
+        return None if url is None else to_async_url(url)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,52 @@
+"""Engine/pool settings from environment variables (optional DB layer)."""
+
+import os
+from typing import Any
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+def _env_float(name: str, default: float) -> float:
+    return float(os.getenv(name, str(default)))
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    return os.getenv(name, "1" if default else "0").lower() in ("1", "true", "yes", "on")
+
+
+def connect_timeout() -> float:
+    """Таймаут установки соединения, секунды (BALANSOFT_DB_CONNECT_TIMEOUT)."""
+    return _env_float("BALANSOFT_DB_CONNECT_TIMEOUT", 2.0)
+
+
+def engine_options(url: str) -> dict[str, Any]:
+    """
+    Параметры create_engine()/create_async_engine() для url.
+
+    Пул (размер, переполнение, ожидание, recycle, pre-ping) настраивается
+    переменными BALANSOFT_DB_*; для SQLite используется пул по умолчанию.
+    Короткий connect timeout не даёт недоступному хосту блокировать вызов
+    на время TCP-таймаута.
+    """
+    scheme = url.split("://", 1)[0]
+    driver = scheme.split("+", 1)[1] if "+" in scheme else ""
+    timeout = connect_timeout()
+
+    if scheme.startswith("sqlite"):
+        return {"connect_args": {"timeout": timeout}}
+
+    if driver == "asyncpg":
+        connect_args: dict[str, Any] = {"timeout": timeout}
+    else:
+        connect_args = {"connect_timeout": max(1, int(timeout))}
+
+    return {
+        "pool_size": _env_int("BALANSOFT_DB_POOL_SIZE", 5),
+        "max_overflow": _env_int("BALANSOFT_DB_MAX_OVERFLOW", 10),
+        "pool_timeout": _env_float("BALANSOFT_DB_POOL_TIMEOUT", 5.0),
+        "pool_recycle": _env_int("BALANSOFT_DB_POOL_RECYCLE", 1800),
+        "pool_pre_ping": _env_bool("BALANSOFT_DB_POOL_PRE_PING", True),
+        "connect_args": connect_args,
+    }
@@ -0,0 +1,78 @@
+"""
+Итоги по отделам из таблицы department_summary (ведётся триггерами на employees).
+
+Чтение — одна строка на отдел, без агрегации по всем сотрудникам;
+refresh_department_summary() пересчитывает таблицу целиком (после загрузки в
+обход триггеров или для сверки).
+"""
+
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.engine import Connection
+
+from database.models import Department, DepartmentSummary, Employee
+
+_CENT = Decimal("0.01")
+
+
+def _money(value: Any) -> Decimal:
+    # SQLite хранит NUMERIC как REAL — приводим к копейкам
+    return Decimal(str(value or 0)).quantize(_CENT)
+
+
+def get_department_summary(conn: Connection) -> list[dict[str, Any]]:
+    """
+    Активные сотрудники по отделам: headcount, total_base_salary, total_tax_relief.
+
+    total_tax_relief — сумма налоговых вычетов (tax_deduction), уменьшающих базу
+    НДФЛ, а не удержаний: НДФЛ и особые удержания по отделам за период — в
+    payroll_results. Отделы без активных сотрудников не возвращаются; порядок —
+    по department_id.
+    """
+    summary = DepartmentSummary.__table__
+    stmt = (
+        select(
+            summary.c.department_id,
+            Department.name,
+            summary.c.headcount,
+            summary.c.total_base_salary,
+            summary.c.total_tax_relief,
+        )
+        .outerjoin(Department, Department.id == summary.c.department_id)
+        .where(summary.c.headcount > 0)
+        .order_by(summary.c.department_id)
+    )
+    return [
+        {
+            "department_id": row.department_id,
+            "department": row.name or "",
+            "headcount": row.headcount,
+            "total_base_salary": _money(row.total_base_salary),
+            "total_tax_relief": _money(row.total_tax_relief),
+        }
+        for row in conn.execute(stmt)
+    ]
+
+
+def refresh_department_summary(conn: Connection) -> int:
+    """Пересчитать department_summary по employees (GROUP BY); возвращает число отделов."""
+    summary = DepartmentSummary.__table__
+    totals = (
+        select(
+            Employee.department_id,
+            func.count(),
+            func.coalesce(func.sum(Employee.base_salary), 0),
+            func.coalesce(func.sum(Employee.tax_deduction), 0),
+        )
+        .where(Employee.is_active == True, Employee.department_id.is_not(None))  # noqa: E712
+        .group_by(Employee.department_id)
+    )
+    conn.execute(delete(summary))
+    result = conn.execute(
+        insert(summary).from_select(
+            ["department_id", "headcount", "total_base_salary", "total_tax_relief"], totals
+        )
+    )
+    return result.rowcount
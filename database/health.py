@@ -0,0 +1,112 @@
+"""DB availability probe with a circuit breaker (optional DB layer)."""
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Размыкатель для БД: после сбоя БД пропускается на cooldown секунд,
+    успешная проверка считается действительной probe_ttl секунд.
+    """
+
+    def __init__(
+        self,
+        cooldown: float = 30.0,
+        probe_ttl: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.cooldown = cooldown
+        self.probe_ttl = probe_ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failed_at: float | None = None
+        self._ok_at: float | None = None
+        self.failures = 0
+        self.skipped = 0
+
+    @property
+    def is_open(self) -> bool:
+        """True — недавно был сбой, к БД не обращаемся."""
+        with self._lock:
+            if self._failed_at is None:
+                return False
+            if self._clock() - self._failed_at < self.cooldown:
+                return True
+            self._failed_at = None
+            return False
+
+    def allow(self) -> bool:
+        """Можно ли обращаться к БД (при отказе увеличивает счётчик пропусков)."""
+        if self.is_open:
+            with self._lock:
+                self.skipped += 1
+            return False
+        return True
+
+    def recently_ok(self) -> bool:
+        """Была ли успешная проверка в пределах probe_ttl."""
+        with self._lock:
+            return self._ok_at is not None and self._clock() - self._ok_at < self.probe_ttl
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._ok_at = self._clock()
+            self._failed_at = None
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failed_at = self._clock()
+            self._ok_at = None
+            self.failures += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._failed_at = None
+            self._ok_at = None
+            self.failures = 0
+            self.skipped = 0
+
+
+breaker = CircuitBreaker(
+    cooldown=float(os.getenv("BALANSOFT_DB_COOLDOWN", "30")),
+    probe_ttl=float(os.getenv("BALANSOFT_DB_PROBE_TTL", "10")),
+)
+
+
+def db_available() -> bool:
+    """
+    Быстрая проверка доступности БД.
+
+    Пока размыкатель открыт — сразу False; после недавней успешной проверки —
+    сразу True; иначе SELECT 1 через движок с коротким connect timeout.
+    """
+    if not breaker.allow():
+        return False
+    if breaker.recently_ok():
+        return True
+
+    try:
+        from database.session import engine
+
+        if engine is None:
+            return False
+
+        from sqlalchemy import text
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except ImportError:
+        return False
+    except Exception as e:
+        logger.warning("БД недоступна, пропускаем её на %.0f с: %s", breaker.cooldown, e)
+        breaker.record_failure()
+        return False
+
+    breaker.record_success()
+    return True
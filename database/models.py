@@ -1,10 +1,24 @@
 """SQLAlchemy models for Balansoft (optional DB layer)."""
 
-from datetime import date
+from datetime import date, datetime
 from typing import Optional
 
 try:
-    from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String, Boolean, JSON
+    from sqlalchemy import (
+        JSON,
+        BigInteger,
+        Boolean,
+        Column,
+        Date,
+        DateTime,
+        ForeignKey,
+        Index,
+        Integer,
+        Numeric,
+        String,
+        event,
+        text,
+    )
     from sqlalchemy.orm import DeclarativeBase, relationship
 
     class Base(DeclarativeBase):
@@ -25,6 +39,19 @@ try:
         """Employee model."""
 
         __tablename__ = "employees"
+        __table_args__ = (
+            # Свёртки по отделам и внешний ключ
+            Index("ix_employees_department_id", "department_id"),
+            # Частичный индекс по активным (фильтр get_employees(), выборка отдела по id);
+            # условие совпадает с тем, как SQLAlchemy пишет is_active == True в каждой СУБД
+            Index(
+                "ix_employees_active_department",
+                "department_id",
+                "id",
+                postgresql_where=text("is_active"),
+                sqlite_where=text("is_active = 1"),
+            ),
+        )
 
         id = Column(Integer, primary_key=True, autoincrement=True)
         employee_code = Column(String(20), unique=True)
@@ -37,13 +64,246 @@ try:
         department_id = Column(Integer, ForeignKey("departments.id"))
         position = Column(String(200))
         tariff_grade = Column(Integer)
-        coefficient = Column(Float)
-        base_salary = Column(Float)
-        tax_deduction = Column(Float, default=0)
+        coefficient = Column(Numeric(5, 2))
+        base_salary = Column(Numeric(12, 2))
+        tax_deduction = Column(Numeric(12, 2), default=0)
         special_conditions = Column(JSON, nullable=True)
         is_active = Column(Boolean, default=True)
 
+    class RosterVersion(Base):
+        """
+        Change counter of the roster (employees and departments), single row id=1.
+
+        Bumped by triggers on every write (see VERSION_TRIGGERS), including raw
+        SQL, COPY and bulk upserts, so the roster cache checks one row by primary
+        key instead of aggregating the employees table.
+        """
+
+        __tablename__ = "roster_version"
+
+        id = Column(Integer, primary_key=True, autoincrement=False)
+        version = Column(BigInteger, nullable=False, default=0)
+
+    class PayrollResult(Base):
+        """
+        Stored payroll result: one row per employee and period (first day of month).
+
+        Employee name, code and department are copied at calculation time, so
+        historical payslips do not change when the roster does; there is no
+        foreign key to employees for the same reason.
+        """
+
+        __tablename__ = "payroll_results"
+        __table_args__ = (
+            # Итоги по отделам за период и ведомость периода
+            Index("ix_payroll_results_period_department", "period", "department_id"),
+            # История расчётных листков сотрудника
+            Index("ix_payroll_results_employee_period", "employee_id", "period"),
+        )
+
+        period = Column(Date, primary_key=True)
+        employee_id = Column(Integer, primary_key=True, autoincrement=False)
+        employee_code = Column(String(20))
+        employee_name = Column(String(200))
+        department_id = Column(Integer)
+        department = Column(String(100))
+        base_salary = Column(Numeric(12, 2), nullable=False)
+        tax_deduction = Column(Numeric(12, 2), nullable=False)
+        ndfl = Column(Numeric(12, 2), nullable=False)
+        special_deduction = Column(Numeric(12, 2), nullable=False)
+        net_salary = Column(Numeric(12, 2), nullable=False)
+        calculated_at = Column(DateTime, nullable=False, default=datetime.now)
+
+    class DepartmentSummary(Base):
+        """
+        Active headcount and salary totals per department.
+
+        Maintained by triggers on employees (PostgreSQL and SQLite, see
+        SUMMARY_TRIGGERS), so dashboards read one row per department instead
+        of aggregating the whole employees table. total_tax_relief sums the
+        employees' tax_deduction (relief lowering the NDFL base), not amounts
+        withheld: NDFL and special deductions depend on the calculation rules
+        and are stored per period in payroll_results.
+        """
+
+        __tablename__ = "department_summary"
+
+        department_id = Column(Integer, primary_key=True, autoincrement=False)
+        headcount = Column(Integer, nullable=False, default=0)
+        total_base_salary = Column(Numeric(14, 2), nullable=False, default=0)
+        total_tax_relief = Column(Numeric(14, 2), nullable=False, default=0)
+
+    # Триггеры roster_version: любое изменение employees/departments увеличивает
+    # счётчик. В PostgreSQL — один раз на команду (FOR EACH STATEMENT, в том
+    # числе TRUNCATE), в SQLite — на каждую строку. Миграция 003_roster_version.py
+    # хранит собственную копию DDL.
+    VERSION_TRIGGERS = {
+        "postgresql": (
+            "INSERT INTO roster_version (id, version) VALUES (1, 0) ON CONFLICT (id) DO NOTHING",
+            """
+            CREATE OR REPLACE FUNCTION roster_version_bump() RETURNS trigger AS $$
+            BEGIN
+                UPDATE roster_version SET version = version + 1 WHERE id = 1;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            # DROP + CREATE вместо CREATE OR REPLACE TRIGGER (только с PostgreSQL 14)
+            *(
+                statement
+                for table in ("employees", "departments")
+                for statement in (
+                    f"DROP TRIGGER IF EXISTS {table}_roster_version ON {table}",
+                    f"""
+                    CREATE TRIGGER {table}_roster_version
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table}
+                    FOR EACH STATEMENT EXECUTE FUNCTION roster_version_bump()
+                    """,
+                )
+            ),
+        ),
+        "sqlite": (
+            """
+            INSERT INTO roster_version (id, version)
+            SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM roster_version WHERE id = 1)
+            """,
+            *(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_roster_version_{op.lower()}
+                AFTER {op} ON {table}
+                BEGIN
+                    UPDATE roster_version SET version = version + 1 WHERE id = 1;
+                END
+                """
+                for table in ("employees", "departments")
+                for op in ("INSERT", "UPDATE", "DELETE")
+            ),
+        ),
+    }
+
+    # Триггеры department_summary: активный сотрудник с отделом прибавляется
+    # к строке своего отдела, при изменении или удалении — вычитается. В SQLite
+    # строка отдела создаётся через NOT EXISTS, а не INSERT OR IGNORE: политику
+    # конфликтов в теле триггера переопределяет внешний upsert.
+    # Миграция 005_indexes_department_summary.py хранит собственную копию DDL.
+    SUMMARY_TRIGGERS = {
+        "postgresql": (
+            """
+            CREATE OR REPLACE FUNCTION department_summary_sync() RETURNS trigger AS $$
+            BEGIN
+                IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.is_active
+                        AND OLD.department_id IS NOT NULL THEN
+                    UPDATE department_summary SET
+                        headcount = headcount - 1,
+                        total_base_salary = total_base_salary - COALESCE(OLD.base_salary, 0),
+                        total_tax_relief = total_tax_relief - COALESCE(OLD.tax_deduction, 0)
+                    WHERE department_id = OLD.department_id;
+                END IF;
+                IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.is_active
+                        AND NEW.department_id IS NOT NULL THEN
+                    INSERT INTO department_summary AS s
+                        (department_id, headcount, total_base_salary, total_tax_relief)
+                    VALUES (NEW.department_id, 1, COALESCE(NEW.base_salary, 0),
+                            COALESCE(NEW.tax_deduction, 0))
+                    ON CONFLICT (department_id) DO UPDATE SET
+                        headcount = s.headcount + 1,
+                        total_base_salary = s.total_base_salary + EXCLUDED.total_base_salary,
+                        total_tax_relief = s.total_tax_relief + EXCLUDED.total_tax_relief;
+                END IF;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            """
+            CREATE OR REPLACE FUNCTION department_summary_truncate() RETURNS trigger AS $$
+            BEGIN
+                DELETE FROM department_summary;
+                RETURN NULL;
+            END
+            $$ LANGUAGE plpgsql
+            """,
+            # DROP + CREATE вместо CREATE OR REPLACE TRIGGER (только с PostgreSQL 14)
+            "DROP TRIGGER IF EXISTS employees_department_summary ON employees",
+            """
+            CREATE TRIGGER employees_department_summary
+            AFTER INSERT OR DELETE
+                OR UPDATE OF department_id, is_active, base_salary, tax_deduction
+            ON employees FOR EACH ROW EXECUTE FUNCTION department_summary_sync()
+            """,
+            "DROP TRIGGER IF EXISTS employees_department_summary_truncate ON employees",
+            """
+            CREATE TRIGGER employees_department_summary_truncate
+            AFTER TRUNCATE ON employees
+            FOR EACH STATEMENT EXECUTE FUNCTION department_summary_truncate()
+            """,
+        ),
+        "sqlite": (
+            """
+            CREATE TRIGGER IF NOT EXISTS employees_summary_insert AFTER INSERT ON employees
+            WHEN NEW.is_active AND NEW.department_id IS NOT NULL
+            BEGIN
+                INSERT INTO department_summary
+                    (department_id, headcount, total_base_salary, total_tax_relief)
+                SELECT NEW.department_id, 0, 0, 0
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM department_summary WHERE department_id = NEW.department_id
+                );
+                UPDATE department_summary SET
+                    headcount = headcount + 1,
+                    total_base_salary = total_base_salary + COALESCE(NEW.base_salary, 0),
+                    total_tax_relief = total_tax_relief + COALESCE(NEW.tax_deduction, 0)
+                WHERE department_id = NEW.department_id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS employees_summary_delete AFTER DELETE ON employees
+            WHEN OLD.is_active AND OLD.department_id IS NOT NULL
+            BEGIN
+                UPDATE department_summary SET
+                    headcount = headcount - 1,
+                    total_base_salary = total_base_salary - COALESCE(OLD.base_salary, 0),
+                    total_tax_relief = total_tax_relief - COALESCE(OLD.tax_deduction, 0)
+                WHERE department_id = OLD.department_id;
+            END
+            """,
+            """
+            CREATE TRIGGER IF NOT EXISTS employees_summary_update
+            AFTER UPDATE OF department_id, is_active, base_salary, tax_deduction ON employees
+            BEGIN
+                UPDATE department_summary SET
+                    headcount = headcount - 1,
+                    total_base_salary = total_base_salary - COALESCE(OLD.base_salary, 0),
+                    total_tax_relief = total_tax_relief - COALESCE(OLD.tax_deduction, 0)
+                WHERE OLD.is_active AND department_id = OLD.department_id;
+                INSERT INTO department_summary
+                    (department_id, headcount, total_base_salary, total_tax_relief)
+                SELECT NEW.department_id, 0, 0, 0
+                WHERE NEW.is_active AND NEW.department_id IS NOT NULL AND NOT EXISTS (
+                    SELECT 1 FROM department_summary WHERE department_id = NEW.department_id
+                );
+                UPDATE department_summary SET
+                    headcount = headcount + 1,
+                    total_base_salary = total_base_salary + COALESCE(NEW.base_salary, 0),
+                    total_tax_relief = total_tax_relief + COALESCE(NEW.tax_deduction, 0)
+                WHERE NEW.is_active AND department_id = NEW.department_id;
+            END
+            """,
+        ),
+    }
+
+    @event.listens_for(Base.metadata, "after_create")
+    def _create_triggers(target, connection, **kw) -> None:
+        """Install roster_version and department_summary triggers after create_all()."""
+        for triggers in (VERSION_TRIGGERS, SUMMARY_TRIGGERS):
+            for statement in triggers.get(connection.dialect.name, ()):
+                connection.exec_driver_sql(statement)
+
 except ImportError:
     Base = None
     Department = None
     Employee = None
+    RosterVersion = None
+    PayrollResult = None
+    DepartmentSummary = None
+    VERSION_TRIGGERS = {}
+    SUMMARY_TRIGGERS = {}
@@ -0,0 +1,261 @@
+"""
+Сохранённые результаты расчёта зарплаты (таблица payroll_results).
+
+Запись — пакетами: в PostgreSQL через COPY (psycopg 3 или psycopg2), в
+остальных СУБД (SQLite в тестах) — пакетным INSERT (executemany). Чтение —
+расчётные листки и итоги по отделам прямо из таблицы, по индексам
+(period, department_id) и (employee_id, period), без повторного расчёта.
+
+    python -m database.payroll_results 2026-10 [--ids 1 2 3]
+"""
+
+import csv
+import io
+import itertools
+import time
+from collections.abc import Callable, Iterable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import and_, delete, func, insert, select
+from sqlalchemy.engine import Connection
+
+from database.models import PayrollResult
+from database.session import get_engine
+
+# Колонки в порядке записи (COPY и INSERT)
+COLUMNS = (
+    "period",
+    "employee_id",
+    "employee_code",
+    "employee_name",
+    "department_id",
+    "department",
+    "base_salary",
+    "tax_deduction",
+    "ndfl",
+    "special_deduction",
+    "net_salary",
+    "calculated_at",
+)
+_MONEY = ("base_salary", "tax_deduction", "ndfl", "special_deduction", "net_salary")
+# Суммируемые поля итогов (как в calculate_payroll())
+_TOTALS = ("base_salary", "ndfl", "special_deduction", "net_salary")
+
+
+def normalize_period(period: date | str) -> date:
+    """Период — первое число месяца; принимает date/datetime или строку YYYY-MM[-DD]."""
+    if isinstance(period, str):
+        period = datetime.strptime(period[:7], "%Y-%m").date()
+    return date(period.year, period.month, 1)
+
+
+def _copy_driver(conn: Connection) -> str | None:
+    """Драйвер PostgreSQL с поддержкой COPY или None."""
+    if conn.dialect.name != "postgresql":
+        return None
+    driver = conn.dialect.driver
+    return driver if driver in ("psycopg", "psycopg2") else None
+
+
+def _copy_rows(conn: Connection, driver: str, rows: list[tuple]) -> None:
+    """Записать строки одной командой COPY ... FROM STDIN в транзакции conn."""
+    sql = f"COPY {PayrollResult.__tablename__} ({', '.join(COLUMNS)}) FROM STDIN"
+    raw = conn.connection.driver_connection
+    if driver == "psycopg":
+        with raw.cursor() as cur, cur.copy(sql) as copy:
+            for row in rows:
+                copy.write_row(row)
+        return
+    # psycopg2: CSV, пустое значение без кавычек — NULL
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    with raw.cursor() as cur:
+        cur.copy_expert(f"{sql} WITH (FORMAT csv)", buffer)
+
+
+def _row(period: date, result: dict[str, Any], now: datetime) -> tuple:
+    get = result.get
+    return (
+        period,
+        get("employee_id"),
+        get("employee_code"),
+        get("employee_name"),
+        get("department_id"),
+        get("department"),
+        *(Decimal(str(get(name) or 0)) for name in _MONEY),
+        now,
+    )
+
+
+def write_payroll_results(
+    conn: Connection,
+    period: date | str,
+    results: Iterable[dict[str, Any]],
+    batch_size: int = 5000,
+    replace_period: bool = False,
+    progress: Callable[[int, float], None] | None = None,
+) -> int:
+    """
+    Записать результаты расчёта (iter_payroll()/calculate_payroll()) за период.
+
+    Повторная запись заменяет строки тех же сотрудников за период; с
+    replace_period=True перед записью удаляется весь период (полный перерасчёт,
+    в том числе уволенных с прошлого запуска).
+
+    Args:
+        conn: соединение в открытой транзакции.
+        period: месяц расчёта.
+        results: результаты по сотрудникам (можно потоком).
+        batch_size: строк в одной команде COPY/INSERT.
+        replace_period: удалить все строки периода перед записью.
+        progress: вызывается после каждого пакета с (строк всего, секунд прошло).
+
+    Returns:
+        Количество записанных строк.
+    """
+    table = PayrollResult.__table__
+    period = normalize_period(period)
+    driver = _copy_driver(conn)
+    stmt = insert(table)
+    if replace_period:
+        conn.execute(delete(table).where(table.c.period == period))
+    now = datetime.now()
+    start = time.perf_counter()
+    count = 0
+    records = iter(results)
+    while batch := list(itertools.islice(records, batch_size)):
+        rows = [_row(period, result, now) for result in batch]
+        if not replace_period:
+            ids = [row[1] for row in rows]
+            conn.execute(
+                delete(table).where(and_(table.c.period == period, table.c.employee_id.in_(ids)))
+            )
+        if driver is not None:
+            _copy_rows(conn, driver, rows)
+        else:
+            conn.execute(stmt, [dict(zip(COLUMNS, row)) for row in rows])
+        count += len(rows)
+        if progress is not None:
+            progress(count, time.perf_counter() - start)
+    return count
+
+
+def store_payroll(
+    period: date | str, employee_ids: Iterable[int] | None = None, batch_size: int = 5000
+) -> int:
+    """
+    Рассчитать зарплату за период (точный режим, Decimal) и сохранить в payroll_results.
+
+    Без employee_ids сохраняется весь штат и период перезаписывается целиком.
+    """
+    from application.salary import iter_payroll
+
+    engine = get_engine()
+    if engine is None:
+        raise RuntimeError("БД не настроена: задайте DATABASE_URL и установите sqlalchemy")
+    with engine.begin() as conn:
+        return write_payroll_results(
+            conn,
+            period,
+            iter_payroll(employee_ids, exact=True),
+            batch_size=batch_size,
+            replace_period=employee_ids is None,
+        )
+
+
+_PAYSLIP_COLUMNS = [PayrollResult.__table__.c[name] for name in COLUMNS]
+
+
+def _payslip(row: Any) -> dict[str, Any]:
+    return dict(row._mapping)
+
+
+def get_payslip(conn: Connection, employee_id: int, period: date | str) -> dict[str, Any] | None:
+    """Расчётный листок сотрудника за период (поиск по первичному ключу); None — не найден."""
+    table = PayrollResult.__table__
+    row = conn.execute(
+        select(*_PAYSLIP_COLUMNS).where(
+            table.c.period == normalize_period(period), table.c.employee_id == employee_id
+        )
+    ).first()
+    return None if row is None else _payslip(row)
+
+
+def get_payslip_history(
+    conn: Connection,
+    employee_id: int,
+    period_from: date | str | None = None,
+    period_to: date | str | None = None,
+) -> list[dict[str, Any]]:
+    """Расчётные листки сотрудника по месяцам (индекс employee_id, period), от старых к новым."""
+    table = PayrollResult.__table__
+    stmt = select(*_PAYSLIP_COLUMNS).where(table.c.employee_id == employee_id)
+    if period_from is not None:
+        stmt = stmt.where(table.c.period >= normalize_period(period_from))
+    if period_to is not None:
+        stmt = stmt.where(table.c.period <= normalize_period(period_to))
+    return [_payslip(row) for row in conn.execute(stmt.order_by(table.c.period))]
+
+
+def get_department_totals(
+    conn: Connection, period: date | str, department_id: int | None = None
+) -> dict[str, Any]:
+    """
+    Итоги за период по отделам и компании — GROUP BY по индексу (period, department_id).
+
+    Returns:
+        {"departments": {department_id: итоги}, "totals": итоги компании} в
+        формате calculate_payroll(exact=True): headcount и суммы Decimal.
+    """
+    table = PayrollResult.__table__
+    stmt = (
+        select(
+            table.c.department_id,
+            func.max(table.c.department).label("department"),
+            func.count().label("headcount"),
+            *(func.sum(table.c[name]).label(name) for name in _TOTALS),
+        )
+        .where(table.c.period == normalize_period(period))
+        .group_by(table.c.department_id)
+        .order_by(table.c.department_id)
+    )
+    if department_id is not None:
+        stmt = stmt.where(table.c.department_id == department_id)
+
+    departments: dict[Any, dict[str, Any]] = {}
+    totals: dict[str, Any] = {"headcount": 0, **{name: Decimal("0.00") for name in _TOTALS}}
+    for row in conn.execute(stmt):
+        bucket = {
+            "department_id": row.department_id,
+            "department": row.department or "",
+            "headcount": row.headcount,
+        }
+        for name in _TOTALS:
+            # SQLite возвращает SUM(NUMERIC) как float — приводим к копейкам
+            bucket[name] = Decimal(str(getattr(row, name) or 0)).quantize(Decimal("0.01"))
+            totals[name] += bucket[name]
+        totals["headcount"] += row.headcount
+        departments[row.department_id] = bucket
+    return {"departments": departments, "totals": totals}
+
+
+def list_periods(conn: Connection) -> list[date]:
+    """Периоды, за которые есть сохранённые результаты."""
+    table = PayrollResult.__table__
+    return list(conn.execute(select(table.c.period).distinct().order_by(table.c.period)).scalars())
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Расчёт зарплаты за месяц с сохранением в БД")
+    parser.add_argument("period", help="месяц расчёта, YYYY-MM")
+    parser.add_argument("--ids", type=int, nargs="+", help="только указанные сотрудники")
+    parser.add_argument("--batch-size", type=int, default=5000, help="строк в пакете")
+    args = parser.parse_args()
+
+    n = store_payroll(args.period, args.ids, batch_size=args.batch_size)
+    print(f"OK: сохранено {n} результатов за {normalize_period(args.period):%Y-%m}")
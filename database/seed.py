@@ -1,17 +1,27 @@
 """Seed script for balansoft_db — заполнение БД из data/employees.json."""
 
-import json
+import itertools
+import os
+import time
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from sqlalchemy import delete
+from sqlalchemy import delete, insert, text
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 from database.models import Base, Department, Employee
-from database.session import engine, SessionLocal
+from database.session import get_engine, get_sessionmaker
+from application.db.json_stream import iter_employee_records, load_value
+from utils.money import to_decimal
 
 
 def _get_json_path() -> Path:
-    """Путь к employees.json."""
+    """Путь к employees.json (переопределяется BALANSOFT_EMPLOYEES_JSON)."""
+    override = os.getenv("BALANSOFT_EMPLOYEES_JSON")
+    if override:
+        return Path(override)
     return Path(__file__).resolve().parent.parent / "data" / "employees.json"
 
 
@@ -25,16 +35,19 @@ def _parse_date(s: str | None) -> datetime | None:
         return None
 
 
-def load_data() -> dict:
-    """Загрузить данные из JSON."""
-    path = _get_json_path()
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+def load_departments() -> list[dict]:
+    """Отделы из JSON — без разбора остального файла в память."""
+    return load_value(_get_json_path(), "departments", default=[])
 
 
-def seed_departments(db: Session, data: dict) -> None:
+def iter_employees_json() -> Iterable[dict]:
+    """Все сотрудники из JSON (включая неактивных), по одному."""
+    return iter_employee_records(_get_json_path(), active_only=False)
+
+
+def seed_departments(db: Session, departments: Iterable[dict]) -> None:
     """Заполнить таблицу departments."""
-    for dept in data.get("departments", []):
+    for dept in departments:
         obj = Department(
             id=dept["id"],
             name=dept["name"],
@@ -44,51 +57,144 @@ def seed_departments(db: Session, data: dict) -> None:
     db.commit()
 
 
-def seed_employees(db: Session, data: dict) -> int:
+def _employee_values(emp: dict) -> dict[str, Any]:
+    """Запись JSON → значения колонок employees."""
+    return {
+        "id": emp["id"],
+        "employee_code": emp["employee_code"],
+        "full_name": emp["full_name"],
+        "first_name": emp["first_name"],
+        "last_name": emp["last_name"],
+        "middle_name": emp.get("middle_name"),
+        "birth_date": _parse_date(emp.get("birth_date")),
+        "hire_date": _parse_date(emp.get("hire_date")),
+        "department_id": emp["department_id"],
+        "position": emp["position"],
+        "tariff_grade": emp["tariff_grade"],
+        "coefficient": to_decimal(emp["coefficient"]),
+        "base_salary": to_decimal(emp["base_salary"]),
+        "tax_deduction": to_decimal(emp.get("tax_deduction", 0)),
+        "special_conditions": emp.get("special_conditions"),
+        "is_active": emp.get("is_active", True),
+    }
+
+
+def seed_employees(db: Session, employees: Iterable[dict]) -> int:
     """Заполнить таблицу employees. Возвращает количество добавленных."""
     count = 0
-    for emp in data.get("employees", []):
-        obj = Employee(
-            id=emp["id"],
-            employee_code=emp["employee_code"],
-            full_name=emp["full_name"],
-            first_name=emp["first_name"],
-            last_name=emp["last_name"],
-            middle_name=emp.get("middle_name"),
-            birth_date=_parse_date(emp.get("birth_date")),
-            hire_date=_parse_date(emp.get("hire_date")),
-            department_id=emp["department_id"],
-            position=emp["position"],
-            tariff_grade=emp["tariff_grade"],
-            coefficient=float(emp["coefficient"]),
-            base_salary=float(emp["base_salary"]),
-            tax_deduction=float(emp.get("tax_deduction", 0)),
-            special_conditions=emp.get("special_conditions"),
-            is_active=emp.get("is_active", True),
-        )
-        db.merge(obj)
+    for emp in employees:
+        db.merge(Employee(**_employee_values(emp)))
         count += 1
     db.commit()
     return count
 
 
+def _upsert_statement(conn: Connection, table: Any) -> Any:
+    """
+    INSERT ... ON CONFLICT (id) DO UPDATE для PostgreSQL и SQLite,
+    обычный INSERT (executemany) для прочих СУБД.
+    """
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        return insert(table)
+
+    stmt = dialect_insert(table)
+    columns = {c.name: stmt.excluded[c.name] for c in table.columns if c.name != "id"}
+    return stmt.on_conflict_do_update(index_elements=[table.c.id], set_=columns)
+
+
+def clear_tables(conn: Connection) -> None:
+    """Быстрая очистка: TRUNCATE в PostgreSQL, DELETE без условий в остальных СУБД."""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text("TRUNCATE TABLE employees, departments"))
+    else:
+        conn.execute(delete(Employee))
+        conn.execute(delete(Department))
+
+
+def _print_progress(rows: int, elapsed: float) -> None:
+    rate = rows / elapsed if elapsed > 0 else 0.0
+    print(f"  {rows:,} строк — {rate:,.0f} строк/с".replace(",", " "))
+
+
+def seed_employees_bulk(
+    conn: Connection,
+    employees: Iterable[dict],
+    batch_size: int = 5000,
+    progress: Callable[[int, float], None] | None = _print_progress,
+) -> int:
+    """
+    Заполнить employees пакетами: один upsert-запрос (executemany) на batch_size
+    строк вместо SELECT + INSERT/UPDATE на каждую строку, как у db.merge().
+
+    Args:
+        conn: соединение в открытой транзакции.
+        employees: записи сотрудников (можно потоком из JSON).
+        batch_size: строк в одном пакете.
+        progress: вызывается после каждого пакета с (строк всего, секунд прошло).
+
+    Returns:
+        Количество записанных строк.
+    """
+    stmt = _upsert_statement(conn, Employee.__table__)
+    start = time.perf_counter()
+    count = 0
+    records = iter(employees)
+    while batch := list(itertools.islice(records, batch_size)):
+        rows = [_employee_values(emp) for emp in batch]
+        conn.execute(stmt, rows)
+        count += len(rows)
+        if progress is not None:
+            progress(count, time.perf_counter() - start)
+    return count
+
+
+def seed_departments_bulk(conn: Connection, departments: Iterable[dict]) -> None:
+    """Заполнить departments одним upsert-запросом."""
+    rows = [{"id": d["id"], "name": d["name"], "code": d["code"]} for d in departments]
+    if rows:
+        conn.execute(_upsert_statement(conn, Department.__table__), rows)
+
+
 def create_tables() -> None:
     """Создать таблицы (если не существуют)."""
-    Base.metadata.create_all(bind=engine)
+    Base.metadata.create_all(bind=get_engine())
 
 
-def run_seed(clear_existing: bool = False) -> None:
+def run_seed(clear_existing: bool = False, bulk: bool = False, batch_size: int = 5000) -> None:
     """
     Заполнить БД данными из JSON.
 
     Args:
         clear_existing: если True — очистить таблицы перед вставкой.
+        bulk: пакетная загрузка (upsert/executemany) вместо db.merge() по строке.
+        batch_size: строк в пакете для bulk-режима.
     """
+    engine = get_engine()
+    SessionLocal = get_sessionmaker()
     if engine is None or SessionLocal is None:
-        raise RuntimeError("SQLAlchemy не установлен. pip install sqlalchemy python-dotenv")
+        raise RuntimeError(
+            "БД не настроена: задайте DATABASE_URL и установите sqlalchemy python-dotenv"
+        )
 
     create_tables()
 
+    if bulk:
+        start = time.perf_counter()
+        departments = load_departments()
+        with engine.begin() as conn:
+            if clear_existing:
+                clear_tables(conn)
+            seed_departments_bulk(conn, departments)
+            n = seed_employees_bulk(conn, iter_employees_json(), batch_size=batch_size)
+        elapsed = time.perf_counter() - start
+        print(f"OK: добавлено {n} сотрудников, {len(departments)} отделов за {elapsed:.1f} с")
+        return
+
     db = SessionLocal()
     try:
         if clear_existing:
@@ -96,18 +202,23 @@ def run_seed(clear_existing: bool = False) -> None:
             db.execute(delete(Department))
             db.commit()
 
-        data = load_data()
+        departments = load_departments()
 
-        seed_departments(db, data)
-        n = seed_employees(db, data)
+        seed_departments(db, departments)
+        n = seed_employees(db, iter_employees_json())
 
-        print(f"OK: добавлено {n} сотрудников, {len(data.get('departments', []))} отделов")
+        print(f"OK: добавлено {n} сотрудников, {len(departments)} отделов")
     finally:
         db.close()
 
 
 if __name__ == "__main__":
-    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Заполнение БД из data/employees.json")
+    parser.add_argument("--clear", action="store_true", help="очистить таблицы перед вставкой")
+    parser.add_argument("--bulk", action="store_true", help="пакетная загрузка (большие файлы)")
+    parser.add_argument("--batch-size", type=int, default=5000, help="строк в пакете (--bulk)")
+    args = parser.parse_args()
 
-    clear = "--clear" in sys.argv
-    run_seed(clear_existing=clear)
+    run_seed(clear_existing=args.clear, bulk=args.bulk, batch_size=args.batch_size)
@@ -1,19 +1,43 @@
 """Balansoft: Основной модуль для запуска."""
 
+import argparse
 import datetime
-from application.salary import calculate_salary
-from application.db.people import get_employees
+from application.salary import calculate_payroll, calculate_salary
+from application.db.people import iter_employee_pages
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Balansoft: расчёт зарплаты")
+    parser.add_argument(
+        "--limit", type=int, default=50, help="сколько сотрудников вывести (0 — всех)"
+    )
+    parser.add_argument("--offset", type=int, default=0, help="пропустить первых N сотрудников")
+    parser.add_argument("--department", type=int, help="только отдел с указанным id")
+    parser.add_argument("--summary", action="store_true", help="только итоги, без списка")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
+    args = parse_args()
     print("=== Balansoft: Система расчета зарплаты ===")
     print(f"Дата: {datetime.date.today()}")
 
-    employees = get_employees()
-    print(f"\nПолучено сотрудников: {len(employees)}")
-    for i, emp in enumerate(employees, 1):
-        print(f"{i}. {emp.get('full_name', 'N/A')} - {emp.get('position', 'N/A')}")
+    if args.summary:
+        totals = calculate_payroll()["totals"]
+        print(f"\nСотрудников: {totals['headcount']}")
+        print(f"Фонд к выплате: {totals['net_salary']:,.0f} руб.".replace(",", " "))
+    else:
+        # Список выводится по страницам по мере загрузки
+        pages = iter_employee_pages(
+            department_id=args.department, offset=args.offset, limit=args.limit or None
+        )
+        shown = 0
+        for page in pages:
+            for i, emp in enumerate(page, args.offset + shown + 1):
+                print(f"{i}. {emp.get('full_name', 'N/A')} - {emp.get('position', 'N/A')}")
+            shown += len(page)
+        print(f"\nПолучено сотрудников: {shown}")
 
-    salary_data = calculate_salary()
-    print(f"\nРасчет зарплаты выполнен для: {salary_data.get('employee_name', 'N/A')}")
-    print(f"К выплате: {salary_data.get('net_salary', 0):,.0f} руб.".replace(",", " "))
+        salary_data = calculate_salary()
+        print(f"\nРасчет зарплаты выполнен для: {salary_data.get('employee_name', 'N/A')}")
+        print(f"К выплате: {salary_data.get('net_salary', 0):,.0f} руб.".replace(",", " "))
@@ -1,53 +1,176 @@
 """Balansoft: Расширенный запуск с полным функционалом."""
 
+import argparse
 import datetime
+import importlib.util
 import logging
 import sys
+from collections.abc import Iterator
 from pathlib import Path
+from typing import Any
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="[%(levelname)s] %(message)s",
-    handlers=[logging.StreamHandler()],
-)
-
-from application.db.people import get_employees
-from application.salary import calculate_salary
+from application.db.people import iter_employee_pages
+from application.salary import calculate_payroll, calculate_salary
 from utils.formatters import format_currency
 
-try:
-    from rich.console import Console
-    from rich.table import Table
+# rich импортируется только при выводе (проверка наличия не загружает пакет)
+RICH_AVAILABLE = importlib.util.find_spec("rich") is not None
+
+# Сколько сотрудников выводится без --limit и сколько строк на одной странице
+DEFAULT_LIMIT = 50
+DEFAULT_PAGE_SIZE = 25
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Balansoft: расчёт зарплаты")
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"сколько сотрудников вывести (0 — всех; по умолчанию {DEFAULT_LIMIT})",
+    )
+    parser.add_argument("--offset", type=int, default=0, help="пропустить первых N сотрудников")
+    parser.add_argument("--department", type=int, help="только отдел с указанным id")
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help="строк на странице; в терминале между страницами ждём Enter",
+    )
+    parser.add_argument(
+        "--summary", action="store_true", help="только итоги по отделам и компании, без списка"
+    )
+    parser.add_argument(
+        "--no-pager", action="store_true", help="не останавливаться между страницами"
+    )
+    return parser.parse_args(argv)
+
+
+def _pages(args: argparse.Namespace) -> Iterator[tuple[int, list[dict[str, Any]]]]:
+    """Страницы списка с номером первой строки; следующая загружается только по запросу."""
+    number = args.offset + 1
+    pages = iter_employee_pages(
+        args.page_size,
+        department_id=args.department,
+        offset=args.offset,
+        limit=args.limit or None,
+    )
+    for page in pages:
+        yield number, page
+        number += len(page)
+
+
+def _interactive(args: argparse.Namespace) -> bool:
+    return not args.no_pager and sys.stdin.isatty() and sys.stdout.isatty()
+
+
+def _next_page() -> bool:
+    """Спросить, выводить ли следующую страницу."""
+    try:
+        answer = input("-- Enter: следующая страница, q: выход -- ")
+    except EOFError:
+        return False
+    return answer.strip().lower() not in ("q", "й")
+
+
+def _print_listing(args: argparse.Namespace, console: Any = None) -> int:
+    """Вывести список постранично; возвращает число выведенных сотрудников."""
+    shown = 0
+    interactive = _interactive(args)
+    for first, page in _pages(args):
+        if shown and interactive and not _next_page():
+            break
+        if console is not None:
+            from rich.table import Table
+
+            table = Table(title="Сотрудники ООО Лукоморье" if not shown else None)
+            table.add_column("#", style="dim")
+            table.add_column("ФИО", style="cyan")
+            table.add_column("Должность", style="green")
+            table.add_column("Оклад", justify="right")
+            for i, emp in enumerate(page, first):
+                table.add_row(
+                    str(i),
+                    emp.get("full_name", "N/A"),
+                    emp.get("position", "N/A"),
+                    format_currency(emp.get("base_salary", 0)),
+                )
+            console.print(table)
+        else:
+            for i, emp in enumerate(page, first):
+                print(f"{i}. {emp.get('full_name')} - {emp.get('position')}")
+        shown += len(page)
+    return shown
+
 
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+def _print_listing_footer(args: argparse.Namespace, shown: int) -> None:
+    print(f"\nВыведено сотрудников: {shown}")
+    if args.limit and shown == args.limit:
+        print(f"Следующие: --offset {args.offset + shown} (или --limit 0 для всего списка)")
 
 
-def main() -> None:
+def _print_summary(args: argparse.Namespace, console: Any = None) -> None:
+    """Итоги расчёта по отделам и компании (без списка сотрудников)."""
+    payroll = calculate_payroll()
+    departments = list(payroll["departments"].values())
+    if args.department is not None:
+        departments = [d for d in departments if d["department_id"] == args.department]
+    totals = payroll["totals"] if args.department is None else None
+
+    columns = ("Численность", "Оклады", "НДФЛ", "Удержания", "К выплате")
+
+    def cells(bucket: dict[str, Any]) -> list[str]:
+        return [
+            str(bucket["headcount"]),
+            format_currency(bucket["base_salary"]),
+            format_currency(bucket["ndfl"]),
+            format_currency(bucket["special_deduction"]),
+            format_currency(bucket["net_salary"]),
+        ]
+
+    if console is not None:
+        from rich.table import Table
+
+        table = Table(title="Итоги расчёта по отделам")
+        table.add_column("Отдел", style="cyan")
+        for column in columns:
+            table.add_column(column, justify="right")
+        for dept in departments:
+            table.add_row(dept["department"], *cells(dept))
+        if totals is not None:
+            table.add_row("[bold]Итого[/bold]", *cells(totals))
+        console.print(table)
+        return
+
+    print("Итоги расчёта по отделам:")
+    for dept in departments:
+        print(f"  {dept['department']}: " + ", ".join(map(": ".join, zip(columns, cells(dept)))))
+    if totals is not None:
+        print("  Итого: " + ", ".join(map(": ".join, zip(columns, cells(totals)))))
+
+
+def main(argv: list[str] | None = None) -> None:
     """Extended run with rich output."""
+    args = parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(levelname)s] %(message)s",
+        handlers=[logging.StreamHandler()],
+    )
     if RICH_AVAILABLE:
+        from rich.console import Console
+
         console = Console()
         console.print("\n[bold cyan]=== Balansoft: Система расчета зарплаты ===")
         console.print(f"[bold]Дата:[/bold] {datetime.date.today()}\n")
 
-        employees = get_employees()
-        table = Table(title="Сотрудники ООО Лукоморье")
-        table.add_column("#", style="dim")
-        table.add_column("ФИО", style="cyan")
-        table.add_column("Должность", style="green")
-        table.add_column("Оклад", justify="right")
-
-        for i, emp in enumerate(employees, 1):
-            table.add_row(
-                str(i),
-                emp.get("full_name", "N/A"),
-                emp.get("position", "N/A"),
-                format_currency(emp.get("base_salary", 0)),
-            )
-        console.print(table)
+        if args.summary:
+            _print_summary(args, console)
+            return
+
+        _print_listing_footer(args, _print_listing(args, console))
 
         salary_data = calculate_salary(employee_id=3)
         console.print(f"\n[bold]Расчет зарплаты (Баба Яга):[/bold]")
@@ -58,10 +181,13 @@ def main() -> None:
     else:
         print("=== Balansoft: Система расчета зарплаты ===")
         print(f"Дата: {datetime.date.today()}")
-        employees = get_employees()
-        print(f"\nПолучено сотрудников: {len(employees)}")
-        for i, emp in enumerate(employees, 1):
-            print(f"{i}. {emp.get('full_name')} - {emp.get('position')}")
+
+        if args.summary:
+            _print_summary(args)
+            return
+
+        print()
+        _print_listing_footer(args, _print_listing(args))
         salary_data = calculate_salary()
         print(f"\nРасчет для: {salary_data.get('employee_name')}")
         print(f"К выплате: {salary_data.get('net_salary'):,.0f} руб.".replace(",", " "))
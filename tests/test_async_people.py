@@ -0,0 +1,108 @@
+"""Tests for the async data access layer."""
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+pytest.importorskip("aiosqlite")
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import database.async_session
+from application.db import async_people
+from application.db.cache import clear_cache
+from application.db.index import RosterIndex
+from application.db.people import get_employees as get_employees_sync
+from application.salary import calculate_salary, calculate_salary_async
+from database.health import breaker
+from database.models import Base
+from database.seed import (
+    iter_employees_json,
+    load_departments,
+    seed_departments_bulk,
+    seed_employees_bulk,
+)
+
+
+@pytest.fixture
+def async_db(tmp_path, monkeypatch):
+    """SQLite-база, заполненная из data/employees.json, как источник для AsyncSession."""
+    url = f"sqlite:///{tmp_path / 'async.db'}"
+    engine = sqlalchemy.create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed_departments_bulk(conn, load_departments())
+        seed_employees_bulk(conn, iter_employees_json(), progress=None)
+    engine.dispose()
+
+    async_engine = create_async_engine(database.async_session.to_async_url(url))
+    monkeypatch.setattr(database.async_session, "AsyncSessionLocal", async_sessionmaker(async_engine))
+    clear_cache()
+    breaker.reset()
+    yield
+    clear_cache()
+    asyncio.run(async_engine.dispose())
+
+
+def test_async_get_employees_from_db(async_db) -> None:
+    """Async loader returns the seeded roster; the second call hits the cache."""
+
+    async def run():
+        first = await async_people.get_employees()
+        second = await async_people.get_employees(department_id=3)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert len(first) == 10
+    assert [e["id"] for e in second] == [5, 6, 7, 10]
+
+
+def test_async_salary_matches_sync(async_db) -> None:
+    """calculate_salary_async() gives the same numbers as calculate_salary()."""
+
+    async def run():
+        return await asyncio.gather(*(calculate_salary_async(i) for i in (3, 5, 9)))
+
+    for result, employee_id in zip(asyncio.run(run()), (3, 5, 9)):
+        expected = calculate_salary(employee_id)
+        for field in ("ndfl", "special_deduction", "net_salary"):
+            assert result[field] == expected[field]
+
+
+def test_async_json_fallback() -> None:
+    """Without the DB the async loader falls back to JSON like the sync one."""
+    employees = asyncio.run(async_people.get_employees(use_db_if_available=False))
+    assert employees == get_employees_sync(use_db_if_available=False)
+
+
+def test_async_hedge_deadline_is_read_at_call_time(async_db, monkeypatch) -> None:
+    """HEDGE_DEADLINE changed after import applies; a late DB answer is collected."""
+    from application.db import people
+
+    release = asyncio.Event()
+    db_roster = RosterIndex([{"id": 100, "department_id": 1}])
+
+    async def slow_db():
+        await release.wait()
+        return db_roster
+
+    monkeypatch.setattr(people, "HEDGE_DEADLINE", 0.05)
+    monkeypatch.setattr(async_people, "_try_load_from_db", slow_db)
+
+    async def run():
+        employees = await async_people.get_employees()
+        hung = breaker.is_open
+        release.set()
+        while async_people._late_tasks:
+            await asyncio.sleep(0.01)
+        return employees, hung
+
+    employees, hung = asyncio.run(run())
+    assert employees == get_employees_sync(use_db_if_available=False)
+    assert hung and breaker.failures == 1
+    assert not breaker.is_open
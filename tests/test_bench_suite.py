@@ -0,0 +1,61 @@
+"""Tests for the synthetic roster generator and benchmark baseline comparison."""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.suite import compare
+from benchmarks.synthetic import generate_employees, write_synthetic_roster
+from utils.salary_rules import TariffGrid, deduction_rule
+
+
+def test_generator_is_reproducible_and_valid() -> None:
+    """Same seed gives the same roster; grades, coefficients and caps follow the schema."""
+    first = list(generate_employees(2000, seed=7))
+    assert first == list(generate_employees(2000, seed=7))
+    assert [e["id"] for e in first] == list(range(1, 2001))
+    assert len({e["employee_code"] for e in first}) == 2000
+
+    data = json.loads((Path(__file__).resolve().parent.parent / "data/employees.json").read_text())
+    issues = TariffGrid.from_company(data).validate(first)
+    assert {issue["code"] for issue in issues} <= {"salary_mismatch"}
+    assert len(issues) < 0.1 * len(first)
+
+    special = [e for e in first if e["special_conditions"]]
+    assert 0.04 * len(first) < len(special) < 0.12 * len(first)
+    for emp in special:
+        conditions = emp["special_conditions"]
+        assert deduction_rule(conditions).percent <= conditions["max_percent"]
+        assert conditions["start_date"]
+
+
+def test_write_synthetic_roster(tmp_path: Path) -> None:
+    path = write_synthetic_roster(50, tmp_path / "employees.json", seed=1)
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data["employees"] == list(generate_employees(50, seed=1))
+    assert data["company"]["employee_count"] == 50
+    assert data["tariff_grid"] and data["departments"]
+
+
+def test_compare_flags_regressions_over_threshold() -> None:
+    baseline = {
+        "results": {
+            "calculate_payroll@1000": {"seconds": 1.0, "peak_memory_mb": 100.0},
+            "seed_bulk@1000": {"seconds": 2.0, "peak_memory_mb": 50.0},
+            "format_currency@1000": {"error": "boom"},
+        }
+    }
+    current = {
+        "results": {
+            "calculate_payroll@1000": {"seconds": 1.1, "peak_memory_mb": 130.0},
+            "seed_bulk@1000": {"seconds": 3.0, "peak_memory_mb": 50.0},
+            "format_currency@1000": {"seconds": 9.0, "peak_memory_mb": 9.0},
+            "get_employees@1000": {"seconds": 1.0, "peak_memory_mb": 10.0},
+        }
+    }
+    regressions = compare(current, baseline, threshold=0.2)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("calculate_payroll@1000: peak_memory_mb")
+    assert regressions[1].startswith("seed_bulk@1000: seconds")
@@ -0,0 +1,55 @@
+"""Tests for the shared employee roster cache."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.db.cache import RosterCache, cache_info, clear_cache
+from application.db.people import get_employees
+from application.salary import calculate_salary
+
+_DATA = Path(__file__).resolve().parent.parent / "data" / "employees.json"
+
+
+def _write_copy(path: Path, base_salary: int) -> None:
+    data = json.loads(_DATA.read_text(encoding="utf-8"))
+    data["employees"][2]["base_salary"] = base_salary
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def test_json_roster_is_cached_and_invalidated(tmp_path, monkeypatch) -> None:
+    """Second call is a cache hit; rewriting the file reloads it."""
+    path = tmp_path / "employees.json"
+    _write_copy(path, 80000)
+    monkeypatch.setenv("BALANSOFT_EMPLOYEES_JSON", str(path))
+    clear_cache()
+
+    assert calculate_salary(employee_id=3)["base_salary"] == 80000
+    assert calculate_salary(employee_id=3)["base_salary"] == 80000
+    assert cache_info()["id_hits"] == 1
+
+    get_employees(use_db_if_available=False)
+    get_employees(use_db_if_available=False)
+    assert cache_info()["hits"] >= 1
+
+    _write_copy(path, 90000)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert calculate_salary(employee_id=3)["base_salary"] == 90000
+    assert cache_info()["invalidations"] >= 1
+    clear_cache()
+
+
+def test_id_lru_is_bounded() -> None:
+    """Per-id LRU evicts the least recently used entries."""
+    cache = RosterCache(lru_size=2)
+    for employee_id in (1, 2, 3):
+        cache.get_by_id("src", "m1", employee_id, lambda i: {"id": i})
+    assert cache.info()["id_entries"] == 2
+    cache.get_by_id("src", "m1", 3, lambda i: {"id": i})
+    assert cache.info()["id_hits"] == 1
+    cache.get_by_id("src", "m2", 3, lambda i: {"id": i})
+    assert cache.info()["id_misses"] == 4
@@ -0,0 +1,92 @@
+"""Tests for employee indexes and the trigger-maintained department summary (SQLite)."""
+
+import sys
+from collections import defaultdict
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from application.db.queries import employee_query
+from database.department_summary import get_department_summary, refresh_department_summary
+from database.models import Base, Employee
+from database.seed import (
+    clear_tables,
+    iter_employees_json,
+    load_departments,
+    seed_departments_bulk,
+    seed_employees_bulk,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'summary.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed_departments_bulk(conn, load_departments())
+        seed_employees_bulk(conn, iter_employees_json(), progress=None)
+    yield engine
+    engine.dispose()
+
+
+def _expected(employees) -> dict:
+    totals = defaultdict(lambda: [0, Decimal(0), Decimal(0)])
+    for emp in employees:
+        if emp.get("is_active", True):
+            bucket = totals[emp["department_id"]]
+            bucket[0] += 1
+            bucket[1] += Decimal(str(emp["base_salary"]))
+            bucket[2] += Decimal(str(emp.get("tax_deduction", 0)))
+    return {dept: tuple(values) for dept, values in totals.items()}
+
+
+def _stored(conn) -> dict:
+    return {
+        row["department_id"]: (
+            row["headcount"],
+            row["total_base_salary"],
+            row["total_tax_relief"],
+        )
+        for row in get_department_summary(conn)
+    }
+
+
+def test_triggers_track_changes(engine) -> None:
+    """Inserts, upserts, deactivation, moves and deletes keep the summary exact."""
+    employees = list(iter_employees_json())
+    with engine.connect() as conn:
+        assert _stored(conn) == _expected(employees)
+        assert get_department_summary(conn)[0]["department"]
+
+    changed = {3: {"base_salary": 99000}, 5: {"is_active": False}, 6: {"department_id": 1}}
+    employees = [dict(e, **changed.get(e["id"], {})) for e in employees]
+    with engine.begin() as conn:
+        seed_employees_bulk(conn, employees, progress=None)
+        conn.execute(sqlalchemy.delete(Employee).where(Employee.id == 7))
+    employees = [e for e in employees if e["id"] != 7]
+    with engine.begin() as conn:
+        assert _stored(conn) == _expected(employees)
+        assert refresh_department_summary(conn) == len(_expected(employees))
+        assert _stored(conn) == _expected(employees)
+        clear_tables(conn)
+        assert get_department_summary(conn) == []
+
+
+def test_department_query_uses_indexes(engine) -> None:
+    """Department filters search an index; the partial index matches the is_active filter."""
+    stmt = employee_query("listing", department_id=3)
+    sql = str(stmt.compile(engine, compile_kwargs={"literal_binds": True}))
+    forced = sql.replace(
+        "FROM employees", "FROM employees INDEXED BY ix_employees_active_department", 1
+    )
+    with engine.connect() as conn:
+        plan = " ".join(str(row) for row in conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}"))
+        # INDEXED BY fails if the index predicate does not cover the query's WHERE
+        rows = conn.exec_driver_sql(forced).all()
+    assert "SEARCH employees USING INDEX" in plan
+    assert [row[0] for row in rows] == [5, 6, 7, 10]
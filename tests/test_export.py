@@ -0,0 +1,112 @@
+"""Tests for streaming payroll export."""
+
+import csv
+import os
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.export import PAYROLL_COLUMNS, export_payroll, write_csv
+from application.salary import calculate_payroll, iter_payroll
+
+
+def _read(path: Path, delimiter: str = ";") -> list[list[str]]:
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        return list(csv.reader(f, delimiter=delimiter))
+
+
+def test_iter_payroll_matches_batch() -> None:
+    """Streamed results equal calculate_payroll() and carry code and department."""
+    batch = calculate_payroll()["results"]
+    streamed = list(iter_payroll())
+    assert [{k: r[k] for k in batch[0]} for r in streamed] == batch
+    assert streamed[0]["employee_code"] and streamed[0]["department"]
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_export_csv(tmp_path: Path, exact: bool) -> None:
+    """Amounts have two decimals with a comma; rows follow the roster order."""
+    path = tmp_path / "payroll.csv"
+    count = export_payroll(path, exact=exact)
+    rows = _read(path)
+    results = calculate_payroll(exact=exact)["results"]
+    assert count == len(results) == len(rows) - 1
+    assert rows[0] == list(PAYROLL_COLUMNS)
+
+    by_id = {row[0]: dict(zip(rows[0], row)) for row in rows[1:]}
+    baba_yaga = by_id["3"]
+    assert baba_yaga["employee_code"] == "ACC-002"
+    assert baba_yaga["base_salary"] == "80000,00"
+    assert baba_yaga["ndfl"] == "10036,00"
+    assert baba_yaga["special_deduction"] == "20989,20"
+    assert baba_yaga["net_salary"] == "48974,80"
+
+
+def test_write_csv_options_and_slow_path(tmp_path: Path) -> None:
+    """Custom separators and column order; quoting and missing amounts handled."""
+    results = [
+        {"employee_id": 1, "employee_name": 'ООО "Лукоморье"; филиал', "net_salary": 1234.5},
+        {"employee_id": 2, "employee_name": "Без суммы", "net_salary": None},
+        {"employee_id": 3, "employee_name": "Точно", "net_salary": Decimal("-0.05")},
+        {"employee_id": 4, "employee_name": "Нет ключа"},
+    ]
+    path = tmp_path / "out.csv"
+    columns = ("net_salary", "employee_id", "employee_name")
+    count = write_csv(results, path, columns, delimiter=",", decimal_separator=".")
+    assert count == 4
+    assert _read(path, ",") == [
+        list(columns),
+        ["1234.50", "1", 'ООО "Лукоморье"; филиал'],
+        ["", "2", "Без суммы"],
+        ["-0.05", "3", "Точно"],
+        ["", "4", "Нет ключа"],
+    ]
+
+
+def test_failed_export_leaves_no_file(tmp_path: Path) -> None:
+    def broken():
+        yield {"employee_id": 1, "net_salary": 1.0}
+        raise RuntimeError("boom")
+
+    path = tmp_path / "out.csv"
+    with pytest.raises(RuntimeError):
+        write_csv(broken(), path)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_export_file_mode_follows_umask(tmp_path: Path) -> None:
+    old = os.umask(0o022)
+    try:
+        write_csv(iter_payroll(), tmp_path / "out.csv")
+    finally:
+        os.umask(old)
+    assert (tmp_path / "out.csv").stat().st_mode & 0o777 == 0o644
+
+
+def test_unknown_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        export_payroll(tmp_path / "payroll.txt")
+
+
+def test_export_parquet(tmp_path: Path) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "payroll.parquet"
+    count = export_payroll(path, exact=True)
+    table = pq.read_table(path)
+    assert table.num_rows == count
+    row = {r["employee_id"]: r for r in table.to_pylist()}[3]
+    assert row["net_salary"] == Decimal("48974.80")
+
+
+def test_export_xlsx(tmp_path: Path) -> None:
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "payroll.xlsx"
+    count = export_payroll(path)
+    rows = list(openpyxl.load_workbook(path, read_only=True).active.values)
+    assert len(rows) == count + 1
+    assert rows[0] == PAYROLL_COLUMNS
@@ -0,0 +1,67 @@
+"""Tests for the DB availability probe and circuit breaker."""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from database.health import CircuitBreaker
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_circuit_breaker_cooldown() -> None:
+    """After a failure the DB is skipped until the cooldown passes."""
+    clock = _Clock()
+    cb = CircuitBreaker(cooldown=30, probe_ttl=10, clock=clock)
+    assert cb.allow()
+    cb.record_failure()
+    assert not cb.allow()
+    clock.now += 29
+    assert cb.is_open
+    clock.now += 2
+    assert cb.allow()
+    assert cb.skipped == 1
+
+
+def test_probe_result_ttl() -> None:
+    """A successful probe is reused for probe_ttl seconds."""
+    clock = _Clock()
+    cb = CircuitBreaker(cooldown=30, probe_ttl=10, clock=clock)
+    cb.record_success()
+    assert cb.recently_ok()
+    clock.now += 11
+    assert not cb.recently_ok()
+
+
+def test_unreachable_db_is_skipped(tmp_path, monkeypatch) -> None:
+    """After one failed probe get_employees() falls back to JSON without touching the DB."""
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    import sqlalchemy.orm
+
+    import database.session
+    from application.db.people import get_employees
+    from database import health
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'missing' / 'db.sqlite'}")
+    connects = []
+    sqlalchemy.event.listen(engine, "do_connect", lambda *args: connects.append(1))
+    monkeypatch.setattr(database.session, "engine", engine)
+    monkeypatch.setattr(database.session, "SessionLocal", sqlalchemy.orm.sessionmaker(bind=engine))
+    monkeypatch.setattr(health, "breaker", CircuitBreaker(cooldown=60))
+
+    assert len(get_employees()) == 10
+    start = time.perf_counter()
+    assert len(get_employees()) == 10
+    assert time.perf_counter() - start < 0.5
+    assert len(connects) == 1
+    assert health.breaker.skipped >= 1
@@ -0,0 +1,62 @@
+"""Tests for the streaming employees.json reader."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.db.json_stream import iter_array, iter_employee_records, load_value
+from application.db.people import get_employees, iter_employees
+
+_DATA = Path(__file__).resolve().parent.parent / "data" / "employees.json"
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 64, 1 << 16])
+def test_stream_matches_json_load(chunk_size: int) -> None:
+    """Any chunk size yields exactly what json.load() sees."""
+    data = json.loads(_DATA.read_text(encoding="utf-8"))
+    assert list(iter_array(_DATA, "employees", chunk_size)) == data["employees"]
+    assert load_value(_DATA, "tariff_grid", chunk_size=chunk_size) == data["tariff_grid"]
+
+
+def test_stream_tricky_content(tmp_path) -> None:
+    """Brackets in strings, escapes, numbers and keys after the array."""
+    doc = {
+        "employees": [{"id": 1, "note": "a]}[{\\\"", "is_active": True}, {"id": 2, "is_active": False}],
+        "tail": {"x": [1, 2, 3], "n": 12345},
+    }
+    path = tmp_path / "e.json"
+    path.write_text(json.dumps(doc), encoding="utf-8")
+    assert list(iter_array(path, "employees", chunk_size=3)) == doc["employees"]
+    assert load_value(path, "tail", chunk_size=2) == doc["tail"]
+    assert load_value(path, "missing", default=[]) == []
+    assert [e["id"] for e in iter_employee_records(path, chunk_size=4)] == [1]
+
+
+def test_stream_malformed(tmp_path) -> None:
+    """Broken JSON raises JSONDecodeError like json.load()."""
+    path = tmp_path / "e.json"
+    path.write_text('{"employees": [{"id": 1} {"id": 2}]}', encoding="utf-8")
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_array(path, "employees"))
+
+
+def test_stream_malformed_record_fails_fast(tmp_path) -> None:
+    """A bad record fails within max_value_size, reporting its byte offset, not at EOF."""
+    head = '{"employees": [{"id": 1, "full_name": "Ёжик"}, '
+    tail = ", ".join(json.dumps({"id": i}) for i in range(3, 50_000))
+    path = tmp_path / "e.json"
+    path.write_text(head + '{"id": 2 "bad": 1}, ' + tail + "]}", encoding="utf-8")
+    records = iter_array(path, "employees", chunk_size=64, max_value_size=1000)
+    assert next(records) == {"id": 1, "full_name": "Ёжик"}
+    with pytest.raises(json.JSONDecodeError, match="в пределах 1000") as excinfo:
+        next(records)
+    assert f"байта {len(head.encode('utf-8'))} " in str(excinfo.value)
+
+
+def test_iter_employees_matches_get_employees() -> None:
+    """Generator variant yields the same roster as get_employees()."""
+    assert list(iter_employees(use_db_if_available=False)) == get_employees(use_db_if_available=False)
@@ -0,0 +1,90 @@
+"""Tests for hot-path instrumentation and metric export."""
+
+import json
+import logging
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application import metrics as metrics_module
+from application.db.cache import clear_cache
+from application.db.people import get_employees
+from application.metrics import Metrics, write_metrics
+from application.salary import calculate_salary
+
+
+@pytest.fixture
+def enabled(monkeypatch: pytest.MonkeyPatch):
+    """Shared registry enabled and empty for the test, cold roster cache."""
+    monkeypatch.setattr(metrics_module.metrics, "enabled", True)
+    metrics_module.metrics.reset()
+    clear_cache()
+    yield metrics_module.metrics
+    metrics_module.metrics.reset()
+    clear_cache()
+
+
+def test_disabled_registry_records_nothing() -> None:
+    registry = Metrics(enabled=False)
+    with registry.stage("calculation"):
+        pass
+    registry.inc("balansoft_source_total", source="json")
+    registry.observe("balansoft_stage_seconds", 1.0, stage="x")
+    assert registry.export_json() == {"counters": [], "histograms": []}
+    assert registry.export_prometheus() == ""
+
+
+def test_prometheus_export() -> None:
+    registry = Metrics(enabled=True, buckets=(0.1, 1.0))
+    registry.inc("balansoft_source_total", source="json")
+    registry.inc("balansoft_source_total", 2, source="json")
+    registry.observe("balansoft_stage_seconds", 0.05, stage="json_parse")
+    registry.observe("balansoft_stage_seconds", 0.5, stage="json_parse")
+    registry.observe("balansoft_stage_seconds", 5.0, stage="json_parse")
+    text = registry.export_prometheus()
+    assert "# TYPE balansoft_source_total counter" in text
+    assert 'balansoft_source_total{source="json"} 3' in text
+    assert "# TYPE balansoft_stage_seconds histogram" in text
+    assert 'balansoft_stage_seconds_bucket{stage="json_parse",le="0.1"} 1' in text
+    assert 'balansoft_stage_seconds_bucket{stage="json_parse",le="1.0"} 2' in text
+    assert 'balansoft_stage_seconds_bucket{stage="json_parse",le="+Inf"} 3' in text
+    assert 'balansoft_stage_seconds_count{stage="json_parse"} 3' in text
+    assert 'balansoft_stage_seconds_sum{stage="json_parse"} 5.55' in text
+
+
+def test_payroll_run_is_instrumented(enabled: Metrics, tmp_path: Path) -> None:
+    """Loading and calculation record stages, counters and the chosen source."""
+    get_employees(use_db_if_available=False)
+    calculate_salary(3)
+
+    data = enabled.export_json()
+    counters = {
+        (c["name"], tuple(sorted(c["labels"].items()))): c["value"] for c in data["counters"]
+    }
+    assert counters[("balansoft_source_total", (("source", "json"),))] == 1
+    assert counters[("balansoft_salary_calculations_total", ())] == 1
+    loaded = sum(v for (name, _), v in counters.items() if name == "balansoft_rows_loaded_total")
+    assert loaded > 0
+    stages = {h["labels"]["stage"] for h in data["histograms"]}
+    assert "calculation" in stages
+    assert {"snapshot_open", "json_parse"} & stages
+
+    path = tmp_path / "metrics.json"
+    write_metrics(path)
+    assert json.loads(path.read_text(encoding="utf-8")) == enabled.export_json()
+
+
+def test_result_logging_is_lazy(caplog: pytest.LogCaptureFixture) -> None:
+    """Amounts are formatted only when INFO is enabled, with space-separated thousands."""
+    with caplog.at_level(logging.WARNING, logger="application.salary"):
+        calculate_salary(3)
+    assert not caplog.records
+
+    with caplog.at_level(logging.INFO, logger="application.salary"):
+        calculate_salary(3)
+    messages = [r.getMessage() for r in caplog.records]
+    assert "Оклад: 80 000 руб." in messages
+    assert any(m.startswith("Удержание (ИП): ") for m in messages)
@@ -0,0 +1,48 @@
+"""Tests for exact (integer kopeck) money mode."""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.salary import calculate_payroll, calculate_salary
+from utils.formatters import format_currency
+from utils.money import from_kopecks, mul_ratio, to_kopecks
+
+
+def test_exact_salary_matches_float_values() -> None:
+    """Exact mode keeps the test_calculate_salary values for Баба Яга."""
+    result = calculate_salary(employee_id=3, exact=True)
+    assert result["base_salary"] == Decimal("80000.00")
+    assert result["ndfl"] == Decimal("10036.00")
+    assert result["special_deduction"] == Decimal("20989.20")
+    assert result["net_salary"] == Decimal("48974.80")
+
+    float_result = calculate_salary(employee_id=3)
+    for field in ("ndfl", "special_deduction", "net_salary"):
+        assert float(result[field]) == float_result[field]
+
+
+def test_exact_payroll_totals_add_up() -> None:
+    """Decimal totals equal the exact sum of per-employee amounts."""
+    payroll = calculate_payroll(exact=True)
+    net = sum(r["net_salary"] for r in payroll["results"])
+    assert payroll["totals"]["net_salary"] == net
+    assert payroll["totals"]["net_salary"] == Decimal("713222.30")
+
+
+def test_kopeck_helpers() -> None:
+    """Conversion and half-up rounding in integer kopecks."""
+    assert to_kopecks(80000) == 8_000_000
+    assert to_kopecks(0.1) == 10
+    assert to_kopecks("2.675") == 268
+    assert from_kopecks(2_098_920) == Decimal("20989.20")
+    assert mul_ratio(5, 1, 2) == 3
+    assert mul_ratio(-5, 1, 2) == -3
+
+
+def test_format_currency_decimal() -> None:
+    """Decimal amounts are formatted like floats, rounded half up."""
+    assert format_currency(Decimal("48974.80")) == "48 975 RUB"
+    assert format_currency(Decimal("2.50")) == "3 RUB"
@@ -0,0 +1,35 @@
+"""Tests for batch payroll calculation."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.salary import calculate_payroll, calculate_salary
+
+
+def test_calculate_payroll_matches_single_calls() -> None:
+    """Batch results equal calculate_salary() for every employee."""
+    payroll = calculate_payroll()
+    assert payroll["totals"]["headcount"] == 10
+    assert payroll["not_found"] == []
+    for result in payroll["results"]:
+        assert result == calculate_salary(employee_id=result["employee_id"])
+
+
+def test_calculate_payroll_totals() -> None:
+    """Department totals add up to company totals."""
+    payroll = calculate_payroll()
+    departments = payroll["departments"]
+    assert departments[2]["headcount"] == 3
+    assert departments[2]["department"] == "Бухгалтерия"
+    net = sum(d["net_salary"] for d in departments.values())
+    assert round(net, 2) == payroll["totals"]["net_salary"]
+
+
+def test_calculate_payroll_subset() -> None:
+    """Only requested IDs are calculated; unknown IDs are reported."""
+    payroll = calculate_payroll(employee_ids=[3, 999])
+    assert [r["employee_id"] for r in payroll["results"]] == [3]
+    assert payroll["totals"]["net_salary"] == 48974.8
+    assert payroll["not_found"] == [999]
@@ -0,0 +1,77 @@
+"""Tests for stored payroll results (SQLite stand-in for PostgreSQL)."""
+
+import sys
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+import database.session
+from application.salary import calculate_payroll, iter_payroll
+from database.models import Base
+from database.payroll_results import (
+    get_department_totals,
+    get_payslip,
+    get_payslip_history,
+    list_periods,
+    normalize_period,
+    store_payroll,
+    write_payroll_results,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'payroll.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_write_and_read_back(engine) -> None:
+    """Payslips and department totals read from the table match the calculation."""
+    payroll = calculate_payroll(exact=True)
+    with engine.begin() as conn:
+        n = write_payroll_results(conn, "2026-09", iter_payroll(exact=True), batch_size=4)
+    assert n == len(payroll["results"])
+
+    with engine.connect() as conn:
+        slip = get_payslip(conn, 3, date(2026, 9, 15))
+        stored = get_department_totals(conn, "2026-09")
+        assert get_payslip(conn, 3, "2026-08") is None
+        accounting = get_department_totals(conn, "2026-09", department_id=2)
+    assert slip["period"] == date(2026, 9, 1)
+    assert slip["employee_code"] == "ACC-002"
+    assert slip["net_salary"] == Decimal("48974.80")
+    assert stored["totals"] == payroll["totals"]
+    for dept_id, dept in payroll["departments"].items():
+        assert stored["departments"][dept_id] == dept
+    assert list(accounting["departments"]) == [2]
+    assert accounting["totals"]["headcount"] == payroll["departments"][2]["headcount"]
+
+
+def test_rewrite_and_history(engine, monkeypatch: pytest.MonkeyPatch) -> None:
+    """A rerun replaces rows of the period; history spans periods in order."""
+    monkeypatch.setattr(database.session, "engine", engine, raising=False)
+    assert store_payroll("2026-09") == store_payroll("2026-10") == store_payroll("2026-10")
+    changed = [dict(r, net_salary=Decimal("1.00")) for r in iter_payroll([3], exact=True)]
+    with engine.begin() as conn:
+        assert write_payroll_results(conn, "2026-10", changed) == 1
+
+    with engine.connect() as conn:
+        history = get_payslip_history(conn, 3)
+        assert list_periods(conn) == [date(2026, 9, 1), date(2026, 10, 1)]
+        count = conn.execute(sqlalchemy.text("SELECT count(*) FROM payroll_results")).scalar()
+        assert get_payslip_history(conn, 3, period_from="2026-10") == history[1:]
+    assert [h["period"] for h in history] == [date(2026, 9, 1), date(2026, 10, 1)]
+    assert history[1]["net_salary"] == Decimal("1.00")
+    assert count == 2 * len(calculate_payroll()["results"])
+
+
+def test_normalize_period() -> None:
+    assert normalize_period("2026-10") == normalize_period(date(2026, 10, 31)) == date(2026, 10, 1)
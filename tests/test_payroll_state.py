@@ -0,0 +1,140 @@
+"""Tests for incremental payroll recalculation."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.db.cache import clear_cache
+from application.payroll_state import PayrollState
+from application.salary import calculate_payroll, update_payroll
+from utils import salary_rules
+
+_DATA = Path(__file__).resolve().parent.parent / "data" / "employees.json"
+
+
+def _employees() -> list[dict]:
+    return json.loads(_DATA.read_text(encoding="utf-8"))["employees"]
+
+
+def _without_version(payroll: dict) -> dict:
+    return {k: v for k, v in payroll.items() if k not in ("version", "recalculated")}
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_full_state_matches_calculate_payroll(exact) -> None:
+    """A fresh state gives the same results and totals as calculate_payroll()."""
+    state = PayrollState(exact=exact)
+    assert state.sync(_employees()) == 10
+    assert _without_version(state.payroll()) == calculate_payroll(exact=exact)
+
+
+def test_patch_only_changed_employee() -> None:
+    """A correction recalculates one employee and patches the totals."""
+    employees = _employees()
+    state = PayrollState()
+    state.sync(employees)
+    version = state.version
+
+    employees[2]["base_salary"] = 90000
+    assert state.sync(employees) == 1
+    assert state.entry_version(3) == version + 1
+    assert state.entry_version(1) == version
+
+    fresh = PayrollState()
+    fresh.sync(employees)
+    assert state.payroll()["totals"] == fresh.payroll()["totals"]
+    assert state.payroll()["departments"] == fresh.payroll()["departments"]
+
+
+def test_dirty_set_and_removal() -> None:
+    """mark_dirty() + recalculate() touch only the dirty ids; missing ones are removed."""
+    employees = {e["id"]: e for e in _employees()}
+    state = PayrollState(exact=True)
+    state.sync(employees.values())
+
+    employees[5]["tax_deduction"] = 5000
+    del employees[9]
+    state.mark_dirty([5, 9])
+    assert state.recalculate(employees.get) == 2
+    assert state.dirty == frozenset()
+
+    fresh = PayrollState(exact=True)
+    fresh.sync(employees.values())
+    assert len(state) == 9
+    assert state.payroll()["totals"] == fresh.payroll()["totals"]
+    assert 5 not in state.payroll()["departments"]
+
+
+def test_update_payroll_persists_state(tmp_path, monkeypatch) -> None:
+    """update_payroll() saves results and recalculates only changes on the next run."""
+    roster = tmp_path / "employees.json"
+    roster.write_bytes(_DATA.read_bytes())
+    state_path = tmp_path / "payroll_state.json"
+    monkeypatch.setenv("BALANSOFT_EMPLOYEES_JSON", str(roster))
+    clear_cache()
+
+    first = update_payroll(state_path, exact=True)
+    assert first["recalculated"] == 10
+    assert update_payroll(state_path, exact=True)["recalculated"] == 0
+
+    data = json.loads(roster.read_text(encoding="utf-8"))
+    data["employees"][2]["special_conditions"]["deduction_percent"] = 40
+    roster.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    stat = roster.stat()
+    os.utime(roster, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    patched = update_payroll(state_path, employee_ids=[3], exact=True)
+    assert patched["recalculated"] == 1
+    assert _without_version(patched) == calculate_payroll(exact=True)
+    assert patched["totals"]["net_salary"] < first["totals"]["net_salary"]
+
+
+def test_incompatible_state_is_discarded(tmp_path) -> None:
+    """Another money mode or unreadable file means a full recalculation."""
+    path = tmp_path / "state.json"
+    state = PayrollState()
+    state.sync(_employees())
+    state.save(path)
+    assert len(PayrollState.load(path)) == 10
+    assert len(PayrollState.load(path, exact=True)) == 0
+    path.write_text("{", encoding="utf-8")
+    assert len(PayrollState.load(path)) == 0
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_saved_state_mode_follows_umask(tmp_path) -> None:
+    """save() leaves the usual 0o666 & ~umask on the file, not mkstemp's 0o600."""
+    old = os.umask(0o022)
+    try:
+        PayrollState().save(tmp_path / "state.json")
+    finally:
+        os.umask(old)
+    assert (tmp_path / "state.json").stat().st_mode & 0o777 == 0o644
+
+
+def test_deduction_rule_change_invalidates_state(tmp_path, monkeypatch) -> None:
+    """register_deduction_type() changes the rule version: saved and in-memory results are redone."""
+    employees = _employees()
+    del employees[2]["special_conditions"]["max_percent"]  # предел берётся из реестра
+    path = tmp_path / "state.json"
+    state = PayrollState(exact=True)
+    state.sync(employees)
+    state.save(path)
+    before = state.payroll()["totals"]["special_deduction"]
+
+    # Реестр и номер редакции правил восстанавливаются после теста
+    monkeypatch.setattr(salary_rules, "DEDUCTION_TYPES", dict(salary_rules.DEDUCTION_TYPES))
+    monkeypatch.setattr(salary_rules, "_RULES", {})
+    monkeypatch.setattr(salary_rules, "RULES_GENERATION", salary_rules.RULES_GENERATION)
+    salary_rules.register_deduction_type("executive_proceedings", 20)
+    assert len(PayrollState.load(path, exact=True)) == 0
+    assert state.sync(employees) == 10
+    fresh = PayrollState(exact=True)
+    fresh.sync(employees)
+    assert state.payroll()["totals"] == fresh.payroll()["totals"]
+    assert state.payroll()["totals"]["special_deduction"] < before
@@ -0,0 +1,114 @@
+"""Tests for employee lookup and filtering."""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.db import people
+from application.db.index import RosterIndex
+from application.db.people import get_employee, get_employees, iter_employee_pages
+
+
+def test_get_employee_by_id_and_code() -> None:
+    """Lookup by id and by employee_code return equal records."""
+    by_id = get_employee(3, use_db_if_available=False)
+    by_code = get_employee(employee_code="ACC-002", use_db_if_available=False)
+    assert by_id["full_name"] == "Баба Яга Кощеевна"
+    assert by_code == by_id
+    assert get_employee(999, use_db_if_available=False) is None
+
+
+def test_get_employees_by_department() -> None:
+    """department_id filter keeps roster order."""
+    employees = get_employees(use_db_if_available=False, department_id=3)
+    assert [e["id"] for e in employees] == [5, 6, 7, 10]
+
+
+def test_roster_index() -> None:
+    """Index keeps the first record for duplicate keys and groups departments."""
+    index = RosterIndex(
+        [
+            {"id": 1, "employee_code": "A", "department_id": 1},
+            {"id": 2, "employee_code": "B", "department_id": 1},
+            {"id": 1, "employee_code": "C", "department_id": 2},
+        ]
+    )
+    assert len(index) == 3
+    assert index.get(1)["employee_code"] == "A"
+    assert index.get_by_code("C")["department_id"] == 2
+    assert [e["id"] for e in index.in_department(1)] == [1, 2]
+    assert index.in_department(9) == []
+
+
+def test_get_employees_window() -> None:
+    """offset/limit slice the roster (and a department) in roster order."""
+    all_ids = [e["id"] for e in get_employees(use_db_if_available=False)]
+    page = get_employees(use_db_if_available=False, offset=2, limit=3)
+    assert [e["id"] for e in page] == all_ids[2:5]
+    dept = get_employees(use_db_if_available=False, department_id=3, offset=1, limit=2)
+    assert [e["id"] for e in dept] == [6, 7]
+    assert get_employees(use_db_if_available=False, offset=100) == []
+
+
+def test_iter_employee_pages() -> None:
+    """Pages cover the requested window without gaps; the last one may be short."""
+    pages = list(iter_employee_pages(4, use_db_if_available=False, offset=1, limit=7))
+    assert [len(p) for p in pages] == [4, 3]
+    ids = [e["id"] for p in pages for e in p]
+    assert ids == [e["id"] for e in get_employees(use_db_if_available=False)][1:8]
+    pages = list(iter_employee_pages(3, use_db_if_available=False, department_id=3))
+    assert [[e["id"] for e in p] for p in pages] == [[5, 6, 7], [10]]
+
+
+def test_roster_index_page() -> None:
+    index = RosterIndex([{"id": i, "department_id": i % 2} for i in range(1, 8)])
+    assert [e["id"] for e in index.page(1, 2)] == [2, 3]
+    assert [e["id"] for e in index.page(1, None, department_id=1)] == [3, 5, 7]
+    assert index.page(10, 5) == []
+
+
+def test_hedged_loading(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A DB answer within the deadline wins; a slow DB yields the JSON roster instead."""
+    from database import health
+    from database.health import CircuitBreaker
+
+    db_roster = RosterIndex([{"id": 100, "full_name": "Из БД", "department_id": 1}])
+    release = threading.Event()
+
+    def slow_db() -> RosterIndex:
+        release.wait(5)
+        return db_roster
+
+    breaker = CircuitBreaker()
+    monkeypatch.setattr(health, "breaker", breaker)
+    monkeypatch.setattr(people, "_db_configured", lambda: True)
+    monkeypatch.setattr(people, "_try_load_from_db", lambda: db_roster)
+    assert [e["id"] for e in get_employees(hedge_deadline=1.0)] == [100]
+
+    monkeypatch.setattr(people, "_try_load_from_db", slow_db)
+    start = time.perf_counter()
+    employees = get_employees(hedge_deadline=0.05)
+    elapsed = time.perf_counter() - start
+    assert employees == get_employees(use_db_if_available=False)
+    assert elapsed < 2
+    # Зависание отмечено в размыкателе; поздний успешный ответ снимает отметку
+    assert breaker.is_open and breaker.failures == 1
+    release.set()
+    for _ in range(100):
+        if not breaker.is_open:
+            break
+        time.sleep(0.01)
+    assert not breaker.is_open
+
+
+def test_no_hedging_without_db(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without a configured DB a hedged call starts no background work."""
+    monkeypatch.setattr(people, "_db_configured", lambda: False)
+    monkeypatch.setattr(people._db_pool, "submit", lambda fn: pytest.fail("hedged without DB"))
+    monkeypatch.setattr(people, "_try_load_from_db", lambda: None)
+    assert get_employees(hedge_deadline=1.0) == get_employees(use_db_if_available=False)
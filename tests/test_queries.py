@@ -0,0 +1,91 @@
+"""Tests for column-projected DB queries (SQLite stand-in)."""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+import sqlalchemy.orm
+
+import database.session
+from application.db.people import get_employee, get_employees, iter_employees
+from database import health
+from database.health import CircuitBreaker
+from database.models import Base
+from database.seed import (
+    iter_employees_json,
+    load_departments,
+    seed_departments_bulk,
+    seed_employees_bulk,
+)
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    """SQLite-база, заполненная из data/employees.json, как основной источник."""
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'q.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed_departments_bulk(conn, load_departments())
+        seed_employees_bulk(conn, iter_employees_json(), progress=None)
+    monkeypatch.setattr(database.session, "engine", engine)
+    monkeypatch.setattr(database.session, "SessionLocal", sqlalchemy.orm.sessionmaker(bind=engine))
+    monkeypatch.setattr(health, "breaker", CircuitBreaker())
+    yield engine
+    engine.dispose()
+
+
+def test_full_profile_matches_json(db) -> None:
+    """The "full" profile yields JSON-compatible records with the department name joined."""
+    from_db = list(iter_employees())
+    from_json = list(iter_employees(use_db_if_available=False))
+    assert len(from_db) == 10
+    assert from_db[2]["department"] == "Бухгалтерия"
+    fields = ("id", "full_name", "department", "base_salary", "tax_deduction", "special_conditions")
+    for db_emp, json_emp in zip(from_db, from_json):
+        assert {f: db_emp[f] for f in fields} == {f: json_emp[f] for f in fields}
+
+
+def test_filters_pushed_down(db) -> None:
+    """Department and grade filters give the same rows from SQL and from JSON."""
+    kwargs = {"profile": "listing", "department_id": 3, "grade_min": 3, "grade_max": 5}
+    from_db = list(iter_employees(batch_size=2, **kwargs))
+    from_json = list(iter_employees(use_db_if_available=False, **kwargs))
+    assert [e["id"] for e in from_db] == [5, 6, 10]
+    assert from_db == from_json
+    assert set(from_db[0]) == {"id", "employee_code", "full_name", "department_id", "department", "position", "base_salary"}
+
+
+def test_get_employee_projected(db) -> None:
+    """Single lookups use the same projection."""
+    assert get_employee(employee_code="ACC-002")["department"] == "Бухгалтерия"
+    assert get_employee(999) is None
+
+
+def test_raw_sql_write_invalidates_cached_roster(db) -> None:
+    """roster_version triggers catch writes that bypass the ORM (raw SQL, bulk upserts)."""
+    assert get_employees()[0]["base_salary"] != 12345.0
+    with db.begin() as conn:
+        conn.exec_driver_sql("UPDATE employees SET base_salary = 12345 WHERE id = 1")
+    assert get_employees()[0]["base_salary"] == 12345.0
+    with db.begin() as conn:
+        seed_employees_bulk(conn, iter_employees_json(), progress=None)
+    assert get_employees()[0]["base_salary"] != 12345.0
+
+
+def test_exact_mode_keeps_numeric_as_decimal(db) -> None:
+    """exact=True yields NUMERIC money as Decimal from the DB and the same values from JSON."""
+    from application.salary_memo import calculate_salaries
+
+    kwargs = {"profile": "payroll", "exact": True}
+    from_db = list(iter_employees(**kwargs))
+    from_json = list(iter_employees(use_db_if_available=False, **kwargs))
+    assert all(isinstance(emp["base_salary"], Decimal) for emp in from_db)
+    assert from_db == from_json
+    assert calculate_salaries(from_db, exact=True) == calculate_salaries(from_json, exact=True)
+    assert isinstance(next(iter_employees(profile="payroll"))["base_salary"], float)
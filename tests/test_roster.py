@@ -0,0 +1,81 @@
+"""Tests for compact employee records."""
+
+import json
+import pickle
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.db.people import _load_from_json, get_employee, get_employees
+from application.db.roster import EmployeeRecord, compact_records
+from utils.salary_calculator import calculate_employee_salary
+
+_DATA = Path(__file__).resolve().parent.parent / "data" / "employees.json"
+
+
+def _employees() -> list[dict]:
+    return json.loads(_DATA.read_text(encoding="utf-8"))["employees"]
+
+
+def test_record_behaves_like_dict() -> None:
+    """Lookups, iteration, equality and calculations match the source dict."""
+    source = _employees()
+    records = compact_records(source)
+    for emp, record in zip(source, records):
+        assert record == emp
+        assert dict(record) == emp
+        assert len(record) == len(emp)
+        assert record["full_name"] == emp["full_name"]
+        assert record.get("missing", "-") == "-"
+        assert calculate_employee_salary(record) == calculate_employee_salary(emp)
+
+
+def test_missing_and_extra_keys() -> None:
+    """Absent fields raise KeyError; unknown keys are kept."""
+    record = EmployeeRecord({"id": 1, "custom": "x"})
+    assert "full_name" not in record
+    with pytest.raises(KeyError):
+        record["full_name"]
+    assert record["custom"] == "x"
+    assert dict(record) == {"id": 1, "custom": "x"}
+
+
+def test_read_only_and_picklable() -> None:
+    """Records are immutable and survive pickling (process pool)."""
+    record = compact_records(_employees())[2]
+    with pytest.raises(TypeError):
+        record.base_salary = 0
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_values_are_shared() -> None:
+    """Repeated strings and numbers are stored once across the roster."""
+    first, second = compact_records(json.loads(json.dumps([_employees()[0]] * 2)))
+    assert first["position"] is second["position"]
+    assert first["base_salary"] is second["base_salary"]
+
+
+def test_cached_roster_is_compact() -> None:
+    """The cache holds compact records; get_employees() and get_employee() return plain dicts."""
+    assert all(isinstance(e, EmployeeRecord) for e in _load_from_json().employees)
+    employees = get_employees(use_db_if_available=False)
+    employee = get_employee(3, use_db_if_available=False)
+    assert all(type(e) is dict for e in employees) and type(employee) is dict
+    assert json.loads(json.dumps(employees)) == employees
+    assert (employee | {"notes": "x"})["notes"] == "x"
+    employee["base_salary"] = 0
+    employee["special_conditions"]["deduction_percent"] = 99
+    employees[2]["special_conditions"].clear()
+    fresh = get_employee(3, use_db_if_available=False)
+    assert fresh["base_salary"] != 0
+    assert fresh["special_conditions"]["deduction_percent"] == 30
+
+
+def test_record_copy() -> None:
+    """copy() gives a mutable dict with the same fields, including extra keys."""
+    record = EmployeeRecord({"id": 1, "full_name": "A", "custom": "x"})
+    copy = record.copy()
+    assert type(copy) is dict and copy == {"id": 1, "full_name": "A", "custom": "x"}
@@ -0,0 +1,62 @@
+"""Tests for memoized salary calculation."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.salary_memo import SalaryMemo
+from benchmarks.synthetic import generate_employees
+from utils import salary_calculator, salary_rules
+from utils.salary_calculator import calculate_employee_salary, calculate_employee_salary_exact
+
+
+@pytest.mark.parametrize("exact", [False, True])
+def test_memo_matches_calculator(exact: bool) -> None:
+    """Fanned-out results equal per-employee calculation; duplicates are hits."""
+    employees = list(generate_employees(2000, seed=3))
+    calculate = calculate_employee_salary_exact if exact else calculate_employee_salary
+    memo = SalaryMemo()
+    assert memo.calculate_many(employees, exact) == [calculate(e) for e in employees]
+    info = memo.info()
+    assert info["hits"] + info["misses"] == len(employees)
+    assert info["misses"] == info["entries"] < len(employees) / 2
+    assert memo.calculate(employees[0], exact) == calculate(employees[0])
+    assert memo.info()["hits"] == info["hits"] + 1
+
+
+def test_rule_changes_invalidate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A new NDFL rate or deduction type is seen at once, not served from the memo."""
+    employee = {
+        "id": 1,
+        "base_salary": 50000,
+        "tax_deduction": 1400,
+        "special_conditions": {"type": "bonus_hold", "deduction_percent": 90},
+    }
+    memo = SalaryMemo()
+    before = memo.calculate(employee)
+
+    monkeypatch.setattr(salary_calculator, "NDFL_RATE", 0.15)
+    assert memo.calculate(employee) == calculate_employee_salary(employee) != before
+
+    # Реестр и номер редакции правил восстанавливаются после теста
+    monkeypatch.setattr(salary_rules, "DEDUCTION_TYPES", dict(salary_rules.DEDUCTION_TYPES))
+    monkeypatch.setattr(salary_rules, "_RULES", {})
+    monkeypatch.setattr(salary_rules, "RULES_GENERATION", salary_rules.RULES_GENERATION)
+    salary_rules.register_deduction_type("bonus_hold", 10)
+    result = memo.calculate(employee)
+    assert result == calculate_employee_salary(employee)
+    assert result["special_deduction"] < before["special_deduction"]
+    assert memo.info()["misses"] == 3
+
+
+def test_memo_is_bounded() -> None:
+    """Past maxsize the least recently used entries are evicted."""
+    memo = SalaryMemo(maxsize=3)
+    for salary in range(10):
+        memo.calculate({"base_salary": 10000 + salary})
+    assert memo.info()["entries"] == 3
+    memo.calculate({"base_salary": 10009})
+    assert memo.info()["hits"] == 1
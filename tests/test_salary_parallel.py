@@ -0,0 +1,32 @@
+"""Tests for parallel salary calculation."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.salary import calculate_payroll
+from benchmarks.synthetic import make_roster
+from utils.salary_calculator import calculate_employee_salary
+from utils import salary_parallel
+from utils.salary_parallel import calculate_salaries_parallel
+
+
+@pytest.mark.parametrize("by_department", [False, True])
+def test_parallel_matches_serial(by_department: bool) -> None:
+    """Process pool results equal the serial loop, in input order."""
+    employees = make_roster(97)["employees"]
+    serial = [calculate_employee_salary(emp) for emp in employees]
+    parallel = calculate_salaries_parallel(
+        employees, workers=2, chunk_size=10, min_parallel=0, by_department=by_department
+    )
+    assert parallel == serial
+
+
+def test_parallel_payroll_matches_serial(monkeypatch) -> None:
+    """calculate_payroll(workers=2) is identical to the serial run."""
+    monkeypatch.setattr(salary_parallel, "DEFAULT_MIN_PARALLEL", 0)
+    assert calculate_payroll(workers=2, chunk_size=3, exact=True) == calculate_payroll(exact=True)
+    assert calculate_payroll(workers=2, chunk_size=3) == calculate_payroll()
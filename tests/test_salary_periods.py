@@ -0,0 +1,92 @@
+"""Tests for the 12-month payroll engine."""
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+np = pytest.importorskip("numpy")
+
+from application.salary import calculate_annual_payroll, calculate_payroll
+from utils.money import mul_ratio
+from utils.salary_calculator import calculate_employee_salary_exact
+from utils.salary_periods import calculate_year, effective_percent
+
+
+def _employee(**fields) -> dict:
+    employee = {"id": 1, "full_name": "Тест", "base_salary": 80000, "tax_deduction": 0}
+    employee.update(fields)
+    return employee
+
+
+def test_full_year_matches_monthly_calculator() -> None:
+    """A long-standing employee: gross and special deduction as the single-month calculator."""
+    employee = _employee(
+        hire_date="2020-01-01",
+        tax_deduction=1400,
+        special_conditions={"type": "alimony", "deduction_percent": 25, "start_date": "2020-01-01"},
+    )
+    m = calculate_year([employee], 2024)
+    monthly = calculate_employee_salary_exact(employee)
+    assert (m["gross"][:, 0] == 8_000_000).all()
+    assert (m["taxable"][:, 0] == 7_860_000).all()
+    # Нарастающий итог: годовой налог — одно округление от годовой базы
+    assert m["ndfl"][:, 0].sum() == mul_ratio(12 * 7_860_000, 13, 100)
+    assert abs(int(m["ndfl"][0, 0]) - int(monthly["ndfl"] * 100)) <= 1
+    assert (m["net_salary"] == m["gross"] - m["ndfl"] - m["special_deduction"]).all()
+
+
+def test_hire_date_prorates_and_skips_months() -> None:
+    """Months before hire are empty; the hiring month is prorated by calendar days."""
+    m = calculate_year([_employee(hire_date="2024-03-11", base_salary=31000)], 2024)
+    assert m["gross"][:2, 0].tolist() == [0, 0]
+    assert m["gross"][2, 0] == 2_100_000  # 21 из 31 дня марта
+    assert (m["gross"][3:, 0] == 3_100_000).all()
+    assert m["employed"][:, 0].sum() == 10
+    assert (m["ndfl"][:2, 0] == 0).all()
+
+    later = calculate_year([_employee(hire_date="2025-01-10")], 2024)
+    assert (later["gross"] == 0).all() and not later["employed"].any()
+
+
+def test_special_start_date_and_caps() -> None:
+    """Deductions start with the start_date month and never exceed max_percent."""
+    conditions = {
+        "type": "executive_proceedings",
+        "deduction_percent": 30,
+        "start_date": "2024-06-15",
+    }
+    m = calculate_year([_employee(special_conditions=conditions)], 2024)
+    assert (m["special_deduction"][:5, 0] == 0).all()
+    assert (m["special_deduction"][5:, 0] > 0).all()
+
+    assert effective_percent({"type": "alimony", "deduction_percent": 80}) == 70
+    assert effective_percent({"type": "alimony", "deduction_percent": 80, "max_percent": 50}) == 50
+    assert effective_percent({"deduction_percent": 33}) == 33
+    alimony = {"type": "alimony", "deduction_percent": 90}
+    capped = calculate_year([_employee(special_conditions=alimony)], 2024)
+    after_ndfl = capped["gross"] - capped["ndfl"]
+    assert (capped["special_deduction"] * 10 <= after_ndfl * 7 + 10).all()
+
+
+def test_annual_payroll_report() -> None:
+    """Annual summaries add up and steady months agree with calculate_payroll()."""
+    report = calculate_annual_payroll(2024)
+    assert report["totals"]["headcount"] == 10
+    assert len(report["months"]) == 12
+    income = sum(e["income"] for e in report["employees"])
+    assert income == report["totals"]["income"] == sum(m["income"] for m in report["months"])
+    totals = report["totals"]
+    assert totals["net_salary"] == totals["income"] - totals["ndfl"] - totals["special_deduction"]
+    december = report["months"][11]
+    payroll = calculate_payroll(exact=True)
+    assert december["income"] == payroll["totals"]["base_salary"]
+    assert abs(december["ndfl"] - payroll["totals"]["ndfl"]) <= Decimal("0.10")
+
+    baba_yaga = calculate_annual_payroll(2023, employee_ids=[3, 999])
+    assert baba_yaga["not_found"] == [999]
+    # Исполнительное производство с 01.06.2023 — удержания за 7 месяцев
+    assert (baba_yaga["matrix"]["special_deduction"][:, 0] > 0).sum() == 7
@@ -0,0 +1,80 @@
+"""Tests for the compiled tariff grid and deduction rules."""
+
+import sys
+from decimal import Decimal
+from fractions import Fraction
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.salary import load_tariff_grid, validate_roster
+from utils.salary_calculator import (
+    calculate_special_deduction,
+    calculate_special_deduction_kopecks,
+)
+from utils.salary_rules import (
+    DEDUCTION_TYPES,
+    TariffGrid,
+    deduction_rule,
+    register_deduction_type,
+)
+
+
+def test_tariff_grid_from_company_data() -> None:
+    """Grade 1 salary times coefficient; bounds per grade."""
+    grid = load_tariff_grid()
+    assert grid.base_salary == Decimal(40000)
+    assert grid.grades == [1, 2, 3, 4, 5, 6]
+    assert grid.bounds(3) == (Fraction(3, 2), Fraction(19, 10))
+    assert grid.salary(2.8) == Decimal("112000.00")
+    assert grid.bounds(7) is None
+
+
+def test_validate_roster_bulk() -> None:
+    """Data file: three salaries differ from grade 1 x coefficient."""
+    issues = validate_roster()
+    assert [(i["employee_id"], i["code"]) for i in issues] == [
+        (2, "salary_mismatch"),
+        (4, "salary_mismatch"),
+        (5, "salary_mismatch"),
+    ]
+    assert issues[0]["expected"] == Decimal("112000.00")
+
+
+def test_validate_reports_grade_and_range() -> None:
+    """Unknown grades and coefficients outside the grade's range are reported."""
+    grid = TariffGrid([{"grade": 1, "min_coefficient": 1.0, "max_coefficient": 1.2}], 10000)
+    issues = grid.validate(
+        [
+            {"id": 1, "tariff_grade": 1, "coefficient": 1.1, "base_salary": 11000},
+            {"id": 2, "tariff_grade": 1, "coefficient": 1.5, "base_salary": 15000},
+            {"id": 3, "tariff_grade": 9, "coefficient": 1.0, "base_salary": 10000},
+        ]
+    )
+    assert [(i["employee_id"], i["code"]) for i in issues] == [
+        (2, "coefficient_out_of_range"),
+        (3, "unknown_grade"),
+    ]
+
+
+def test_deduction_rules_are_compiled_and_capped() -> None:
+    """Same conditions share one compiled rule; caps come from data or the type."""
+    conditions = {"type": "alimony", "deduction_percent": 25}
+    assert deduction_rule(conditions) is deduction_rule(dict(conditions))
+    assert deduction_rule({"type": "alimony", "deduction_percent": 90}).percent == 70
+    capped = {"type": "alimony", "deduction_percent": 90, "max_percent": 60}
+    assert deduction_rule(capped).percent == 60
+    assert deduction_rule(None).apply(1000.0) == 0.0
+
+    assert calculate_special_deduction(69600.0, conditions) == 17400.0
+    over_limit = {"type": "alimony", "deduction_percent": 80}
+    assert calculate_special_deduction_kopecks(6_960_000, over_limit) == 4_872_000
+
+
+def test_register_new_deduction_type() -> None:
+    """Future condition types plug in with their own limit."""
+    try:
+        register_deduction_type("compensation", 20)
+        assert deduction_rule({"type": "compensation", "deduction_percent": 35}).percent == 20
+    finally:
+        DEDUCTION_TYPES.pop("compensation", None)
@@ -0,0 +1,55 @@
+"""Parity tests: NumPy salary kernel vs scalar calculator."""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+np = pytest.importorskip("numpy")
+
+from utils.salary_calculator import calculate_employee_salary
+from utils.salary_vectorized import calculate_salary_columns, employee_columns, round2
+
+
+def _random_employees(n: int, seed: int = 42) -> list[dict]:
+    rng = random.Random(seed)
+    employees = []
+    for i in range(n):
+        base = rng.choice([rng.randrange(0, 500_000), round(rng.uniform(0, 500_000), 2)])
+        conditions = None
+        if rng.random() < 0.4:
+            percent = rng.choice([25, 30, 33, 50, 70, round(rng.uniform(0, 70), 2)])
+            conditions = {"type": "alimony", "deduction_percent": percent}
+        employees.append(
+            {
+                "id": i,
+                "base_salary": base,
+                "tax_deduction": rng.choice([0, 1400, 2800, round(rng.uniform(0, 10_000), 2)]),
+                "special_conditions": conditions,
+            }
+        )
+    return employees
+
+
+def test_round2_matches_builtin_round() -> None:
+    """round2 reproduces round(x, 2), including ties like 0.125 and 2.675."""
+    rng = random.Random(7)
+    values = [0.125, 0.135, 2.675, 1.005, -0.125, 0.0, 1e16 + 2]
+    values += [rng.randrange(0, 10**9) / 1000 for _ in range(20_000)]
+    expected = [round(v, 2) for v in values]
+    assert round2(np.asarray(values)).tolist() == expected
+
+
+def test_columns_match_scalar_calculator() -> None:
+    """Every kopeck matches calculate_employee_salary() on random inputs."""
+    employees = _random_employees(20_000)
+    columns = employee_columns(employees)
+    result = calculate_salary_columns(**columns)
+    for i, emp in enumerate(employees):
+        scalar = calculate_employee_salary(emp)
+        assert result["ndfl"][i] == scalar["ndfl"]
+        assert result["special_deduction"][i] == scalar["special_deduction"]
+        assert result["net_salary"][i] == scalar["net_salary"]
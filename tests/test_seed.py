@@ -0,0 +1,56 @@
+"""Tests for bulk database seeding (SQLite stand-in)."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+sqlalchemy = pytest.importorskip("sqlalchemy")
+
+from database.models import Base, Employee
+from database.seed import (
+    clear_tables,
+    iter_employees_json,
+    load_departments,
+    seed_departments_bulk,
+    seed_employees_bulk,
+)
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'seed.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_bulk_seed_and_upsert(engine) -> None:
+    """Bulk seeding inserts all rows; a second run upserts without duplicates."""
+    progress = []
+    with engine.begin() as conn:
+        seed_departments_bulk(conn, load_departments())
+        n = seed_employees_bulk(
+            conn, iter_employees_json(), batch_size=4, progress=lambda rows, _: progress.append(rows)
+        )
+    assert n == 10
+    assert progress == [4, 8, 10]
+
+    changed = [dict(e, base_salary=99000) if e["id"] == 3 else e for e in iter_employees_json()]
+    with engine.begin() as conn:
+        seed_employees_bulk(conn, changed, progress=None)
+        rows = conn.execute(sqlalchemy.select(Employee.id, Employee.base_salary)).all()
+    assert len(rows) == 10
+    assert dict(rows)[3] == 99000
+
+
+def test_clear_tables(engine) -> None:
+    """clear_tables() empties employees and departments."""
+    with engine.begin() as conn:
+        seed_departments_bulk(conn, load_departments())
+        seed_employees_bulk(conn, iter_employees_json(), progress=None)
+        clear_tables(conn)
+        count = conn.execute(sqlalchemy.select(sqlalchemy.func.count(Employee.id))).scalar()
+    assert count == 0
@@ -0,0 +1,228 @@
+"""Tests for the binary roster snapshot."""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from application.db.cache import clear_cache
+from application.db.snapshot import (
+    Snapshot,
+    SnapshotRoster,
+    build_snapshot,
+    load_roster,
+    snapshot_path,
+)
+from application.salary import calculate_payroll, calculate_salary
+
+_DATA = Path(__file__).resolve().parent.parent / "data" / "employees.json"
+
+
+def _copy(tmp_path: Path) -> Path:
+    path = tmp_path / "employees.json"
+    path.write_bytes(_DATA.read_bytes())
+    return path
+
+
+def test_roundtrip_matches_json(tmp_path) -> None:
+    """Every record decoded from the snapshot equals the JSON record."""
+    employees = json.loads(_DATA.read_text(encoding="utf-8"))["employees"]
+    path = tmp_path / "roster.snap"
+    assert build_snapshot(employees, path) == len(employees)
+    snapshot = Snapshot(path)
+    decoded = [snapshot.row(r) for r in range(len(snapshot))]
+    assert decoded == employees
+    assert [type(e["base_salary"]) for e in decoded] == [type(e["base_salary"]) for e in employees]
+    assert list(snapshot.column("id")) == [e["id"] for e in employees]
+
+
+@pytest.mark.skipif(os.name != "posix", reason="POSIX file modes")
+def test_snapshot_file_mode_follows_umask(tmp_path) -> None:
+    """The snapshot gets the usual 0o666 & ~umask, not mkstemp's 0o600."""
+    old = os.umask(0o022)
+    try:
+        build_snapshot([{"id": 1}], tmp_path / "mode.snap")
+    finally:
+        os.umask(old)
+    assert (tmp_path / "mode.snap").stat().st_mode & 0o777 == 0o644
+
+
+def test_odd_values_round_trip(tmp_path) -> None:
+    """Missing fields, nulls, unknown keys and off-type values survive."""
+    employees = [
+        {"id": 7, "full_name": None, "base_salary": 1000.5, "custom": [1, 2]},
+        {"id": "x", "employee_code": "B", "tariff_grade": 2.5, "is_active": False},
+        {"employee_code": "A"},
+    ]
+    path = tmp_path / "odd.snap"
+    build_snapshot(employees, path)
+    snapshot = Snapshot(path)
+    assert [snapshot.row(r) for r in range(3)] == employees
+    assert snapshot.find_id(7) == 0 and snapshot.find_id(8) is None
+    assert snapshot.find_code("A") == 2 and snapshot.find_code("B") == 1
+
+
+def test_roster_lookups(tmp_path) -> None:
+    """SnapshotRoster answers like RosterIndex, honouring active_only."""
+    roster = load_roster(_copy(tmp_path), active_only=True)
+    assert isinstance(roster, SnapshotRoster)
+    assert len(roster) == 10
+    assert roster.get(3)["full_name"] == "Баба Яга Кощеевна"
+    assert roster.get_by_code("HR-001")["id"] == 4
+    expected = [e["id"] for e in roster.employees if e["department_id"] == 3]
+    assert [e["id"] for e in roster.in_department(3)] == expected
+    assert roster.get(999) is None
+
+
+def test_roster_page_decodes_only_the_window(tmp_path) -> None:
+    """page() matches RosterIndex slicing and leaves the full list unbuilt."""
+    roster = load_roster(_copy(tmp_path), active_only=True)
+    page = roster.page(2, 3)
+    assert roster._employees is None
+    assert len(roster._decoded) == 3
+    assert page == roster.employees[2:5]
+    assert page[0] is roster.employees[2]
+    expected = [e["id"] for e in roster.in_department(3)][1:]
+    assert [e["id"] for e in roster.page(1, None, department_id=3)] == expected
+
+
+def test_department_order_table(tmp_path) -> None:
+    """Departments are read from the dept order table in list order, odd ids excluded."""
+    employees = [
+        {"id": 1, "department_id": 2},
+        {"id": 2, "department_id": 1},
+        {"id": 3, "department_id": 2, "is_active": False},
+        {"id": 4, "department_id": None},
+        {"id": 5, "department_id": 2},
+        {"id": 6, "department_id": "2"},
+        {"id": 7, "department_id": 1},
+    ]
+    path = tmp_path / "dept.snap"
+    build_snapshot(employees, path)
+    snapshot = Snapshot(path)
+    assert list(snapshot.rows_in_department(2)) == [0, 2, 4]
+    assert list(snapshot.rows_in_department(1)) == [1, 6]
+    assert list(snapshot.rows_in_department(3)) == []
+    assert list(snapshot.rows_in_department("2")) == []
+    roster = SnapshotRoster(snapshot, active_only=True)
+    assert [e["id"] for e in roster.in_department(2)] == [1, 5]
+    assert [e["id"] for e in roster.page(1, 1, department_id=2)] == [5]
+
+
+def test_rebuilt_when_json_changes(tmp_path) -> None:
+    """A changed source file (mtime/size) triggers a rebuild; a corrupt snapshot too."""
+    path = _copy(tmp_path)
+    assert load_roster(path).get(3)["base_salary"] == 80000
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["employees"][2]["base_salary"] = 91000
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_roster(path).get(3)["base_salary"] == 91000
+
+    snapshot_path(path).write_bytes(b"garbage")
+    assert load_roster(path).get(3)["base_salary"] == 91000
+
+
+def test_disabled_or_missing(tmp_path, monkeypatch) -> None:
+    """No snapshot without a source file or with BALANSOFT_SNAPSHOT=0."""
+    assert load_roster(tmp_path / "missing.json") is None
+    monkeypatch.setenv("BALANSOFT_SNAPSHOT", "0")
+    assert load_roster(_copy(tmp_path)) is None
+
+
+def test_salary_uses_snapshot(tmp_path, monkeypatch) -> None:
+    """calculate_salary()/calculate_payroll() give the same results with and without snapshots."""
+    monkeypatch.setenv("BALANSOFT_EMPLOYEES_JSON", str(_copy(tmp_path)))
+    clear_cache()
+    with_snapshot = (calculate_salary(3), calculate_payroll()["totals"])
+    assert snapshot_path(tmp_path / "employees.json").exists()
+
+    monkeypatch.setenv("BALANSOFT_SNAPSHOT", "0")
+    clear_cache()
+    assert (calculate_salary(3), calculate_payroll()["totals"]) == with_snapshot
+
+
+def test_db_snapshot_is_keyed_to_roster_version(tmp_path, monkeypatch) -> None:
+    """A --from-db snapshot serves the DB loader while roster_version matches, never the JSON one."""
+    sqlalchemy = pytest.importorskip("sqlalchemy")
+    import sqlalchemy.orm
+
+    import database.session
+    from application.db.people import _try_load_from_db
+    from application.db.queries import roster_version_query
+    from application.db.snapshot import build_db_snapshot, db_snapshot_path, load_db_roster
+    from database import health
+    from database.health import CircuitBreaker
+    from database.models import Base
+    from database.seed import (
+        iter_employees_json,
+        load_departments,
+        seed_departments_bulk,
+        seed_employees_bulk,
+    )
+
+    engine = sqlalchemy.create_engine(f"sqlite:///{tmp_path / 'snap.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        seed_departments_bulk(conn, load_departments())
+        seed_employees_bulk(conn, iter_employees_json(), progress=None)
+        conn.exec_driver_sql("UPDATE employees SET base_salary = 91000 WHERE id = 3")
+        conn.exec_driver_sql("UPDATE employees SET is_active = 0 WHERE id = 5")
+    monkeypatch.setattr(database.session, "engine", engine)
+    monkeypatch.setattr(database.session, "SessionLocal", sqlalchemy.orm.sessionmaker(bind=engine))
+    monkeypatch.setattr(health, "breaker", CircuitBreaker())
+
+    path = _copy(tmp_path)
+    monkeypatch.setenv("BALANSOFT_EMPLOYEES_JSON", str(path))
+    employees = json.loads(path.read_text(encoding="utf-8"))["employees"]
+    db_path = db_snapshot_path(path)
+    assert db_path != snapshot_path(path)
+    assert build_db_snapshot(db_path) == len(employees)
+    with engine.connect() as conn:
+        version = conn.execute(roster_version_query()).scalar()
+
+    roster = load_db_roster(db_path, version, active_only=False)
+    assert roster.snapshot.from_db and roster.snapshot.source == (version, 0)
+    assert len(roster) == len(employees)
+    assert roster.get(5)["is_active"] is False
+    assert roster.get(3)["base_salary"] == 91000
+    assert roster.get(3)["department"] == "Бухгалтерия"
+    assert load_db_roster(db_path, version + 1) is None
+
+    clear_cache()
+    from_db = _try_load_from_db()
+    assert isinstance(from_db, SnapshotRoster) and len(from_db) == len(employees) - 1
+
+    # Запись в БД меняет roster_version: снимок больше не используется
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE employees SET base_salary = 92000 WHERE id = 3")
+    from_db = _try_load_from_db()
+    assert not isinstance(from_db, SnapshotRoster)
+    assert from_db.get(3)["base_salary"] == 92000
+    engine.dispose()
+
+    # Загрузчик JSON видит правки файла, даже если на месте его снимка лежит снимок из БД
+    os.replace(db_path, snapshot_path(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["employees"][0]["base_salary"] = 12345
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    roster = load_roster(path, active_only=False)
+    assert not roster.snapshot.from_db
+    assert roster.get(data["employees"][0]["id"])["base_salary"] == 12345
+
+
+def test_db_snapshot_requires_db(tmp_path, monkeypatch) -> None:
+    """Without a database, --from-db fails instead of falling back to the JSON."""
+    import database.session
+    from application.db.snapshot import build_db_snapshot
+
+    monkeypatch.setattr(database.session, "SessionLocal", None, raising=False)
+    with pytest.raises(RuntimeError):
+        build_db_snapshot(tmp_path / "db.snap")
+    assert not (tmp_path / "db.snap").exists()
@@ -0,0 +1,54 @@
+"""Tests for side-effect-free imports."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_startup import parse_importtime
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def test_imports_do_not_load_optional_dependencies() -> None:
+    """Importing the CLI modules loads neither SQLAlchemy nor rich."""
+    code = (
+        "import sys, run, database.session, database.async_session\n"
+        "print(sorted({m.split('.')[0] for m in sys.modules} & {'sqlalchemy', 'rich'}))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == "[]"
+
+
+def test_engine_is_none_without_database_url(monkeypatch: pytest.MonkeyPatch) -> None:
+    import database.session as session
+
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    monkeypatch.setattr(session, "database_url", lambda: None)
+    names = ("engine", "SessionLocal")
+    saved = {name: vars(session).pop(name) for name in names if name in vars(session)}
+    try:
+        assert session.engine is None
+        assert session.SessionLocal is None
+        with pytest.raises(RuntimeError):
+            next(session.get_db())
+    finally:
+        for name in names:
+            vars(session).pop(name, None)
+        vars(session).update(saved)
+
+
+def test_parse_importtime() -> None:
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 | _io\n"
+        "import time:        50 |         50 |   encodings.aliases\n"
+        "import time:       300 |        350 | encodings\n"
+        "import time:       200 |        200 | encodings\n"
+    )
+    assert parse_importtime(stderr) == {"_io": 120, "encodings": 550}
@@ -0,0 +1,30 @@
+"""File helpers for atomic writes (temp file + os.replace)."""
+
+__all__ = ["current_umask", "default_file_mode"]
+
+import os
+
+
+def current_umask() -> int:
+    """The process umask, read without changing it where the OS allows."""
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("Umask:"):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError):
+        pass
+    # os.umask() can only be read by setting it: keep the window restrictive
+    mask = os.umask(0o077)
+    os.umask(mask)
+    return mask
+
+
+def default_file_mode() -> int:
+    """
+    Mode a file created by open() would get (0o666 minus the umask).
+
+    tempfile.mkstemp() creates files with 0o600; a temp file that replaces
+    the target gets this mode first, so readers keep the usual permissions.
+    """
+    return 0o666 & ~current_umask()
@@ -1,6 +1,12 @@
 """Formatting utilities for Balansoft."""
 
+from decimal import ROUND_HALF_UP, Decimal
 
-def format_currency(amount: float, currency: str = "RUB") -> str:
-    """Format amount as currency."""
+_RUBLE = Decimal(1)
+
+
+def format_currency(amount: float | Decimal, currency: str = "RUB") -> str:
+    """Format amount as currency (Decimal amounts are rounded half up)."""
+    if isinstance(amount, Decimal):
+        amount = amount.quantize(_RUBLE, rounding=ROUND_HALF_UP)
     return f"{amount:,.0f} {currency}".replace(",", " ")
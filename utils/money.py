@@ -0,0 +1,48 @@
+"""Exact money arithmetic: amounts as integer kopecks, Decimal at the edges."""
+
+from decimal import ROUND_HALF_UP, Decimal
+from fractions import Fraction
+from functools import lru_cache
+from typing import Any
+
+KOPECKS_PER_RUBLE = 100
+
+_ONE = Decimal(1)
+
+
+def to_decimal(amount: Any) -> Decimal:
+    """Convert int, float, str or Decimal to Decimal (float via its shortest repr)."""
+    if isinstance(amount, Decimal):
+        return amount
+    if isinstance(amount, float):
+        return Decimal(repr(amount))
+    return Decimal(amount)
+
+
+def to_kopecks(amount: Any) -> int:
+    """Convert rubles to integer kopecks, rounding half up."""
+    if isinstance(amount, int):
+        return amount * KOPECKS_PER_RUBLE
+    scaled = to_decimal(amount) * KOPECKS_PER_RUBLE
+    return int(scaled.quantize(_ONE, rounding=ROUND_HALF_UP))
+
+
+def from_kopecks(kopecks: int) -> Decimal:
+    """Convert integer kopecks to Decimal rubles with two places."""
+    return Decimal(kopecks).scaleb(-2)
+
+
+@lru_cache(maxsize=1024)
+def ratio(value: Any) -> tuple[int, int]:
+    """Exact (numerator, denominator) of a rate like 0.13 or a percent like 33."""
+    fraction = Fraction(str(value))
+    return fraction.numerator, fraction.denominator
+
+
+def mul_ratio(kopecks: int, numerator: int, denominator: int) -> int:
+    """kopecks * numerator / denominator, rounded half up (away from zero)."""
+    product = kopecks * numerator
+    quotient, remainder = divmod(abs(product), denominator)
+    if 2 * remainder >= denominator:
+        quotient += 1
+    return quotient if product >= 0 else -quotient
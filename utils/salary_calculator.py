@@ -3,6 +3,9 @@
 import logging
 from typing import Any
 
+from utils.money import from_kopecks, mul_ratio, ratio, to_kopecks
+from utils.salary_rules import deduction_rule
+
 logger = logging.getLogger(__name__)
 
 NDFL_RATE = 0.13  # 13%
@@ -17,12 +20,8 @@ def calculate_ndfl(gross_salary: float, tax_deduction: float = 0) -> float:
 def calculate_special_deduction(
     net_after_ndfl: float, special_conditions: dict | None
 ) -> float:
-    """Calculate deduction for executive proceedings or alimony."""
-    if not special_conditions:
-        return 0.0
-
-    percent = special_conditions.get("deduction_percent", 0)
-    return round(net_after_ndfl * (percent / 100), 2)
+    """Calculate deduction for executive proceedings or alimony (capped by max_percent)."""
+    return deduction_rule(special_conditions).apply(net_after_ndfl)
 
 
 def calculate_employee_salary(employee: dict[str, Any]) -> dict[str, Any]:
@@ -55,3 +54,51 @@ def calculate_employee_salary(employee: dict[str, Any]) -> dict[str, Any]:
         "special_conditions": special_conditions,
         "net_salary": net,
     }
+
+
+def calculate_ndfl_kopecks(gross_salary: int, tax_deduction: int = 0) -> int:
+    """Exact NDFL in integer kopecks (rounded half up)."""
+    taxable = max(0, gross_salary - tax_deduction)
+    numerator, denominator = ratio(NDFL_RATE)
+    return mul_ratio(taxable, numerator, denominator)
+
+
+def calculate_special_deduction_kopecks(
+    net_after_ndfl: int, special_conditions: dict | None
+) -> int:
+    """Exact special deduction in integer kopecks (rounded half up, capped by max_percent)."""
+    return deduction_rule(special_conditions).apply_kopecks(net_after_ndfl)
+
+
+def calculate_employee_salary_exact(employee: dict[str, Any]) -> dict[str, Any]:
+    """
+    Calculate full salary for one employee in exact money arithmetic.
+
+    Amounts are converted to integer kopecks once, all arithmetic is done on
+    integers and the result carries Decimal values with two places.
+
+    Args:
+        employee: Employee data dict with base_salary, tax_deduction, special_conditions.
+
+    Returns:
+        Same keys as calculate_employee_salary(), money values as Decimal.
+    """
+    base_salary = to_kopecks(employee.get("base_salary", 0))
+    tax_deduction = to_kopecks(employee.get("tax_deduction", 0))
+    special_conditions = employee.get("special_conditions")
+
+    ndfl = calculate_ndfl_kopecks(base_salary, tax_deduction)
+    net_after_ndfl = base_salary - ndfl
+    special_deduction = calculate_special_deduction_kopecks(net_after_ndfl, special_conditions)
+    net = net_after_ndfl - special_deduction
+
+    return {
+        "employee_id": employee.get("id"),
+        "employee_name": employee.get("full_name"),
+        "base_salary": from_kopecks(base_salary),
+        "tax_deduction": from_kopecks(tax_deduction),
+        "ndfl": from_kopecks(ndfl),
+        "special_deduction": from_kopecks(special_deduction),
+        "special_conditions": special_conditions,
+        "net_salary": from_kopecks(net),
+    }
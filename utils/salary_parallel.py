@@ -0,0 +1,86 @@
+"""Parallel salary calculation over a process pool."""
+
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from utils.salary_calculator import calculate_employee_salary, calculate_employee_salary_exact
+
+DEFAULT_CHUNK_SIZE = int(os.getenv("BALANSOFT_PARALLEL_CHUNK_SIZE", "10000"))
+# Меньше этого числа сотрудников пул процессов не окупается — считаем в одном процессе
+DEFAULT_MIN_PARALLEL = int(os.getenv("BALANSOFT_PARALLEL_MIN", "20000"))
+
+# Поля, нужные калькулятору: остальное не пересылаем в процессы-исполнители
+_CALC_FIELDS = ("id", "full_name", "base_salary", "tax_deduction", "special_conditions")
+
+
+def _calc_fields(employee: dict[str, Any]) -> dict[str, Any]:
+    return {field: employee[field] for field in _CALC_FIELDS if field in employee}
+
+
+def _calculate_chunk(task: tuple[bool, list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    exact, employees = task
+    calculate = calculate_employee_salary_exact if exact else calculate_employee_salary
+    return [calculate(emp) for emp in employees]
+
+
+def _partitions(
+    employees: Sequence[dict[str, Any]], chunk_size: int, by_department: bool
+) -> list[list[int]]:
+    """Списки позиций сотрудников: подряд по chunk_size или по отделам (крупные — частями)."""
+    if not by_department:
+        total = len(employees)
+        return [list(range(i, min(i + chunk_size, total))) for i in range(0, total, chunk_size)]
+    groups: dict[Any, list[int]] = {}
+    for pos, emp in enumerate(employees):
+        groups.setdefault(emp.get("department_id"), []).append(pos)
+    parts = []
+    for positions in groups.values():
+        for i in range(0, len(positions), chunk_size):
+            parts.append(positions[i : i + chunk_size])
+    return parts
+
+
+def calculate_salaries_parallel(
+    employees: Sequence[dict[str, Any]],
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    min_parallel: int | None = None,
+    by_department: bool = False,
+    exact: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Calculate salaries for many employees across worker processes.
+
+    The roster is split into chunks (or per-department groups), each chunk is
+    calculated in a worker, and results are put back in the input order, so
+    the output is identical to a serial loop over calculate_employee_salary().
+
+    Args:
+        employees: employee dicts.
+        workers: number of processes (default: os.cpu_count()).
+        chunk_size: employees per task.
+        min_parallel: rosters smaller than this are calculated serially
+            (default: DEFAULT_MIN_PARALLEL).
+        by_department: partition by department_id instead of consecutive chunks.
+        exact: use calculate_employee_salary_exact().
+
+    Returns:
+        Results in the same order as employees.
+    """
+    workers = workers or os.cpu_count() or 1
+    if min_parallel is None:
+        min_parallel = DEFAULT_MIN_PARALLEL
+    if workers <= 1 or len(employees) < min_parallel:
+        return _calculate_chunk((exact, list(employees)))
+
+    parts = _partitions(employees, max(1, chunk_size), by_department)
+    tasks = [(exact, [_calc_fields(employees[pos]) for pos in part]) for part in parts]
+
+    results: list[dict[str, Any] | None] = [None] * len(employees)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for part, chunk_results in zip(parts, pool.map(_calculate_chunk, tasks)):
+            for pos, result in zip(part, chunk_results):
+                results[pos] = result
+    return results
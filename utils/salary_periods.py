@@ -0,0 +1,166 @@
+"""Multi-period (12-month) payroll engine on a month x employee matrix, optional: requires numpy."""
+
+import calendar
+from datetime import date
+from fractions import Fraction
+from typing import Any, Iterable
+
+from utils.money import ratio, to_kopecks
+from utils.salary_calculator import NDFL_RATE
+from utils.salary_rules import deduction_rule
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+MONTHS = 12
+
+# Индексы месяцев вне года: «до начала года» и «после конца года»
+_BEFORE, _AFTER = -1, MONTHS
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("NumPy не установлен. pip install numpy")
+
+
+def _parse_date(value: Any) -> date | None:
+    if not value:
+        return None
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _month_index(value: date | None, year: int, default: int) -> int:
+    """Месяц даты относительно года: 0..11, _BEFORE или _AFTER."""
+    if value is None:
+        return default
+    if value.year < year:
+        return _BEFORE
+    if value.year > year:
+        return _AFTER
+    return value.month - 1
+
+
+def effective_percent(special_conditions: dict | None) -> Fraction:
+    """Процент удержания с учётом предела max_percent (utils.salary_rules)."""
+    return deduction_rule(special_conditions).percent
+
+
+def period_columns(employees: Iterable[dict[str, Any]], year: int) -> dict[str, "np.ndarray"]:
+    """
+    Per-employee inputs of the year as int64 arrays (money in kopecks).
+
+    hire_month / special_month are month indexes 0..11 (-1: before the year,
+    12: after it); hire_day and hire_month_days prorate the hiring month.
+    """
+    _require_numpy()
+    ids, base, deduction = [], [], []
+    hire_month, hire_day, month_days = [], [], []
+    special_month, percent_num, percent_den = [], [], []
+    for emp in employees:
+        ids.append(emp.get("id"))
+        base.append(to_kopecks(emp.get("base_salary", 0)))
+        deduction.append(to_kopecks(emp.get("tax_deduction", 0)))
+
+        hired = _parse_date(emp.get("hire_date"))
+        month = _month_index(hired, year, _BEFORE)
+        hire_month.append(month)
+        if 0 <= month < MONTHS:
+            hire_day.append(hired.day)
+            month_days.append(calendar.monthrange(year, hired.month)[1])
+        else:
+            hire_day.append(1)
+            month_days.append(1)
+
+        conditions = emp.get("special_conditions")
+        percent = effective_percent(conditions)
+        if percent:
+            start = _parse_date(conditions.get("start_date"))
+            special_month.append(_month_index(start, year, _BEFORE))
+        else:
+            special_month.append(_AFTER)
+        percent_num.append(percent.numerator)
+        percent_den.append(percent.denominator)
+
+    return {
+        "employee_id": np.asarray(ids, dtype=object),
+        "base_salary": np.asarray(base, dtype=np.int64),
+        "tax_deduction": np.asarray(deduction, dtype=np.int64),
+        "hire_month": np.asarray(hire_month, dtype=np.int64),
+        "hire_day": np.asarray(hire_day, dtype=np.int64),
+        "hire_month_days": np.asarray(month_days, dtype=np.int64),
+        "special_month": np.asarray(special_month, dtype=np.int64),
+        "percent_num": np.asarray(percent_num, dtype=np.int64),
+        "percent_den": np.asarray(percent_den, dtype=np.int64),
+    }
+
+
+def _mul_ratio(values: "np.ndarray", numerator: Any, denominator: Any) -> "np.ndarray":
+    """values * numerator / denominator, rounded half up (values >= 0), as in utils.money."""
+    return (values * numerator * 2 + denominator) // (2 * denominator)
+
+
+def calculate_year(employees: Iterable[dict[str, Any]], year: int) -> dict[str, "np.ndarray"]:
+    """
+    Payroll for every month of the year in one pass over a (12, N) matrix.
+
+    - the month of hire_date is prorated by calendar days, earlier months are empty;
+    - the special deduction starts with the month of its start_date and is
+      capped by max_percent (the type's limit when missing);
+    - NDFL is withheld on a cumulative basis: tax on the taxable income since
+      the start of the year minus the tax already withheld, so the annual tax
+      equals the rate applied to the annual income with a single rounding.
+
+    Args:
+        employees: employee records (active employees are expected).
+        year: calendar year.
+
+    Returns:
+        "employee_id" (N,), boolean (12, N) "employed" and (12, N) int64
+        matrices in kopecks: gross, tax_deduction, taxable,
+        cumulative_taxable, ndfl, special_deduction, net_salary.
+    """
+    cols = period_columns(employees, year)
+    month = np.arange(MONTHS, dtype=np.int64)[:, None]
+    hire_month = cols["hire_month"][None, :]
+    base = cols["base_salary"][None, :]
+
+    employed = month >= hire_month
+    days_worked = cols["hire_month_days"] - cols["hire_day"] + 1
+    prorated = _mul_ratio(cols["base_salary"], days_worked, cols["hire_month_days"])[None, :]
+    gross = np.where(month > hire_month, base, np.where(employed, prorated, 0))
+
+    tax_deduction = np.where(employed, cols["tax_deduction"][None, :], 0)
+    taxable = np.maximum(gross - tax_deduction, 0)
+    cumulative = np.cumsum(taxable, axis=0)
+    rate_num, rate_den = ratio(NDFL_RATE)
+    ndfl_cumulative = _mul_ratio(cumulative, rate_num, rate_den)
+    ndfl = np.diff(ndfl_cumulative, axis=0, prepend=0)
+
+    net_after_ndfl = gross - ndfl
+    deducting = employed & (month >= cols["special_month"][None, :])
+    percent_num = cols["percent_num"][None, :]
+    percent_den = cols["percent_den"][None, :] * 100
+    special = _mul_ratio(np.maximum(net_after_ndfl, 0), percent_num, percent_den)
+    special = np.where(deducting, special, 0)
+
+    return {
+        "employee_id": cols["employee_id"],
+        "employed": employed,
+        "gross": gross,
+        "tax_deduction": tax_deduction,
+        "taxable": taxable,
+        "cumulative_taxable": cumulative,
+        "ndfl": ndfl,
+        "special_deduction": special,
+        "net_salary": net_after_ndfl - special,
+    }
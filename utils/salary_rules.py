@@ -0,0 +1,181 @@
+"""Compiled salary rules: tariff grid lookup tables and special deduction callables."""
+
+from collections.abc import Callable, Iterable
+from decimal import Decimal
+from fractions import Fraction
+from typing import Any
+
+from utils.money import from_kopecks, mul_ratio, to_kopecks
+
+# Предел удержания по виду (ст. 99 229-ФЗ), если в данных нет max_percent:
+# исполнительное производство — до 50%, алименты — до 70%
+DEDUCTION_TYPES: dict[str, Fraction | None] = {}
+
+# Номер редакции правил удержаний: растёт при каждом изменении DEDUCTION_TYPES
+# (входит в ключи запомненных результатов расчёта, см. application.salary_memo)
+RULES_GENERATION = 0
+
+
+def register_deduction_type(name: str, max_percent: Any = None) -> None:
+    """Добавить (или заменить) вид удержания; скомпилированные правила сбрасываются."""
+    global RULES_GENERATION
+    DEDUCTION_TYPES[name] = None if max_percent is None else Fraction(str(max_percent))
+    _RULES.clear()
+    RULES_GENERATION += 1
+
+
+class DeductionRule:
+    """
+    Скомпилированное удержание: эффективный процент с учётом предела и
+    готовые функции расчёта от суммы после НДФЛ — для float и для копеек.
+    """
+
+    __slots__ = ("type", "percent", "apply", "apply_kopecks")
+
+    def __init__(self, kind: str | None, percent: Fraction) -> None:
+        self.type = kind
+        self.percent = percent
+        self.apply: Callable[[float], float]
+        self.apply_kopecks: Callable[[int], int]
+        if not percent:
+            self.apply = lambda net: 0.0
+            self.apply_kopecks = lambda net: 0
+            return
+        rate = float(percent) / 100
+        numerator, denominator = percent.numerator, percent.denominator * 100
+        self.apply = lambda net: round(net * rate, 2)
+        self.apply_kopecks = lambda net: mul_ratio(net, numerator, denominator)
+
+
+_NO_DEDUCTION = DeductionRule(None, Fraction(0))
+
+
+# Скомпилированные правила по ключу (type, deduction_percent, max_percent)
+_RULES: dict[tuple[Any, Any, Any], DeductionRule] = {}
+
+
+def _compile_rule(kind: str | None, percent: Any, max_percent: Any) -> DeductionRule:
+    effective = Fraction(str(percent))
+    if max_percent is not None:
+        cap = Fraction(str(max_percent))
+    else:
+        cap = DEDUCTION_TYPES.get(kind)
+    if cap is not None:
+        effective = min(effective, cap)
+    return DeductionRule(kind, max(effective, Fraction(0)))
+
+
+register_deduction_type("executive_proceedings", 50)
+register_deduction_type("alimony", 70)
+
+
+def deduction_rule(special_conditions: dict | None) -> DeductionRule:
+    """
+    Правило для special_conditions: компилируется один раз на набор
+    (type, deduction_percent, max_percent), дальше берётся из таблицы.
+    """
+    if not special_conditions:
+        return _NO_DEDUCTION
+    get = special_conditions.get
+    key = (get("type"), get("deduction_percent", 0), get("max_percent"))
+    rule = _RULES.get(key)
+    if rule is None:
+        rule = _RULES[key] = _compile_rule(*key)
+    return rule
+
+
+class TariffGrid:
+    """
+    Тарифная сетка компании (секция tariff_grid и base_salary_grade_1 из
+    employees.json), скомпилированная в таблицы по разряду.
+
+    Оклад по сетке = оклад 1-го разряда × коэффициент; коэффициент должен
+    лежать в диапазоне своего разряда.
+    """
+
+    __slots__ = ("base_salary", "_base_kopecks", "_bounds")
+
+    def __init__(self, grid: Iterable[dict[str, Any]], base_salary_grade_1: Any) -> None:
+        self.base_salary = Decimal(str(base_salary_grade_1))
+        self._base_kopecks = to_kopecks(self.base_salary)
+        self._bounds: dict[int, tuple[Fraction, Fraction]] = {
+            int(row["grade"]): (
+                Fraction(str(row["min_coefficient"])),
+                Fraction(str(row["max_coefficient"])),
+            )
+            for row in grid
+        }
+
+    @classmethod
+    def from_company(cls, data: dict[str, Any]) -> "TariffGrid":
+        """Сетка из словаря справочника (ключи tariff_grid и company)."""
+        base_salary = data.get("company", {}).get("base_salary_grade_1", 0)
+        return cls(data.get("tariff_grid", []), base_salary)
+
+    @property
+    def grades(self) -> list[int]:
+        return sorted(self._bounds)
+
+    def bounds(self, grade: int) -> tuple[Fraction, Fraction] | None:
+        """(min, max) коэффициента разряда или None для неизвестного разряда."""
+        return self._bounds.get(grade)
+
+    def salary_kopecks(self, coefficient: Any) -> int:
+        """Оклад по сетке в копейках (половина вверх)."""
+        c = Fraction(str(coefficient))
+        return mul_ratio(self._base_kopecks, c.numerator, c.denominator)
+
+    def salary(self, coefficient: Any) -> Decimal:
+        """Оклад по сетке: оклад 1-го разряда × коэффициент."""
+        return from_kopecks(self.salary_kopecks(coefficient))
+
+    def validate(self, employees: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Проверить весь штат за один проход по скомпилированным таблицам.
+
+        Returns:
+            Нарушения: dict с employee_id, code ("unknown_grade",
+            "coefficient_out_of_range", "salary_mismatch") и подробностями.
+        """
+        bounds = self._bounds
+        base = self._base_kopecks
+        coefficients: dict[Any, Fraction] = {}  # разбор коэффициента — один раз на значение
+        expected_cache: dict[Fraction, int] = {}
+        issues: list[dict[str, Any]] = []
+        for emp in employees:
+            emp_id = emp.get("id")
+            grade = emp.get("tariff_grade")
+            coefficient = emp.get("coefficient")
+            limits = bounds.get(grade)
+            if limits is None:
+                issues.append({"employee_id": emp_id, "code": "unknown_grade", "grade": grade})
+                continue
+            if coefficient is None:
+                continue
+            c = coefficients.get(coefficient)
+            if c is None:
+                c = coefficients[coefficient] = Fraction(str(coefficient))
+            if not limits[0] <= c <= limits[1]:
+                issues.append(
+                    {
+                        "employee_id": emp_id,
+                        "code": "coefficient_out_of_range",
+                        "grade": grade,
+                        "coefficient": coefficient,
+                        "allowed": (float(limits[0]), float(limits[1])),
+                    }
+                )
+            expected = expected_cache.get(c)
+            if expected is None:
+                expected = expected_cache[c] = mul_ratio(base, c.numerator, c.denominator)
+            actual = emp.get("base_salary")
+            if actual is not None and to_kopecks(actual) != expected:
+                issues.append(
+                    {
+                        "employee_id": emp_id,
+                        "code": "salary_mismatch",
+                        "base_salary": actual,
+                        "expected": from_kopecks(expected),
+                    }
+                )
+        return issues
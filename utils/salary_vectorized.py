@@ -0,0 +1,84 @@
+"""Columnar (NumPy) salary kernel, optional: requires numpy."""
+
+from typing import Any, Iterable
+
+from utils.salary_calculator import NDFL_RATE
+from utils.salary_rules import deduction_rule
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Начиная с 2**52 у float64 нет дробной части — такие значения округляет round()
+_EXACT_LIMIT = 2.0**52
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("NumPy не установлен. pip install numpy")
+
+
+def round2(values: "np.ndarray") -> "np.ndarray":
+    """
+    Element-wise round(x, 2) with exactly the same result as builtin round().
+
+    rint(x * 100) / 100 agrees with round() unless x * 100 lies within float
+    error of a .5 tie; those few elements are rounded by builtin round().
+    """
+    scaled = values * 100.0
+    result = np.rint(scaled) / 100.0
+    frac = np.abs(scaled - np.trunc(scaled))
+    ambiguous = (np.abs(frac - 0.5) <= 4 * np.spacing(scaled)) | (np.abs(scaled) >= _EXACT_LIMIT)
+    for i in np.flatnonzero(ambiguous):
+        result[i] = round(float(values[i]), 2)
+    return result
+
+
+def employee_columns(employees: Iterable[dict[str, Any]]) -> dict[str, "np.ndarray"]:
+    """Build base_salary, tax_deduction and deduction_percent arrays from employee dicts."""
+    _require_numpy()
+    base_salary = []
+    tax_deduction = []
+    deduction_percent = []
+    for emp in employees:
+        base_salary.append(emp.get("base_salary", 0))
+        tax_deduction.append(emp.get("tax_deduction", 0))
+        deduction_percent.append(float(deduction_rule(emp.get("special_conditions")).percent))
+    return {
+        "base_salary": np.asarray(base_salary, dtype=np.float64),
+        "tax_deduction": np.asarray(tax_deduction, dtype=np.float64),
+        "deduction_percent": np.asarray(deduction_percent, dtype=np.float64),
+    }
+
+
+def calculate_salary_columns(
+    base_salary: Any, tax_deduction: Any, deduction_percent: Any
+) -> dict[str, "np.ndarray"]:
+    """
+    Vectorized counterpart of calculate_employee_salary().
+
+    Args:
+        base_salary: array of gross salaries.
+        tax_deduction: array of NDFL tax deductions.
+        deduction_percent: array of special deduction percents (0 if none).
+
+    Returns:
+        Dict of float64 arrays: ndfl, special_deduction, net_salary.
+    """
+    _require_numpy()
+    gross = np.asarray(base_salary, dtype=np.float64)
+    deduction = np.asarray(tax_deduction, dtype=np.float64)
+    percent = np.asarray(deduction_percent, dtype=np.float64)
+
+    # Тот же порядок операций, что и в utils.salary_calculator
+    taxable = np.maximum(0.0, gross - deduction)
+    ndfl = round2(taxable * NDFL_RATE)
+    net_after_ndfl = gross - ndfl
+    special_deduction = round2(net_after_ndfl * (percent / 100))
+    net = round2(net_after_ndfl - special_deduction)
+
+    return {"ndfl": ndfl, "special_deduction": special_deduction, "net_salary": net}